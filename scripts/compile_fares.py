@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+기본 요금표(DefaultFares.json) 컴파일 스크립트
+원본 요금표(Data/DataSources/Static/DefaultFares.json)를 검증한 뒤, 앱 번들에 넣을
+정규화·최소화된 요금표와 크기/파싱 시간 리포트를 생성합니다.
+
+검증 항목:
+- 여러 경로를 넘긴 경우 모든 사본의 내용 일치
+- 스키마: 필수 필드 존재 및 타입 (RegionFareRepository.DefaultFareData 기준)
+- defaultRegions 의 모든 코드가 regions 에 존재
+- 모든 시간대의 기본거리/거리단위/시간단위 > 0
+- 심야1·심야2 요금 ≥ 주간 요금 (기본요금, 거리요금, 시간요금)
+
+HoguMeter 타깃의 "Compile DefaultFares.json" Run Script 단계가 이 스크립트로
+번들의 DefaultFares.json 을 만듭니다. 검증에 실패하면 종료 코드 1로 끝나 빌드가 중단됩니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+import profiling
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 요금표 원본 (번들에는 이 파일을 컴파일한 결과가 들어갑니다)
+SOURCE_PATHS = [
+    os.path.join(PROJECT_ROOT, "HoguMeter/Data/DataSources/Static/DefaultFares.json"),
+]
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "build/DefaultFares.json")
+
+# 최상위 필드 (출력 순서)
+TOP_LEVEL_FIELDS = [
+    ("version", str),
+    ("lastUpdated", str),
+    ("defaultRegions", list),
+    ("regions", list),
+]
+
+TIME_ZONES = ["day", "night1", "night2"]
+FARE_COMPONENTS = ["BaseFare", "BaseDistance", "DistanceFare", "DistanceUnit", "TimeFare", "TimeUnit"]
+
+# 지역 필드 (출력 순서 = RegionFare 구조체 선언 순서)
+REGION_FIELDS = [
+    ("code", str),
+    ("name", str),
+    ("isDefault", bool),
+    ("isUserCreated", bool),
+] + [(f"{zone}{component}", int) for zone in TIME_ZONES for component in FARE_COMPONENTS]
+
+# 0보다 커야 하는 요소 (0이면 요금 계산 시 나눗셈 오류 또는 무한 과금)
+POSITIVE_COMPONENTS = ["BaseDistance", "DistanceUnit", "TimeUnit"]
+
+# 심야 요금이 주간 요금 이상이어야 하는 요소
+SURCHARGED_COMPONENTS = ["BaseFare", "DistanceFare", "TimeFare"]
+
+
+def load_json(path):
+    """
+    JSON 파일을 원본 바이트와 함께 로드
+
+    Returns:
+        (raw_bytes, data)
+    """
+    with profiling.phase("read", path=os.path.basename(path)), open(path, 'rb') as f:
+        raw = f.read()
+        profiling.count_read(len(raw))
+    with profiling.phase("parse"):
+        return raw, json.loads(raw.decode('utf-8'))
+
+
+def _check_type(value, expected):
+    # bool 은 int 의 하위 타입이므로 별도 처리
+    if expected is int:
+        return isinstance(value, int) and not isinstance(value, bool)
+    return isinstance(value, expected)
+
+
+def validate_fares(data):
+    """
+    요금표 스키마 및 불변 조건 검증
+
+    Args:
+        data: 파싱된 DefaultFares.json 내용
+
+    Returns:
+        오류 메시지 리스트 (비어 있으면 통과)
+    """
+    errors = []
+
+    if not isinstance(data, dict):
+        return ["최상위 값이 객체가 아닙니다"]
+
+    for field, expected in TOP_LEVEL_FIELDS:
+        if field not in data:
+            errors.append(f"최상위 필드 누락: {field}")
+        elif not _check_type(data[field], expected):
+            errors.append(f"최상위 필드 타입 오류: {field} ({expected.__name__} 필요)")
+    if errors:
+        return errors
+
+    codes = []
+    for index, region in enumerate(data["regions"]):
+        label = region.get("code", f"#{index}") if isinstance(region, dict) else f"#{index}"
+        if not isinstance(region, dict):
+            errors.append(f"[{label}] 지역 항목이 객체가 아닙니다")
+            continue
+
+        missing = False
+        for field, expected in REGION_FIELDS:
+            if field not in region:
+                errors.append(f"[{label}] 필드 누락: {field}")
+                missing = True
+            elif not _check_type(region[field], expected):
+                errors.append(f"[{label}] 타입 오류: {field} ({expected.__name__} 필요)")
+                missing = True
+        unknown = set(region) - {field for field, _ in REGION_FIELDS}
+        for field in sorted(unknown):
+            errors.append(f"[{label}] 알 수 없는 필드: {field}")
+        if missing:
+            continue
+
+        codes.append(region["code"])
+
+        for zone in TIME_ZONES:
+            for component in POSITIVE_COMPONENTS:
+                key = f"{zone}{component}"
+                if region[key] <= 0:
+                    errors.append(f"[{label}] {key} 는 0보다 커야 합니다 (현재 {region[key]})")
+
+        for zone in TIME_ZONES[1:]:
+            for component in SURCHARGED_COMPONENTS:
+                day_value = region[f"day{component}"]
+                night_value = region[f"{zone}{component}"]
+                if night_value < day_value:
+                    errors.append(
+                        f"[{label}] {zone}{component}({night_value}) 가 "
+                        f"day{component}({day_value}) 보다 작습니다"
+                    )
+
+    duplicates = sorted({code for code in codes if codes.count(code) > 1})
+    for code in duplicates:
+        errors.append(f"중복된 지역 코드: {code}")
+
+    for code in data["defaultRegions"]:
+        if code not in codes:
+            errors.append(f"defaultRegions 의 '{code}' 가 regions 에 없습니다")
+
+    return errors
+
+
+def canonicalize(data):
+    """
+    필드 순서를 고정한 정규화 사본 생성 (출력 바이트가 입력 포맷과 무관하도록)
+    """
+    canonical = {field: data[field] for field, _ in TOP_LEVEL_FIELDS if field != "regions"}
+    canonical["regions"] = [
+        {field: region[field] for field, _ in REGION_FIELDS}
+        for region in data["regions"]
+    ]
+    return canonical
+
+
+def encode_minified(data):
+    """
+    공백 없는 UTF-8 JSON 으로 인코딩 (한글은 이스케이프하지 않음)
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def measure_parse_time(raw, number=200, repeat=7):
+    """
+    JSON 파싱 시간 측정 (마이크로초)
+
+    number 회 파싱을 repeat 번 반복해 가장 빠른 회차의 1회 평균을 씁니다.
+    한 번의 평균은 다른 프로세스나 GC 에 따라 크게 흔들려 두 파일의 차이보다 커집니다.
+    """
+    text = raw.decode('utf-8')
+    timings = timeit.repeat(lambda: json.loads(text), number=number, repeat=repeat)
+    return min(timings) / number * 1_000_000
+
+
+def print_report(sources, artifact):
+    """
+    원본 대비 컴파일 결과 크기/파싱 시간 리포트 출력
+
+    번들에 들어가는 것은 첫 번째 원본을 대신하는 컴파일 결과 하나뿐이므로
+    절감량도 그 원본 하나와 비교합니다.
+    """
+    print("\n📊 크기 / 파싱 시간 리포트")
+    print("-" * 60)
+    print(f"{'파일':<36}{'바이트':>10}{'파싱(µs)':>12}")
+    parse_times = []
+    for path, raw in sources:
+        label = os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path))
+        parse_times.append(measure_parse_time(raw))
+        print(f"{label:<36}{len(raw):>10}{parse_times[-1]:>12.1f}")
+    artifact_time = measure_parse_time(artifact)
+    print(f"{'(compiled)':<36}{len(artifact):>10}{artifact_time:>12.1f}")
+    print("-" * 60)
+
+    original = len(sources[0][1])
+    print(f"번들 크기 {original} → {len(artifact)} 바이트 "
+          f"({original - len(artifact)} 바이트, {100 * (1 - len(artifact) / original):.1f}% 축소)")
+    # 공백 제거로 파싱 시간은 거의 달라지지 않으며 측정 오차 안에서 오르내립니다.
+    # Python json 기준이므로 앱의 JSONDecoder 수치와도 다를 수 있습니다.
+    print(f"파싱 시간 {parse_times[0]:.1f} → {artifact_time:.1f}µs "
+          f"({100 * (artifact_time / parse_times[0] - 1):+.1f}%, Python json 기준)")
+
+
+def compile_fares(source_paths, output_path=None, report=True):
+    """
+    요금표 사본들을 검증하고 정규화된 최소 요금표를 생성
+
+    Args:
+        source_paths: DefaultFares.json 경로 목록 (첫 번째가 원본, 나머지는 일치해야 하는 사본)
+        output_path: 출력 파일 경로 (None 이면 검증만 수행)
+        report: 크기/파싱 시간 리포트 출력 여부
+
+    Returns:
+        성공 여부
+    """
+    sources = []
+    parsed = []
+    for path in source_paths:
+        try:
+            raw, data = load_json(path)
+        except FileNotFoundError:
+            print(f"❌ 오류: 파일을 찾을 수 없습니다: {path}")
+            return False
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            print(f"❌ 오류: JSON 파싱 실패: {path}: {e}")
+            return False
+        sources.append((path, raw))
+        parsed.append(data)
+        print(f"✅ 로드: {os.path.relpath(path, PROJECT_ROOT)} ({len(raw)} bytes)")
+
+    # 사본 일치 여부 확인
+    reference_path, reference_raw = sources[0]
+    for (path, raw), data in zip(sources[1:], parsed[1:]):
+        if data != parsed[0]:
+            print(f"❌ 오류: 요금표 사본 내용이 다릅니다:")
+            print(f"   {os.path.relpath(reference_path, PROJECT_ROOT)}")
+            print(f"   {os.path.relpath(path, PROJECT_ROOT)}")
+            return False
+        if raw != reference_raw:
+            print(f"⚠️  경고: 내용은 같지만 포맷이 다릅니다: {os.path.relpath(path, PROJECT_ROOT)}")
+
+    with profiling.phase("validate"):
+        errors = validate_fares(parsed[0])
+    if errors:
+        print(f"❌ 검증 실패 ({len(errors)}건):")
+        for error in errors:
+            print(f"   - {error}")
+        return False
+    print(f"✅ 검증 통과: 지역 {len(parsed[0]['regions'])}개, 기본 지역 {len(parsed[0]['defaultRegions'])}개")
+
+    with profiling.phase("encode"):
+        artifact = encode_minified(canonicalize(parsed[0]))
+
+    if output_path:
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        with profiling.phase("write"), open(output_path, 'wb') as f:
+            f.write(artifact)
+            profiling.count_written(len(artifact))
+        print(f"✅ 저장 완료: {output_path}")
+
+    if report:
+        with profiling.phase("report"):
+            print_report(sources, artifact)
+
+    return True
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="DefaultFares.json 검증 및 최소화 컴파일")
+    parser.add_argument("sources", nargs="*", default=SOURCE_PATHS,
+                        help="DefaultFares.json 경로, 여러 개면 내용 일치도 확인 (기본: Static 원본)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT,
+                        help=f"출력 경로 (기본: {os.path.relpath(DEFAULT_OUTPUT, PROJECT_ROOT)})")
+    parser.add_argument("--check", action="store_true", help="검증만 수행하고 파일은 쓰지 않음")
+    parser.add_argument("--no-report", action="store_true", help="크기/파싱 시간 리포트 생략")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("💰 기본 요금표 컴파일")
+    print("=" * 60)
+
+    with profiling.session(args.profile, "compile-fares", args.profile_memory):
+        ok = compile_fares(
+            args.sources,
+            output_path=None if args.check else args.output,
+            report=not args.no_report,
+        )
+
+    print("=" * 60)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
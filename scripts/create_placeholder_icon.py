@@ -8,6 +8,8 @@ from PIL import Image, ImageDraw, ImageFont
 import os
 import sys
 
+import profiling
+
 def create_gradient_background(size=1024):
     """
     오렌지-레드 그라데이션 배경 생성
@@ -74,15 +76,19 @@ def create_simple_icon(output_path, text="🐴"):
     print(f"   이모지/텍스트: {text}")
 
     # 그라데이션 배경 생성
-    img = create_gradient_background(1024)
+    with profiling.phase("gradient"):
+        img = create_gradient_background(1024)
     print(f"   ✅ 그라데이션 배경 생성 (1024x1024)")
 
     # 텍스트 추가
-    img = add_text_to_icon(img, text, font_size=500)
+    with profiling.phase("text"):
+        img = add_text_to_icon(img, text, font_size=500)
     print(f"   ✅ 텍스트 추가")
 
     # 저장
-    img.save(output_path, 'PNG')
+    with profiling.phase("encode"):
+        img.save(output_path, 'PNG')
+        profiling.count_written(os.path.getsize(output_path))
     print(f"   ✅ 저장 완료: {output_path}")
 
     return output_path
@@ -120,7 +126,9 @@ def create_icon_with_circle(output_path, emoji="🐴"):
     except Exception as e:
         print(f"   ⚠️  이모지 추가 실패: {e}")
 
-    img.save(output_path, 'PNG')
+    with profiling.phase("encode"):
+        img.save(output_path, 'PNG')
+        profiling.count_written(os.path.getsize(output_path))
     print(f"   ✅ 저장 완료: {output_path}")
 
     return output_path
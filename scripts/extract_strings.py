@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Swift 문자열 리터럴 추출 스크립트
+HoguMeter/ 아래 Swift 소스를 토큰화해 문자열 리터럴(여러 줄, 보간, raw 문자열 포함)을
+위치와 함께 수집하고, String Catalog(.xcstrings) 또는 .strings 파일과의 차이를 보여줍니다.
+
+- 기본으로 한글이 들어간 리터럴만 대상 (--all 이면 글자가 있는 모든 리터럴)
+- 보간 \\(...) 은 %@ 자리표시자로 바꿔 키를 만듭니다 (타입 정보가 없으므로 항상 %@)
+- Text("...") 처럼 SWIFT_EMIT_LOC_STRINGS 가 자동 추출하는 위치는 "auto",
+  상수 등 하드코딩된 리터럴은 "hardcoded" 로 구분합니다
+- 파일별 추출 결과를 SHA-256 해시로 캐시하므로, 다시 실행하면 바뀐 파일만
+  프로세스 풀에서 다시 토큰화합니다
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_ROOT = os.path.join(PROJECT_ROOT, "HoguMeter")
+DEFAULT_CATALOG = os.path.join(PROJECT_ROOT, "build/Localizable.xcstrings")
+DEFAULT_CACHE = os.path.join(PROJECT_ROOT, "build/extract_strings_cache.json")
+SOURCE_LANGUAGE = "ko"  # project.yml options.developmentLanguage
+
+# 추출 규칙이 바뀌면 올려서 캐시를 무효화
+CACHE_VERSION = 1
+
+HANGUL = re.compile(r"[\uac00-\ud7a3\u3131-\u318e]")
+LETTER = re.compile(r"[^\W\d_]")
+
+# SwiftUI 가 LocalizedStringKey 로 받는 첫 번째 인자 (자동 추출 대상)
+AUTO_CONTEXT = re.compile(
+    r"(?:\b(?:Text|Button|Label|Toggle|Section|Picker|Link|Menu|Stepper|TextField|SecureField|"
+    r"LocalizedStringKey|LocalizedStringResource|NSLocalizedString)\s*\(\s*"
+    r"|\.(?:navigationTitle|alert|confirmationDialog|help|accessibilityLabel|accessibilityHint)\s*\(\s*"
+    r"|\blocalized:\s*)$"
+)
+
+ESCAPES = {"0": "\0", "\\": "\\", "t": "\t", "n": "\n", "r": "\r", '"': '"', "'": "'"}
+
+
+# MARK: - 토큰화
+
+class SwiftStringScanner:
+    """
+    Swift 소스에서 주석을 건너뛰며 문자열 리터럴을 수집하는 스캐너
+
+    보간 안의 코드도 같은 규칙으로 스캔하므로 "\\(String(format: "%.1f", x))" 처럼
+    보간 안에 들어 있는 리터럴도 별도로 수집됩니다.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.line_starts = [0] + [m.end() for m in re.finditer("\n", source)]
+        self.literals = []
+
+    def location(self, offset):
+        line = bisect.bisect_right(self.line_starts, offset) - 1
+        return line + 1, offset - self.line_starts[line] + 1
+
+    def scan(self):
+        self._scan_code(0, nested=False)
+        self.literals.sort(key=lambda literal: literal["offset"])
+        return self.literals
+
+    def _scan_code(self, i, nested):
+        """
+        코드 영역 스캔. nested 이면 보간을 닫는 ')' 다음 위치를 반환
+        """
+        source = self.source
+        n = len(source)
+        depth = 0
+        while i < n:
+            c = source[i]
+            if c == "/" and source.startswith("//", i):
+                newline = source.find("\n", i)
+                i = n if newline < 0 else newline + 1
+            elif c == "/" and source.startswith("/*", i):
+                i = self._skip_block_comment(i)
+            elif c == '"' or (c == "#" and self._raw_string_start(i)):
+                i = self._scan_string(i)
+            elif c == "(":
+                depth += 1
+                i += 1
+            elif c == ")":
+                if nested and depth == 0:
+                    return i + 1
+                depth -= 1
+                i += 1
+            else:
+                i += 1
+        return n
+
+    def _skip_block_comment(self, i):
+        # Swift 블록 주석은 중첩 가능
+        source = self.source
+        depth = 0
+        while i < len(source):
+            if source.startswith("/*", i):
+                depth += 1
+                i += 2
+            elif source.startswith("*/", i):
+                depth -= 1
+                i += 2
+                if depth == 0:
+                    return i
+            else:
+                i += 1
+        return i
+
+    def _raw_string_start(self, i):
+        j = i
+        while j < len(self.source) and self.source[j] == "#":
+            j += 1
+        return j < len(self.source) and self.source[j] == '"'
+
+    def _scan_string(self, start):
+        """
+        start 위치의 문자열 리터럴 하나를 읽어 기록하고 끝 다음 위치를 반환
+        """
+        source = self.source
+        n = len(source)
+        i = start
+        while source[i] == "#":
+            i += 1
+        hashes = "#" * (i - start)
+        multiline = source.startswith('"""', i)
+        quote = '"""' if multiline else '"'
+        close = quote + hashes
+        escape = "\\" + hashes
+        i += len(quote)
+
+        parts = []
+        interpolations = 0
+        while i < n:
+            if source.startswith(close, i):
+                i += len(close)
+                break
+            if not multiline and source[i] == "\n":
+                break  # 닫히지 않은 리터럴
+            if source.startswith(escape, i):
+                j = i + len(escape)
+                nxt = source[j] if j < n else ""
+                if nxt == "(":
+                    i = self._scan_code(j + 1, nested=True)
+                    parts.append(("interp", None))
+                    interpolations += 1
+                    continue
+                if nxt == "u" and source.startswith("{", j + 1):
+                    end = source.find("}", j)
+                    try:
+                        parts.append(("text", chr(int(source[j + 2:end], 16))))
+                    except ValueError:
+                        parts.append(("text", source[i:end + 1]))
+                    i = end + 1
+                    continue
+                if multiline and nxt == "\n":
+                    parts.append(("continue", None))  # 줄 이어붙이기 (줄바꿈은 아래에서 추가)
+                    i = j
+                    continue
+                if nxt in ESCAPES:
+                    parts.append(("escaped", ESCAPES[nxt]))
+                    i = j + 1
+                    continue
+            parts.append(("text", source[i]))
+            i += 1
+
+        value = self._multiline_value(parts) if multiline else "".join(
+            "%@" if kind == "interp" else text for kind, text in parts
+        )
+        line, column = self.location(start)
+        prefix = source[max(0, start - 64):start]
+        self.literals.append({
+            "value": value,
+            "offset": start,
+            "line": line,
+            "column": column,
+            "multiline": multiline,
+            "raw": bool(hashes),
+            "interpolations": interpolations,
+            "context": "auto" if AUTO_CONTEXT.search(prefix) else "hardcoded",
+        })
+        return i
+
+    @staticmethod
+    def _multiline_value(parts):
+        """
+        여러 줄 리터럴 값: 첫/마지막 줄바꿈 제거, 닫는 따옴표 들여쓰기만큼 각 줄 앞 공백 제거
+        """
+        text = []
+        for kind, value in parts:
+            if kind == "interp":
+                text.append("\x00")  # 들여쓰기 계산 뒤 %@ 로 치환
+            elif kind == "continue":
+                text.append("\x01")
+            elif kind == "escaped" and value == "\n":
+                text.append("\x02")  # 이스케이프된 줄바꿈은 들여쓰기 제거 대상이 아님
+            else:
+                text.append(value)
+        body = "".join(text)
+        if body.startswith("\n"):
+            body = body[1:]
+        lines = body.split("\n")
+        indent = lines[-1] if lines[-1].strip() == "" else ""
+        lines = lines[:-1] if indent or lines[-1] == "" else lines
+        stripped = [line[len(indent):] if line.startswith(indent) else line.lstrip(" \t") for line in lines]
+        value = "\n".join(stripped)
+        value = value.replace("\x01\n", "").replace("\x01", "")
+        return value.replace("\x00", "%@").replace("\x02", "\n")
+
+
+def extract_file(task):
+    """
+    파일 하나의 리터럴 추출 (워커 프로세스에서 실행)
+
+    Returns:
+        (상대 경로, 해시, 리터럴 리스트)
+    """
+    relpath, digest, source = task
+    literals = SwiftStringScanner(source).scan()
+    for literal in literals:
+        del literal["offset"]
+    return relpath, digest, literals
+
+
+# MARK: - 캐시
+
+def load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_cache(path, files):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f, ensure_ascii=False, separators=(',', ':'))
+        profiling.count_written(f.tell())
+
+
+def find_swift_files(roots):
+    found = []
+    for root in roots:
+        if os.path.isfile(root):
+            found.append(root)
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            found.extend(os.path.join(dirpath, name) for name in sorted(filenames) if name.endswith(".swift"))
+    return found
+
+
+def extract(roots, cache_path=DEFAULT_CACHE, jobs=None, use_cache=True):
+    """
+    Swift 소스 전체의 리터럴 추출 (바뀐 파일만 다시 토큰화)
+
+    Returns:
+        ({상대 경로: 리터럴 리스트}, 다시 추출한 파일 수)
+    """
+    cached = load_cache(cache_path) if use_cache else {}
+    files = {}
+    tasks = []
+    with profiling.phase("hash"):
+        for path in find_swift_files(roots):
+            with open(path, 'rb') as f:
+                raw = f.read()
+            profiling.count_read(len(raw))
+            relpath = os.path.relpath(path, PROJECT_ROOT)
+            digest = hashlib.sha256(raw).hexdigest()
+            entry = cached.get(relpath)
+            if entry and entry["sha256"] == digest:
+                files[relpath] = entry
+            else:
+                tasks.append((relpath, digest, raw.decode('utf-8', errors='replace')))
+
+    with profiling.phase("tokenize", files=len(tasks)):
+        if len(tasks) > 1 and jobs != 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(extract_file, tasks, chunksize=max(1, len(tasks) // 32)))
+        else:
+            results = [extract_file(task) for task in tasks]
+    for relpath, digest, literals in results:
+        files[relpath] = {"sha256": digest, "strings": literals}
+
+    if use_cache:
+        with profiling.phase("cache"):
+            # 일부 경로만 스캔해도 다른 파일의 캐시는 유지 (디스크에서 사라진 파일만 정리)
+            merged = {relpath: entry for relpath, entry in cached.items()
+                      if relpath not in files and os.path.isfile(os.path.join(PROJECT_ROOT, relpath))}
+            merged.update(files)
+            save_cache(cache_path, dict(sorted(merged.items())))
+    return {relpath: entry["strings"] for relpath, entry in sorted(files.items())}, len(tasks)
+
+
+def collect_keys(files, include_all=False, include_interpolated=True):
+    """
+    리터럴을 키별로 묶기
+
+    Returns:
+        {키: [{"file", "line", "column", "context"}, ...]} (키 정렬)
+    """
+    pattern = LETTER if include_all else HANGUL
+    keys = {}
+    for relpath, literals in files.items():
+        for literal in literals:
+            value = literal["value"]
+            if not pattern.search(value):
+                continue
+            if not include_interpolated and literal["interpolations"]:
+                continue
+            keys.setdefault(value, []).append({
+                "file": relpath, "line": literal["line"], "column": literal["column"],
+                "context": literal["context"],
+            })
+    return dict(sorted(keys.items()))
+
+
+def format_locations(locations, limit=None):
+    shown = locations if limit is None else locations[:limit]
+    text = ", ".join(f"{loc['file']}:{loc['line']}" for loc in shown)
+    if limit is not None and len(locations) > limit:
+        text += f" 외 {len(locations) - limit}곳"
+    return text
+
+
+# MARK: - String Catalog / .strings
+
+def load_existing_keys(path):
+    """
+    기존 .xcstrings 또는 .strings 파일의 키 목록 (없으면 None)
+
+    Returns:
+        (키 집합, .xcstrings 원본 딕셔너리 또는 None)
+    """
+    if not path or not os.path.exists(path):
+        return None, None
+    with open(path, 'rb') as f:
+        raw = f.read()
+    profiling.count_read(len(raw))
+    if path.endswith(".xcstrings"):
+        catalog = json.loads(raw.decode('utf-8'))
+        keys = {key for key, entry in catalog.get("strings", {}).items() if entry.get("extractionState") != "stale"}
+        return keys, catalog
+    text = raw.decode('utf-16') if raw.startswith((b"\xff\xfe", b"\xfe\xff")) else raw.decode('utf-8')
+    keys = set()
+    for match in re.finditer(r'^\s*"((?:[^"\\]|\\.)*)"\s*=', text, re.MULTILINE):
+        keys.add(unescape_strings_key(match.group(1)))
+    return keys, None
+
+
+def escape_strings_key(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\t", "\\t")
+
+
+def unescape_strings_key(value):
+    return re.sub(r'\\(.)', lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), value)
+
+
+def build_catalog(keys, existing=None):
+    """
+    String Catalog 생성 (기존 카탈로그의 번역은 유지)
+
+    소스에서 사라진 키는 번역이 있으면 stale 로 남기고, 없으면 삭제합니다.
+    """
+    existing_strings = (existing or {}).get("strings", {})
+    strings = {}
+    for key, locations in keys.items():
+        entry = dict(existing_strings.get(key, {}))
+        entry["comment"] = format_locations(locations)
+        entry["extractionState"] = "manual"
+        strings[key] = entry
+    for key, entry in existing_strings.items():
+        if key not in strings and entry.get("localizations"):
+            entry = dict(entry)
+            entry["extractionState"] = "stale"
+            strings[key] = entry
+    return {
+        "sourceLanguage": (existing or {}).get("sourceLanguage", SOURCE_LANGUAGE),
+        "strings": dict(sorted(strings.items())),
+        "version": "1.0",
+    }
+
+
+def encode_catalog(catalog):
+    # Xcode 가 저장하는 형식과 같은 들여쓰기/구분자
+    return json.dumps(catalog, ensure_ascii=False, indent=2, sort_keys=True, separators=(',', ' : ')) + "\n"
+
+
+def encode_strings(keys):
+    """
+    genstrings 형식 .strings (위치는 주석으로)
+    """
+    lines = []
+    for key, locations in keys.items():
+        escaped = escape_strings_key(key)
+        lines.append(f"/* {format_locations(locations)} */")
+        lines.append(f'"{escaped}" = "{escaped}";')
+        lines.append("")
+    return "\n".join(lines)
+
+
+def print_diff(keys, existing_keys, show):
+    added = [key for key in keys if key not in existing_keys]
+    removed = sorted(existing_keys - set(keys))
+    print(f"\n📝 차이: 추가 {len(added)}개, 삭제 {len(removed)}개")
+    for key in added[:show]:
+        print(f"  + {json.dumps(key, ensure_ascii=False)}")
+        print(f"      {format_locations(keys[key], limit=3)}")
+    if len(added) > show:
+        print(f"  ... 추가 {len(added) - show}개 더")
+    for key in removed[:show]:
+        print(f"  - {json.dumps(key, ensure_ascii=False)}")
+    if len(removed) > show:
+        print(f"  ... 삭제 {len(removed) - show}개 더")
+    return added, removed
+
+
+def run(args):
+    """
+    파싱된 인자로 추출 실행 (종료 코드 반환)
+    """
+    roots = args.sources or [SOURCE_ROOT]
+    missing = [root for root in roots if not os.path.exists(root)]
+    if missing:
+        print(f"❌ 오류: 경로를 찾을 수 없습니다: {', '.join(missing)}")
+        return 1
+
+    output = args.output or (DEFAULT_CATALOG if args.format == "xcstrings" else
+                             os.path.join(PROJECT_ROOT, "build/Localizable.strings"))
+    against = args.against or output
+
+    print("=" * 60)
+    print("🌐 Swift 문자열 추출")
+    print("=" * 60)
+
+    files, changed = extract(roots, args.cache, args.jobs, use_cache=not args.no_cache)
+    keys = collect_keys(files, include_all=args.all, include_interpolated=not args.no_interpolated)
+    literal_count = sum(len(locations) for locations in keys.values())
+    auto = sum(1 for locations in keys.values() if any(loc["context"] == "auto" for loc in locations))
+    print(f"✅ Swift 파일 {len(files)}개 (다시 추출 {changed}개, 캐시 {len(files) - changed}개)")
+    print(f"✅ 리터럴 {literal_count}개 → 키 {len(keys)}개 "
+          f"(자동 추출 위치 {auto}개, 하드코딩 {len(keys) - auto}개)")
+
+    if args.hardcoded:
+        print("\n🔒 하드코딩된 문자열 (자동 추출되지 않음)")
+        for key, locations in keys.items():
+            if all(loc["context"] == "hardcoded" for loc in locations):
+                print(f"  {json.dumps(key, ensure_ascii=False)}  ({format_locations(locations, limit=2)})")
+
+    with profiling.phase("diff"):
+        existing_keys, existing_catalog = load_existing_keys(against)
+    if existing_keys is None:
+        print(f"\nℹ️  비교할 기존 파일 없음: {os.path.relpath(against, PROJECT_ROOT)}")
+        added, removed = list(keys), []
+    else:
+        added, removed = print_diff(keys, existing_keys, args.show)
+
+    if args.check:
+        print("=" * 60)
+        return 1 if added or removed else 0
+
+    with profiling.phase("write"):
+        if args.format == "xcstrings":
+            data = encode_catalog(build_catalog(keys, existing_catalog if against == output else None))
+        else:
+            data = encode_strings(keys)
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        encoded = data.encode('utf-8')
+        with open(output, 'wb') as f:
+            f.write(encoded)
+        profiling.count_written(len(encoded))
+    print(f"\n✅ 저장 완료: {os.path.relpath(output, PROJECT_ROOT)}")
+    print("=" * 60)
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="Swift 문자열 리터럴 추출 및 String Catalog 비교")
+    parser.add_argument("sources", nargs="*", help="Swift 파일 또는 디렉토리 (기본: HoguMeter/)")
+    parser.add_argument("-o", "--output", help="출력 경로 (기본: build/Localizable.xcstrings 또는 .strings)")
+    parser.add_argument("--format", choices=["xcstrings", "strings"], default="xcstrings", help="출력 형식")
+    parser.add_argument("--against", help="비교할 기존 .xcstrings / .strings (기본: 출력 경로)")
+    parser.add_argument("--check", action="store_true", help="파일을 쓰지 않고, 차이가 있으면 종료 코드 1")
+    parser.add_argument("--all", action="store_true", help="한글이 없는 리터럴도 포함")
+    parser.add_argument("--no-interpolated", action="store_true", help="보간이 있는 리터럴 제외")
+    parser.add_argument("--hardcoded", action="store_true", help="자동 추출되지 않는 하드코딩 문자열 목록 출력")
+    parser.add_argument("--show", type=int, default=20, help="차이를 몇 개까지 출력할지")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="파일별 추출 결과 캐시 경로")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 읽거나 쓰지 않음")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "extract-strings", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
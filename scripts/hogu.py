@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+호구미터 프로젝트 통합 CLI
+흩어져 있는 프로젝트 도구를 하나의 진입점 아래 하위 명령으로 묶습니다.
+
+    project  project.pbxproj 편집/병합/비교/정리 (파일/그룹 추가 스크립트, 의미 병합·비교, 포맷터)
+    tasks    태스크 문서 일괄 수정
+    icons    앱 아이콘 생성/리사이징 (Pillow)
+    assets   번들 리소스 컴파일
+    data     경로/주행 기록 분석 도구 (NumPy)
+    previews 영수증 템플릿/경로 썸네일 미리보기 렌더링 (Pillow, NumPy)
+    batch    여러 하위 명령을 한 프로세스에서 순서대로 실행
+
+PIL, NumPy 등 무거운 모듈은 해당 하위 명령을 실행할 때만 import 하므로
+--help 나 가벼운 명령은 빠르게 끝나고, batch 모드에서는 한 번 import 한
+모듈을 다음 명령이 그대로 재사용합니다.
+
+--profile 을 주면 모든 하위 명령(batch 포함)의 단계별 시간/바이트/메모리를
+한 번에 기록합니다 (profiling.py 참고).
+"""
+
+import argparse
+import importlib
+import os
+import shlex
+import sys
+import time
+
+import profiling
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+PROJECT_PATH = os.path.join(PROJECT_ROOT, "HoguMeter.xcodeproj/project.pbxproj")
+ICON_SOURCE = os.path.join(PROJECT_ROOT, "app_icon_source.png")
+APP_ICON_DIR = os.path.join(PROJECT_ROOT, "HoguMeter/Resources/Assets.xcassets/AppIcon.appiconset")
+
+# project 하위 명령 → 프로젝트 루트의 pbxproj 편집 스크립트
+PROJECT_COMMANDS = {
+    "add-disclaimer": ("add_disclaimer_files", "면책 조항 관련 파일/그룹 추가"),
+    "add-task3": ("add_task3_files", "지역 요금 설정(Task 3) 파일/그룹 추가"),
+    "fix-groups": ("fix_groups", "UseCases / RegionFare 그룹 구조 수정"),
+    "fix-components": ("fix_components_groups", "RegionFare 전용 Components 그룹 분리"),
+}
+
+# 인자를 그대로 넘기는 하위 명령 → scripts/ 의 도구 (main(argv) 사용)
+PASSTHROUGH_COMMANDS = {
+    "project": {
+        "merge": ("pbxproj_merge", "project.pbxproj 의미 단위 3-way 병합 (git merge 드라이버)"),
+        "diff": ("pbxproj_diff", "project.pbxproj 의미 단위 비교 (파일 또는 git 리비전)"),
+        "format": ("pbxproj_format", "project.pbxproj 정규 순서로 정리"),
+    },
+    "assets": {
+        "compile-fares": ("compile_fares", "DefaultFares.json 검증 및 최소화 컴파일"),
+        "extract-strings": ("extract_strings", "Swift 문자열 리터럴 추출 및 String Catalog 비교"),
+        "validate": ("validate_assets", "Asset Catalog 사전 검증 (Contents.json ↔ 파일, PNG 헤더 크기/알파)"),
+    },
+    "data": {
+        "sampling": ("route_sampling_lab", "경로 샘플링 파라미터 스윕"),
+        "codecs": ("route_codec_bench", "경로 저장 코덱 벤치마크"),
+        "idle": ("idle_replay", "무이동 감지 리플레이"),
+        "history": ("trip_history_gen", "합성 주행 기록 데이터셋 생성"),
+    },
+    "previews": {
+        "receipts": ("receipt_preview", "영수증 템플릿 미리보기 시트 일괄 렌더링"),
+        "routes": ("route_thumbnails", "경로 썸네일 일괄 렌더링 (지도 타일 없이)"),
+    },
+}
+
+
+def load(module_name):
+    """
+    도구 모듈을 필요할 때 import (이미 import 된 모듈은 재사용)
+
+    scripts/ 와 프로젝트 루트의 스크립트를 모두 찾을 수 있도록 경로를 추가합니다.
+    """
+    for path in (PROJECT_ROOT, SCRIPTS_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    return importlib.import_module(module_name)
+
+
+# MARK: - 하위 명령 핸들러
+
+def run_project(args):
+    if not os.path.exists(args.project):
+        print(f"❌ 오류: 프로젝트 파일을 찾을 수 없습니다: {args.project}")
+        return 1
+    module_name = PROJECT_COMMANDS[args.action][0]
+    code = load(module_name).main(args.project) or 0
+    if code != 0:
+        return code
+    if args.format:
+        # 스크립트가 섹션/children 끝에 붙인 항목을 정규 순서로 정리
+        return load("pbxproj_format").main([args.project, "--quiet"])
+    return 0
+
+
+def run_tasks_update_guide(args):
+    module = load("update_task_files")
+    module.main([os.path.join(args.root, pattern) for pattern in module.TASK_PATTERNS])
+    return 0
+
+
+def run_icons_placeholder(args):
+    module = load("create_placeholder_icon")
+    if args.style == "circle":
+        module.create_icon_with_circle(args.output, args.emoji)
+    else:
+        module.create_simple_icon(args.output, args.emoji)
+    return 0
+
+
+def run_icons_resize(args):
+    module = load("resize_app_icon")
+    module.resize_icon(args.source, args.output)
+    module.update_contents_json(args.output)
+    return 0
+
+
+def run_passthrough(args):
+    return load(args.module).main(args.tool_args) or 0
+
+
+def run_batch(args):
+    commands = list(args.commands)
+    if args.file:
+        if args.file == "-":
+            commands += read_batch_lines(sys.stdin)
+        else:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                commands += read_batch_lines(f)
+    if not commands:
+        print("❌ 오류: 실행할 명령이 없습니다")
+        return 1
+
+    results = []
+    batch_start = time.perf_counter()
+    for index, command in enumerate(commands, 1):
+        argv = shlex.split(command)
+        print(f"\n▶ [{index}/{len(commands)}] {command}")
+        if argv and argv[0] == "batch":
+            print("❌ 오류: batch 안에서 batch 를 실행할 수 없습니다")
+            code = 2
+            elapsed = 0.0
+        else:
+            start = time.perf_counter()
+            try:
+                code = main(argv)
+            except Exception as e:
+                # 한 명령의 예외가 batch 전체를 중단시키지 않도록 실패로 기록 (-k 면 계속 진행)
+                print(f"❌ 오류: {type(e).__name__}: {e}")
+                code = 1
+            elapsed = time.perf_counter() - start
+        results.append((command, code, elapsed))
+        if code != 0 and not args.keep_going:
+            break
+
+    print("\n" + "=" * 60)
+    print("📋 batch 결과")
+    print("=" * 60)
+    for command, code, elapsed in results:
+        mark = "✅" if code == 0 else "❌"
+        print(f"{mark} {elapsed:>8.2f}s  {command}")
+    skipped = len(commands) - len(results)
+    if skipped:
+        print(f"⏭️  실행하지 않은 명령: {skipped}개")
+    print(f"총 {time.perf_counter() - batch_start:.2f}s")
+
+    failed = [code for _, code, _ in results if code != 0]
+    return failed[0] if failed else 0
+
+
+def read_batch_lines(stream):
+    """
+    batch 파일에서 명령 목록 읽기 (빈 줄과 # 주석 무시)
+    """
+    commands = []
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            commands.append(line)
+    return commands
+
+
+# MARK: - 인자 파서
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="hogu",
+        description="호구미터 프로젝트 통합 CLI",
+    )
+    profiling.add_profile_argument(parser)
+    groups = parser.add_subparsers(dest="group", metavar="<group>")
+    groups.required = True
+
+    # project
+    project = groups.add_parser("project", help="project.pbxproj 편집/병합/비교/정리")
+    project_actions = project.add_subparsers(dest="action", metavar="<action>")
+    project_actions.required = True
+    group_actions = {"project": project_actions}
+    for action, (_, help_text) in PROJECT_COMMANDS.items():
+        command = project_actions.add_parser(action, help=help_text, description=help_text)
+        command.add_argument("--project", default=PROJECT_PATH, help="project.pbxproj 경로")
+        command.add_argument("--format", action="store_true", help="편집 후 pbxproj_format 으로 정규 순서 정리")
+        command.set_defaults(handler=run_project)
+
+    # tasks
+    tasks = groups.add_parser("tasks", help="태스크 문서 일괄 수정")
+    task_actions = tasks.add_subparsers(dest="action", metavar="<action>")
+    task_actions.required = True
+    update_guide = task_actions.add_parser(
+        "update-guide", help="모든 태스크 문서에 개발 가이드 링크 추가",
+        description="모든 태스크 문서에 개발 가이드 링크 추가",
+    )
+    update_guide.add_argument("--root", default=PROJECT_ROOT, help="tasks/ 가 있는 프로젝트 루트")
+    update_guide.set_defaults(handler=run_tasks_update_guide)
+
+    # icons
+    icons = groups.add_parser("icons", help="앱 아이콘 생성/리사이징 (Pillow 필요)")
+    icon_actions = icons.add_subparsers(dest="action", metavar="<action>")
+    icon_actions.required = True
+    placeholder = icon_actions.add_parser(
+        "placeholder", help="플레이스홀더 아이콘 원본 생성", description="플레이스홀더 아이콘 원본 생성",
+    )
+    placeholder.add_argument("--style", choices=["gradient", "circle"], default="gradient", help="배경 스타일")
+    placeholder.add_argument("--emoji", default="🐴", help="표시할 이모지 또는 텍스트")
+    placeholder.add_argument("-o", "--output", default=ICON_SOURCE, help="출력 PNG 경로")
+    placeholder.set_defaults(handler=run_icons_placeholder)
+    resize = icon_actions.add_parser(
+        "resize", help="1024x1024 원본을 모든 아이콘 크기로 리사이징",
+        description="1024x1024 원본을 모든 아이콘 크기로 리사이징",
+    )
+    resize.add_argument("source", nargs="?", default=ICON_SOURCE, help="원본 PNG 경로")
+    resize.add_argument("output", nargs="?", default=APP_ICON_DIR, help="AppIcon.appiconset 경로")
+    resize.set_defaults(handler=run_icons_resize)
+
+    # project / assets / data / previews: 도구의 인자를 그대로 전달
+    group_help = {
+        "assets": "번들 리소스 컴파일/추출/검증",
+        "data": "경로/주행 기록 분석 도구 (NumPy 필요)",
+        "previews": "영수증/경로 미리보기 렌더링 (Pillow 필요)",
+    }
+    for group_name, commands in PASSTHROUGH_COMMANDS.items():
+        actions = group_actions.get(group_name)
+        if actions is None:
+            group = groups.add_parser(group_name, help=group_help[group_name])
+            actions = group.add_subparsers(dest="action", metavar="<action>")
+            actions.required = True
+        for action, (module_name, help_text) in commands.items():
+            # --help 까지 도구에 넘기도록 자체 도움말은 끔
+            command = actions.add_parser(action, help=f"{help_text} (인자는 도구에 그대로 전달)", add_help=False)
+            command.set_defaults(handler=run_passthrough, module=module_name, passthrough=True)
+
+    # batch
+    batch = groups.add_parser(
+        "batch", help="여러 하위 명령을 한 프로세스에서 순서대로 실행",
+        description="여러 하위 명령을 한 프로세스에서 순서대로 실행합니다. "
+                    "import 한 모듈은 다음 명령에서 재사용됩니다.",
+    )
+    batch.add_argument("commands", nargs="*", help='따옴표로 묶은 명령 (예: "assets compile-fares --check")')
+    batch.add_argument("-f", "--file", help="한 줄에 명령 하나씩 적은 파일 (- 이면 표준 입력)")
+    batch.add_argument("-k", "--keep-going", action="store_true", help="실패한 명령이 있어도 계속 실행")
+    batch.set_defaults(handler=run_batch)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = build_parser()
+    try:
+        args, extra = parser.parse_known_args(argv)
+        if getattr(args, "passthrough", False):
+            args.tool_args = extra
+        elif extra:
+            parser.error(f"알 수 없는 인자: {' '.join(extra)}")
+        label = f"{args.group} {args.action}" if getattr(args, "action", None) else args.group
+        with profiling.session(args.profile, label, args.profile_memory):
+            return args.handler(args)
+    except SystemExit as e:
+        # argparse 오류나 도구 내부의 sys.exit() 를 종료 코드로 변환 (batch 계속 진행용)
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
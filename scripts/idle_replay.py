@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+무이동 감지 리플레이 스크립트 (오프라인)
+기록된 위치 스트림을 IdleDetectionService 와 같은 상태 머신
+(monitoring → idle → alerted) 으로 일괄 재생해, 파라미터 세트마다
+무이동 알림 발생 시점을 비교하고 차이가 나는 세션을 찾아냅니다.
+
+docs/SPEC_IDLE_DETECTION_FIX.md 의 규칙을 그대로 따릅니다:
+- idleThreshold 600초, checkInterval 30초, movementThreshold 50m
+- 정확도 30m 이상(나쁨)인 위치는 이동으로 인정하지 않음
+- 200km/h 를 넘는 이동은 GPS 점프로 보고 무시
+
+시계는 위치 타임스탬프를 사용하며, 체크 타이머는 모니터링 시작부터
+checkInterval 마다 실행됩니다. 알림(alerted) 후에는 --response 정책에 따라
+계속(dismissAlert) 하거나 세션을 종료합니다.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import profiling
+import route_traces
+
+# IdleDetectionConfig 기본값 (Swift 코드와 동일하게 유지)
+DEFAULT_PARAMS = {
+    "idle_threshold": 600.0,
+    "movement_threshold": 50.0,
+    "check_interval": 30.0,
+    "min_accuracy": 30.0,
+    "max_speed_kmh": 200.0,
+}
+
+# 미리 정의된 파라미터 세트
+PRESETS = {
+    "current": {},
+    # 수정 전 동작: 정확도/점프 필터 없이 거리만 검사
+    "legacy": {"min_accuracy": math.inf, "max_speed_kmh": math.inf},
+}
+
+RESPONSES = ["continue", "stop"]
+
+
+# MARK: - 상태 머신
+
+def replay_session(trace, params, response="continue", response_delay=0.0):
+    """
+    위치 스트림 하나를 무이동 감지 상태 머신으로 재생
+
+    Args:
+        trace: route_traces 트레이스 딕셔너리
+        params: DEFAULT_PARAMS 와 같은 키를 가진 파라미터
+        response: 알림 후 사용자 응답 ("continue" 또는 "stop")
+        response_delay: 알림 후 응답까지 걸리는 시간 (초)
+
+    Returns:
+        알림(alerted) 발생 시점 리스트 (세션 시작 기준 초)
+    """
+    timestamps = trace["timestamp"]
+    if not timestamps:
+        return []
+
+    idle_threshold = params["idle_threshold"]
+    movement_threshold = params["movement_threshold"]
+    check_interval = params["check_interval"]
+    min_accuracy = params["min_accuracy"]
+    max_speed = params["max_speed_kmh"] / 3.6
+    haversine = route_traces.haversine
+
+    start = timestamps[0]
+    end = timestamps[-1]
+    state = "monitoring"
+    last_movement = start
+    anchor = None           # (lat, lon, timestamp, accuracy)
+    next_check = start + check_interval
+    resume_at = None
+    alerts = []
+
+    def good(accuracy):
+        return 0 <= accuracy < min_accuracy
+
+    for lat, lon, t, accuracy in zip(trace["latitude"], trace["longitude"], timestamps, trace["accuracy"]):
+        # 이 위치 이전에 실행되는 체크 타이머 / 사용자 응답 처리
+        while True:
+            if resume_at is not None and resume_at <= t and resume_at <= next_check:
+                # dismissAlert(): 모니터링 재개, 무이동 시간 리셋
+                state = "monitoring"
+                last_movement = resume_at
+                resume_at = None
+                continue
+            if next_check > t:
+                break
+            if state == "monitoring" and next_check - last_movement >= idle_threshold:
+                # checkIdleState() → idle, 곧바로 markAlerted() → alerted
+                state = "alerted"
+                alerts.append(next_check - start)
+                if response == "stop":
+                    return alerts
+                resume_at = next_check + response_delay
+            next_check += check_interval
+
+        if state != "monitoring":
+            continue
+
+        if anchor is None:
+            if good(accuracy):
+                anchor = (lat, lon, t, accuracy)
+                last_movement = t
+            continue
+
+        distance = haversine(anchor[0], anchor[1], lat, lon)
+        if distance < movement_threshold:
+            continue
+        if not good(accuracy) or not good(anchor[3]):
+            continue
+        elapsed = t - anchor[2]
+        if elapsed >= 0.1 and distance / elapsed > max_speed:
+            continue
+
+        anchor = (lat, lon, t, accuracy)
+        last_movement = t
+
+    # 마지막 위치 이후 세션 종료 시점까지 남은 체크
+    while next_check <= end:
+        if resume_at is not None and resume_at <= next_check:
+            state = "monitoring"
+            last_movement = resume_at
+            resume_at = None
+        if state == "monitoring" and next_check - last_movement >= idle_threshold:
+            state = "alerted"
+            alerts.append(next_check - start)
+            if response == "stop":
+                break
+            resume_at = next_check + response_delay
+        next_check += check_interval
+
+    return alerts
+
+
+# MARK: - 합성 세션
+
+def synthesize_session(seed):
+    """
+    주행 + 장시간 정차(실내 GPS 흔들림 포함) 를 섞은 합성 세션 생성
+
+    정차 구간은 1~10초 간격으로 위치가 들어오며, 정확도가 나쁜 위치가
+    100~300m 씩 튀는 실내 GPS 점프를 포함합니다.
+    """
+    rng = random.Random(seed)
+    session = {"name": f"synthetic-idle-{seed}"}
+    for column in route_traces.COLUMNS:
+        session[column] = []
+
+    t = 788_918_400.0 + rng.randrange(0, 365 * 86400)
+    lat, lon = route_traces.DEFAULT_ORIGIN
+    for segment in range(rng.randint(1, 4)):
+        if segment % 2 == 0:
+            drive = route_traces.synthesize_trace(
+                rng.randrange(1 << 30), duration=rng.randint(120, 1800),
+                origin=(lat, lon), start_time=t,
+            )
+            for column in route_traces.COLUMNS:
+                session[column].extend(drive[column])
+            lat, lon = drive["latitude"][-1], drive["longitude"][-1]
+            t = drive["timestamp"][-1] + 1
+            continue
+
+        parked_until = t + rng.uniform(300, 1500)
+        indoor = rng.random() < 0.6
+        while t < parked_until:
+            accuracy = rng.uniform(35, 80) if indoor else rng.uniform(5, 20)
+            offset = rng.gauss(0, accuracy / 2)
+            if indoor and rng.random() < 0.05:
+                offset = rng.uniform(100, 300)  # 실내 GPS 점프
+            angle = rng.uniform(0, 2 * math.pi)
+            session["latitude"].append(lat + math.degrees(offset * math.cos(angle) / route_traces.EARTH_RADIUS))
+            session["longitude"].append(lon + math.degrees(
+                offset * math.sin(angle) / (route_traces.EARTH_RADIUS * math.cos(math.radians(lat)))
+            ))
+            session["timestamp"].append(t)
+            session["speed"].append(0.0)
+            session["accuracy"].append(accuracy)
+            t += rng.uniform(1, 10)
+
+    return session
+
+
+# MARK: - 일괄 실행
+
+def replay_task(task):
+    """
+    세션 하나를 모든 파라미터 세트로 재생 (워커 프로세스에서 실행)
+
+    Returns:
+        (세션 이름, 포인트 수, {세트 이름: 알림 시점 리스트})
+    """
+    source, param_sets, response, response_delay = task
+    if isinstance(source, tuple):
+        trace = synthesize_session(source[1])
+    else:
+        trace = route_traces.load_trace(source)
+    results = {
+        name: replay_session(trace, params, response, response_delay)
+        for name, params in param_sets.items()
+    }
+    return trace["name"], len(trace["timestamp"]), results
+
+
+def compare(baseline, alerts, tolerance):
+    """
+    두 알림 시점 리스트가 다른지 비교 (개수가 다르거나 시점이 tolerance 초 넘게 차이)
+    """
+    if len(baseline) != len(alerts):
+        return True
+    return any(abs(a - b) > tolerance for a, b in zip(baseline, alerts))
+
+
+def parse_param_set(text):
+    """
+    "이름:key=value,key=value" 또는 프리셋 이름을 파라미터 세트로 변환
+    """
+    name, _, overrides = text.partition(":")
+    if not overrides:
+        if name not in PRESETS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 프리셋: {name} (사용 가능: {', '.join(PRESETS)})")
+        return name, dict(DEFAULT_PARAMS, **PRESETS[name])
+
+    params = dict(DEFAULT_PARAMS)
+    for item in overrides.split(","):
+        key, _, value = item.partition("=")
+        if key not in DEFAULT_PARAMS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 파라미터: {key} (사용 가능: {', '.join(DEFAULT_PARAMS)})")
+        params[key] = float(value)
+    return name, params
+
+
+def format_alerts(alerts):
+    return ", ".join(f"{a / 60:.1f}분" for a in alerts) or "-"
+
+
+def run(args):
+    """
+    파싱된 인자로 리플레이 실행 (종료 코드 반환)
+    """
+    variants = args.variant or [parse_param_set("legacy")]
+    baseline_name = args.baseline[0]
+    param_sets = dict([args.baseline] + variants)
+
+    try:
+        sources = route_traces.find_trace_files(args.traces)
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일을 찾을 수 없습니다: {e}")
+        return 1
+    synthetic = args.synthetic or (0 if sources else 1000)
+    sources += [("synthetic", args.seed * 1_000_003 + i) for i in range(synthetic)]
+
+    print("=" * 60)
+    print("💤 무이동 감지 리플레이")
+    print("=" * 60)
+    print(f"세션: {len(sources)}개 (합성 {synthetic}개)")
+    for name, params in param_sets.items():
+        marker = " (기준)" if name == baseline_name else ""
+        changed = {k: v for k, v in params.items() if v != DEFAULT_PARAMS[k]}
+        print(f"  {name}{marker}: {changed or '기본값'}")
+    print(f"응답: {args.response} (지연 {args.response_delay:g}초), 워커: {args.jobs}개")
+    print("=" * 60 + "\n")
+
+    start = time.perf_counter()
+    tasks = [(source, param_sets, args.response, args.response_delay) for source in sources]
+    with profiling.phase("replay", sessions=len(tasks), jobs=args.jobs), \
+            ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        chunksize = max(1, len(tasks) // (args.jobs * 8))
+        sessions = list(executor.map(replay_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    total_points = sum(points for _, points, _ in sessions)
+    print(f"{'세트':<16}{'알림':>8}{'알림 세션':>10}{'차이 세션':>10}{'첫 알림 평균 차이':>18}")
+    for name in param_sets:
+        alert_count = sum(len(results[name]) for _, _, results in sessions)
+        alerted_sessions = sum(1 for _, _, results in sessions if results[name])
+        if name == baseline_name:
+            print(f"{name:<16}{alert_count:>8}{alerted_sessions:>10}{'-':>10}{'-':>18}")
+            continue
+        differing = [s for s in sessions if compare(s[2][baseline_name], s[2][name], args.tolerance)]
+        shifts = [
+            s[2][name][0] - s[2][baseline_name][0]
+            for s in sessions if s[2][name] and s[2][baseline_name]
+        ]
+        mean_shift = f"{sum(shifts) / len(shifts):+.0f}초" if shifts else "-"
+        print(f"{name:<16}{alert_count:>8}{alerted_sessions:>10}{len(differing):>10}{mean_shift:>18}")
+
+    for name in param_sets:
+        if name == baseline_name:
+            continue
+        differing = [s for s in sessions if compare(s[2][baseline_name], s[2][name], args.tolerance)]
+        if not differing or args.show <= 0:
+            continue
+        print(f"\n🔍 {baseline_name} ↔ {name} 차이 세션 ({len(differing)}개 중 {min(args.show, len(differing))}개)")
+        for session_name, _, results in differing[:args.show]:
+            print(f"  {session_name}: {format_alerts(results[baseline_name])} → {format_alerts(results[name])}")
+
+    print(f"\n⏱  {elapsed:.2f}초 ({len(sessions) / elapsed:.0f} 세션/초, "
+          f"{total_points * len(param_sets) / elapsed / 1e6:.2f}M 위치·세트/초)")
+
+    if args.json:
+        with profiling.phase("write"), open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                "baseline": baseline_name,
+                "params": param_sets,
+                "response": args.response,
+                "sessions": [
+                    {"name": name, "points": points, "alerts": results}
+                    for name, points, results in sessions
+                ],
+            }, f, ensure_ascii=False, indent=2)
+            profiling.count_written(f.tell())
+        print(f"✅ 결과 저장: {args.json}")
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="무이동 감지 상태 머신 일괄 리플레이")
+    parser.add_argument("traces", nargs="*", help="위치 스트림 파일 또는 디렉토리 (.json/.route.gz/.csv)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 세션 개수 (트레이스 미지정 시 기본 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 세션 시드")
+    parser.add_argument("--baseline", type=parse_param_set, default=parse_param_set("current"),
+                        help="기준 파라미터 세트 (기본: current)")
+    parser.add_argument("--variant", type=parse_param_set, action="append", default=[],
+                        help="비교할 파라미터 세트, 예: legacy 또는 'short:idle_threshold=300' (반복 가능)")
+    parser.add_argument("--response", choices=RESPONSES, default="continue", help="알림 후 사용자 응답")
+    parser.add_argument("--response-delay", type=float, default=0.0, help="알림 후 응답까지 시간 (초)")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="알림 시점 차이 허용 범위 (초)")
+    parser.add_argument("--show", type=int, default=10, help="차이가 난 세션을 세트별로 몇 개까지 출력할지")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    parser.add_argument("--json", help="세션별 결과를 JSON 으로 저장")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "idle", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
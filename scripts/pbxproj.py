@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+project.pbxproj 파서 / 작성기
+Xcode 프로젝트 파일(OpenStep plist)을 객체 맵으로 읽고, Xcode 와 같은 형식으로 다시 씁니다.
+병합 드라이버(pbxproj_merge.py), 의미 비교(pbxproj_diff.py), 포맷터(pbxproj_format.py)가
+공유합니다.
+
+- 값은 dict / list / str 로 표현하며, 딕셔너리 키 순서는 파일 순서를 유지합니다
+- ID 뒤의 /* 주석 */ 은 Ref(str) 의 comment 로 보존해 그대로 다시 씁니다
+- 작성 시 객체는 isa 별 섹션(알파벳 순)으로 묶고, 객체 키는 isa 다음 알파벳 순,
+  PBXBuildFile / PBXFileReference 등은 Xcode 처럼 한 줄로 씁니다
+
+파싱과 작성 모두 파일 크기에 선형입니다.
+"""
+
+import re
+
+HEADER = "// !$*UTF8*$!"
+
+# Xcode 가 한 줄로 쓰는 객체
+INLINE_ISAS = {"PBXBuildFile", "PBXFileReference", "PBXFileSystemSynchronizedRootGroup"}
+
+# 따옴표 없이 쓸 수 있는 문자열
+UNQUOTED = re.compile(r"[A-Za-z0-9_$/:.]+")
+
+TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<comment>/\*.*?\*/)
+  | "(?P<quoted>(?:[^"\\]|\\.)*)"
+  | (?P<punct>[{}();=,])
+  | (?P<bare>(?:[^\s{}();=,"/]|/(?![/*]))+)
+""", re.VERBOSE | re.DOTALL)
+
+UNESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\", '"': '"'}
+ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t", "\r": "\\r"}
+
+
+class ParseError(ValueError):
+    pass
+
+
+class Ref(str):
+    """
+    /* 주석 */ 이 붙어 있던 문자열 (주로 객체 ID)
+    """
+    __slots__ = ("comment",)
+
+    def __new__(cls, value, comment=None):
+        self = super().__new__(cls, value)
+        self.comment = comment
+        return self
+
+
+# MARK: - 파싱
+
+def _tokenize(text):
+    """
+    (종류, 값, 줄 번호) 토큰 리스트. 문자열 바로 뒤의 블록 주석은 그 문자열의 Ref 로 합칩니다.
+    """
+    tokens = []
+    position = 0
+    length = len(text)
+    line = 1
+    last_string = False
+    while position < length:
+        match = TOKEN.match(text, position)
+        if match is None:
+            raise ParseError(f"{line}번째 줄: 알 수 없는 문자 {text[position]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        if kind == "space" or kind == "line_comment":
+            line += match.group().count("\n")
+            continue
+        if kind == "comment":
+            if last_string:
+                kind_, value, value_line = tokens[-1]
+                tokens[-1] = (kind_, Ref(value, match.group()[2:-2].strip()), value_line)
+            line += match.group().count("\n")
+            last_string = False
+            continue
+        if kind == "quoted":
+            raw = match.group("quoted")
+            value = re.sub(r"\\(.)", lambda m: UNESCAPES.get(m.group(1), m.group(1)), raw) if "\\" in raw else raw
+            tokens.append(("string", value, line))
+            line += raw.count("\n")
+            last_string = True
+        elif kind == "bare":
+            tokens.append(("string", match.group(), line))
+            last_string = True
+        else:
+            tokens.append((match.group(), None, line))
+            last_string = False
+    return tokens
+
+
+def loads(text):
+    """
+    pbxproj 텍스트를 루트 딕셔너리로 파싱
+    """
+    tokens = _tokenize(text)
+    value, index = _parse_value(tokens, 0)
+    if index != len(tokens):
+        raise ParseError(f"{tokens[index][2]}번째 줄: 루트 딕셔너리 뒤에 남은 내용이 있습니다")
+    if not isinstance(value, dict) or "objects" not in value:
+        raise ParseError("objects 가 없는 pbxproj 입니다")
+    return value
+
+
+def load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return loads(f.read())
+
+
+def _parse_value(tokens, index):
+    try:
+        return _parse_tokens(tokens, index)
+    except IndexError:
+        raise ParseError("파일이 중간에 끝났습니다") from None
+
+
+def _parse_tokens(tokens, index):
+    kind, value, line = tokens[index]
+    if kind == "string":
+        return value, index + 1
+    if kind == "{":
+        result = {}
+        index += 1
+        while tokens[index][0] != "}":
+            key_kind, key, line = tokens[index]
+            if key_kind != "string" or tokens[index + 1][0] != "=":
+                raise ParseError(f"{line}번째 줄: 딕셔너리 키가 필요합니다 ({key_kind})")
+            item, index = _parse_tokens(tokens, index + 2)
+            if tokens[index][0] != ";":
+                raise ParseError(f"{tokens[index][2]}번째 줄: {key} 값 뒤에 ';' 가 필요합니다")
+            result[key] = item
+            index += 1
+        return result, index + 1
+    if kind == "(":
+        result = []
+        index += 1
+        while tokens[index][0] != ")":
+            item, index = _parse_tokens(tokens, index)
+            result.append(item)
+            if tokens[index][0] == ",":
+                index += 1
+            elif tokens[index][0] != ")":
+                raise ParseError(f"{tokens[index][2]}번째 줄: 배열 원소 뒤에 ',' 가 필요합니다")
+        return result, index + 1
+    raise ParseError(f"{line}번째 줄: 값이 필요한 위치에 {kind!r}")
+
+
+# MARK: - 작성
+
+def quote(value):
+    if UNQUOTED.fullmatch(value) and "___" not in value:
+        return value
+    return '"' + "".join(ESCAPES.get(c, c) for c in value) + '"'
+
+
+def _format_string(value):
+    text = quote(value)
+    comment = getattr(value, "comment", None)
+    return f"{text} /* {comment} */" if comment else text
+
+
+def _write_inline(value, out):
+    if isinstance(value, dict):
+        if not value:
+            out.append("{}")
+            return
+        out.append("{")
+        for key, item in value.items():
+            out.append(_format_string(key))
+            out.append(" = ")
+            _write_inline(item, out)
+            out.append("; ")
+        out.append("}")
+    elif isinstance(value, list):
+        if not value:
+            out.append("()")
+            return
+        out.append("(")
+        for item in value:
+            _write_inline(item, out)
+            out.append(", ")
+        out.append(")")
+    else:
+        out.append(_format_string(value))
+
+
+def _write_block(value, depth, out):
+    if isinstance(value, dict):
+        out.append("{\n")
+        for key, item in value.items():
+            out.append("\t" * (depth + 1))
+            out.append(_format_string(key))
+            out.append(" = ")
+            _write_block(item, depth + 1, out)
+            out.append(";\n")
+        out.append("\t" * depth + "}")
+    elif isinstance(value, list):
+        out.append("(\n")
+        for item in value:
+            out.append("\t" * (depth + 1))
+            _write_block(item, depth + 1, out)
+            out.append(",\n")
+        out.append("\t" * depth + ")")
+    else:
+        out.append(_format_string(value))
+
+
+def dumps_value(value):
+    """
+    값 하나를 한 줄 형식으로 작성 (메시지 출력용)
+    """
+    out = []
+    _write_inline(value, out)
+    return "".join(out)
+
+
+def canonical_object(obj):
+    """
+    isa 를 맨 앞에 두고 나머지 키를 알파벳 순으로 정렬한 객체 (Xcode 저장 순서)
+    """
+    ordered = {"isa": obj["isa"]} if "isa" in obj else {}
+    for key in sorted(obj):
+        if key != "isa":
+            ordered[key] = obj[key]
+    return ordered
+
+
+def object_sections(objects, sort_ids=False):
+    """
+    isa 별 섹션으로 묶은 (isa, [ID...]) 리스트
+
+    섹션은 isa 순이고, 섹션 안의 ID 는 sort_ids 가 아니면 objects 의 순서를 유지합니다.
+    """
+    sections = {}
+    for object_id, obj in objects.items():
+        sections.setdefault(obj.get("isa", ""), []).append(object_id)
+    return [(isa, sorted(ids) if sort_ids else ids) for isa, ids in sorted(sections.items())]
+
+
+def dumps(project, sort_ids=False):
+    """
+    루트 딕셔너리를 Xcode 형식의 pbxproj 텍스트로 작성
+
+    sort_ids 가 아니면 섹션 안의 객체 순서를 그대로 두어 원본과의 diff 를 최소화합니다.
+    """
+    out = [HEADER, "\n{\n"]
+    for key, value in project.items():
+        out.append("\t" + _format_string(key) + " = ")
+        if key == "objects":
+            out.append("{\n\n")
+            objects = value
+            for isa, ids in object_sections(objects, sort_ids):
+                out.append(f"/* Begin {isa} section */\n")
+                for object_id in ids:
+                    obj = canonical_object(objects[object_id])
+                    out.append("\t\t" + _format_string(object_id) + " = ")
+                    if isa in INLINE_ISAS:
+                        _write_inline(obj, out)
+                    else:
+                        _write_block(obj, 2, out)
+                    out.append(";\n")
+                out.append(f"/* End {isa} section */\n\n")
+            out.append("\t}")
+        else:
+            _write_block(value, 1, out)
+        out.append(";\n")
+    out.append("}\n")
+    return "".join(out)
+
+
+def save(project, path, sort_ids=False):
+    data = dumps(project, sort_ids)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(data)
+    return len(data.encode('utf-8'))
+
+
+# MARK: - 프로젝트 구조 조회
+
+def object_name(objects, object_id):
+    """
+    객체의 표시 이름 (name → path → 주석 → ID)
+    """
+    obj = objects.get(object_id, {})
+    name = obj.get("name") or obj.get("path")
+    if name:
+        return str(name)
+    comment = getattr(object_id, "comment", None)
+    return comment or str(object_id)
+
+
+def group_parents(objects):
+    """
+    {자식 ID: 부모 그룹 ID}
+    """
+    parents = {}
+    for object_id, obj in objects.items():
+        for child in obj.get("children", ()):
+            parents[child] = object_id
+    return parents
+
+
+def object_paths(project):
+    """
+    그룹 트리를 따라 만든 각 파일/그룹의 프로젝트 내 경로 {ID: "HoguMeter/Core/Foo.swift"}
+
+    path 가 없는 그룹(논리 그룹)은 name 으로 경로를 잇습니다.
+    """
+    objects = project["objects"]
+    root = objects.get(project.get("rootObject"), {})
+    paths = {}
+    stack = [(root.get("mainGroup"), "")]
+    while stack:
+        object_id, prefix = stack.pop()
+        obj = objects.get(object_id)
+        if obj is None or object_id in paths:
+            continue
+        segment = obj.get("path") or obj.get("name") or ""
+        path = f"{prefix}/{segment}" if prefix and segment else (segment or prefix)
+        paths[object_id] = path
+        for child in obj.get("children", ()):
+            stack.append((child, path))
+    return paths
+
+
+def build_phase_targets(objects):
+    """
+    {빌드 단계 ID: 타깃 이름}
+    """
+    targets = {}
+    for object_id, obj in objects.items():
+        for phase_id in obj.get("buildPhases", ()):
+            targets[phase_id] = obj.get("name", str(object_id))
+    return targets
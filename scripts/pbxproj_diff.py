@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+project.pbxproj 의미 단위 비교
+두 버전의 프로젝트(파일 또는 git 리비전)를 객체 맵으로 읽어, 무작위 ID 줄로 가득한
+텍스트 diff 대신 리뷰할 수 있는 변경 목록을 출력합니다.
+
+    📄 파일 추가/삭제      (그룹 트리상의 경로 기준)
+    📁 그룹 추가/삭제/이동 (파일/그룹이 다른 그룹으로 옮겨진 경우)
+    🔨 빌드 단계 구성 변경 (타깃별 Sources/Resources/... 에 추가·제외된 파일)
+    ⚙️  빌드 설정 변경      (타깃·구성별 키 추가/삭제/값 변경)
+    🧩 그 외 객체 변경      (타깃, 패키지 등)
+
+객체는 먼저 ID 로, 그다음 그룹 트리상의 경로로, 마지막으로 이름이 유일한 경우
+이름으로 짝지으므로 스크립트를 다시 실행해 ID 가 새로 생성된 항목도 같은 항목으로
+취급합니다.
+
+사용 예:
+    python3 scripts/pbxproj_diff.py                  # HEAD ↔ 작업 트리
+    python3 scripts/pbxproj_diff.py HEAD~3           # HEAD~3 ↔ 작업 트리
+    python3 scripts/pbxproj_diff.py main feature     # 두 리비전
+    python3 scripts/pbxproj_diff.py old.pbxproj new.pbxproj
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import profiling
+import pbxproj
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PATH = "HoguMeter.xcodeproj/project.pbxproj"
+
+GROUP_ISAS = {"PBXGroup", "PBXVariantGroup", "XCVersionGroup", "PBXFileSystemSynchronizedRootGroup"}
+FILE_ISAS = {"PBXFileReference", "PBXReferenceProxy"}
+
+# 위의 전용 섹션에서 다루므로 "그 외 객체" 에서 제외할 객체/속성
+COVERED_ISAS = GROUP_ISAS | FILE_ISAS | {"PBXBuildFile", "XCBuildConfiguration", "XCConfigurationList"}
+COVERED_KEYS = {"children", "files", "buildPhases", "buildConfigurations", "buildSettings"}
+
+
+# MARK: - 입력
+
+def read_version(spec, project_path):
+    """
+    파일 경로, REV:경로, REV 중 하나로 지정한 프로젝트 텍스트와 표시 이름
+    """
+    if os.path.isfile(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            text = f.read()
+        profiling.count_read(len(text))
+        return text, spec
+    object_name = spec if ":" in spec else f"{spec}:{project_path}"
+    result = subprocess.run(
+        ["git", "show", object_name], cwd=PROJECT_ROOT, capture_output=True,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"{spec}: 파일도 git 리비전도 아닙니다 ({result.stderr.decode().strip()})")
+    profiling.count_read(len(result.stdout))
+    return result.stdout.decode('utf-8'), object_name
+
+
+# MARK: - 프로젝트 색인
+
+class ProjectIndex:
+    """
+    비교에 필요한 조회 테이블 (그룹 트리 경로, 부모, 빌드 단계 구성, 빌드 설정)
+    """
+
+    def __init__(self, project):
+        self.objects = project["objects"]
+        self.paths = pbxproj.object_paths(project)
+        self.parents = pbxproj.group_parents(self.objects)
+        self.tree = {
+            object_id: obj for object_id, obj in self.objects.items()
+            if obj.get("isa") in GROUP_ISAS or obj.get("isa") in FILE_ISAS
+        }
+        self.membership = self._build_membership()
+        self.settings = self._build_settings()
+
+    def path(self, object_id):
+        """
+        그룹 트리상의 경로 (트리에 없는 항목은 이름 앞에 '?/')
+        """
+        if object_id in self.paths:
+            return self.paths[object_id] or "(main group)"
+        return "?/" + pbxproj.object_name(self.objects, object_id)
+
+    def _build_membership(self):
+        """
+        {(타깃 이름, 빌드 단계 이름): {파일 참조 또는 패키지 제품 ID}}
+        """
+        membership = {}
+        for target in self.objects.values():
+            for phase_id in target.get("buildPhases", ()):
+                phase = self.objects.get(phase_id, {})
+                members = membership.setdefault((target.get("name", "?"), phase_name(phase)), set())
+                for build_file_id in phase.get("files", ()):
+                    build_file = self.objects.get(build_file_id, {})
+                    members.add(build_file.get("fileRef") or build_file.get("productRef") or build_file_id)
+        return membership
+
+    def member_label(self, object_id):
+        obj = self.objects.get(object_id, {})
+        if "productName" in obj:
+            return "📦 " + obj["productName"]
+        return self.path(object_id)
+
+    def _build_settings(self):
+        """
+        {(타깃 또는 프로젝트 이름, 구성 이름): buildSettings}
+        """
+        settings = {}
+        for obj in self.objects.values():
+            list_id = obj.get("buildConfigurationList")
+            if list_id is None:
+                continue
+            owner = "(프로젝트)" if obj.get("isa") == "PBXProject" else obj.get("name", "?")
+            for config_id in self.objects.get(list_id, {}).get("buildConfigurations", ()):
+                config = self.objects.get(config_id, {})
+                settings[(owner, config.get("name", str(config_id)))] = config.get("buildSettings", {})
+        return settings
+
+
+def phase_name(phase):
+    isa = phase.get("isa", "?")
+    if phase.get("name"):
+        return phase["name"]
+    if isa.startswith("PBX") and isa.endswith("BuildPhase"):
+        return isa[3:-len("BuildPhase")]
+    return isa
+
+
+# MARK: - 비교
+
+def match_tree(old, new):
+    """
+    파일/그룹 객체 짝짓기 {old ID: new ID} - ID → 경로 → 유일한 (isa, 이름) 순
+    """
+    pairs = {object_id: object_id for object_id in old.tree if object_id in new.tree}
+    old_left = [object_id for object_id in old.tree if object_id not in pairs]
+    new_left = {object_id for object_id in new.tree if object_id not in old.tree}
+
+    by_path = {}
+    for object_id in new_left:
+        by_path.setdefault((new.tree[object_id].get("isa"), new.path(object_id)), []).append(object_id)
+    remaining = []
+    for object_id in old_left:
+        candidates = by_path.get((old.tree[object_id].get("isa"), old.path(object_id)))
+        if candidates:
+            match = candidates.pop()
+            pairs[object_id] = match
+            new_left.discard(match)
+        else:
+            remaining.append(object_id)
+
+    def by_name(index, ids):
+        names = {}
+        for object_id in ids:
+            key = (index.tree[object_id].get("isa"), pbxproj.object_name(index.objects, object_id))
+            names.setdefault(key, []).append(object_id)
+        return {key: ids[0] for key, ids in names.items() if len(ids) == 1}
+
+    old_names = by_name(old, remaining)
+    new_names = by_name(new, new_left)
+    for key, object_id in old_names.items():
+        if key in new_names:
+            pairs[object_id] = new_names[key]
+    return pairs
+
+
+def diff_projects(old_project, new_project):
+    """
+    두 프로젝트의 의미 단위 변경 목록
+
+    Returns:
+        {"files_added", "files_removed", "groups_added", "groups_removed", "moved",
+         "renamed", "membership", "settings", "objects", "reordered"}
+    """
+    with profiling.phase("index"):
+        old = ProjectIndex(old_project)
+        new = ProjectIndex(new_project)
+
+    changes = {key: [] for key in (
+        "files_added", "files_removed", "groups_added", "groups_removed",
+        "moved", "renamed", "membership", "settings", "objects",
+    )}
+    changes["reordered"] = 0
+
+    with profiling.phase("tree"):
+        pairs = match_tree(old, new)
+        matched_new = set(pairs.values())
+        for object_id in old.tree:
+            if object_id not in pairs:
+                kind = "groups_removed" if old.tree[object_id].get("isa") in GROUP_ISAS else "files_removed"
+                changes[kind].append(old.path(object_id))
+        for object_id in new.tree:
+            if object_id not in matched_new:
+                kind = "groups_added" if new.tree[object_id].get("isa") in GROUP_ISAS else "files_added"
+                changes[kind].append(new.path(object_id))
+
+        for old_id, new_id in pairs.items():
+            old_parent = old.parents.get(old_id)
+            new_parent = new.parents.get(new_id)
+            name = pbxproj.object_name(new.objects, new_id)
+            is_group = new.tree[new_id].get("isa") in GROUP_ISAS
+            label = name + ("/" if is_group else "")
+            if old_parent is not None and pairs.get(old_parent, old_parent) != new_parent:
+                changes["moved"].append((label, old.path(old_parent), new.path(new_parent) if new_parent else "(없음)"))
+            elif pbxproj.object_name(old.objects, old_id) != name:
+                changes["renamed"].append((old.path(old_id), new.path(new_id)))
+            old_children = [pairs.get(c, c) for c in old.tree[old_id].get("children", ())]
+            new_children = list(new.tree[new_id].get("children", ()))
+            if old_children != new_children and sorted(old_children) == sorted(new_children):
+                changes["reordered"] += 1
+
+    with profiling.phase("membership"):
+        for key in sorted(old.membership.keys() | new.membership.keys()):
+            # 이동/재생성된 파일은 같은 파일로 보도록 old ID 를 짝지은 new ID 로 바꿔 비교
+            before = {pairs.get(member, member): member for member in old.membership.get(key, ())}
+            after = new.membership.get(key, set())
+            added = sorted(new.member_label(member) for member in after - before.keys())
+            removed = sorted(old.member_label(before[member]) for member in before.keys() - after)
+            if added or removed:
+                changes["membership"].append((key[0], key[1], added, removed))
+
+    with profiling.phase("settings"):
+        for key in sorted(old.settings.keys() | new.settings.keys()):
+            before = old.settings.get(key)
+            after = new.settings.get(key)
+            if before is None or after is None:
+                changes["settings"].append((key[0], key[1], "(구성)", "추가" if before is None else "삭제", None))
+                continue
+            for setting in sorted(before.keys() | after.keys()):
+                if before.get(setting) != after.get(setting):
+                    changes["settings"].append((key[0], key[1], setting, before.get(setting), after.get(setting)))
+
+    with profiling.phase("objects"):
+        for object_id in old.objects.keys() | new.objects.keys():
+            before = old.objects.get(object_id)
+            after = new.objects.get(object_id)
+            isa = (after or before).get("isa", "?")
+            if isa in COVERED_ISAS or before == after:
+                continue
+            label = f"{isa} {pbxproj.object_name(new.objects if after else old.objects, object_id)}"
+            if before is None:
+                changes["objects"].append(("+", label, []))
+            elif after is None:
+                changes["objects"].append(("-", label, []))
+            else:
+                keys = sorted(
+                    key for key in before.keys() | after.keys()
+                    if key not in COVERED_KEYS and before.get(key) != after.get(key)
+                )
+                reordered = [
+                    key for key in COVERED_KEYS & before.keys() & after.keys()
+                    if before[key] != after[key] and isinstance(before[key], list)
+                    and sorted(before[key]) == sorted(after[key])
+                ]
+                changes["reordered"] += len(reordered)
+                if keys:
+                    changes["objects"].append(("~", label, keys))
+        changes["objects"].sort(key=lambda item: (item[1], item[0]))
+
+    for key in ("files_added", "files_removed", "groups_added", "groups_removed", "moved", "renamed"):
+        changes[key].sort()
+    return changes
+
+
+# MARK: - 출력
+
+def format_value(value):
+    if value is None:
+        return "(없음)"
+    if isinstance(value, (dict, list)):
+        return pbxproj.dumps_value(value)
+    return pbxproj.quote(value)
+
+
+def change_count(changes):
+    return sum(len(value) for key, value in changes.items() if key != "reordered")
+
+
+def print_changes(changes, old_name, new_name):
+    print("=" * 60)
+    print(f"🔍 project.pbxproj 비교: {old_name} → {new_name}")
+    print("=" * 60)
+
+    if not change_count(changes):
+        print("✅ 의미상 변경 없음" + (f" (배열 {changes['reordered']}개의 순서만 바뀜)" if changes["reordered"] else ""))
+        return
+
+    def section(title, lines):
+        if lines:
+            print(f"\n{title}")
+            for line in lines:
+                print(f"  {line}")
+
+    section("📄 파일", [f"+ {path}" for path in changes["files_added"]]
+            + [f"- {path}" for path in changes["files_removed"]])
+    section("📁 그룹", [f"+ {path}/" for path in changes["groups_added"]]
+            + [f"- {path}/" for path in changes["groups_removed"]]
+            + [f"→ {name}: {before}/ → {after}/" for name, before, after in changes["moved"]]
+            + [f"✎ {before} → {after}" for before, after in changes["renamed"]])
+
+    membership = []
+    for target, phase, added, removed in changes["membership"]:
+        membership.append(f"{target} › {phase}")
+        membership += [f"  + {path}" for path in added]
+        membership += [f"  - {path}" for path in removed]
+    section("🔨 빌드 단계", membership)
+
+    settings = []
+    last_owner = None
+    for owner, config, key, before, after in changes["settings"]:
+        if (owner, config) != last_owner:
+            settings.append(f"{owner} › {config}")
+            last_owner = (owner, config)
+        if key == "(구성)":
+            settings.append(f"  {before}")
+        elif before is None:
+            settings.append(f"  + {key} = {format_value(after)}")
+        elif after is None:
+            settings.append(f"  - {key} = {format_value(before)}")
+        else:
+            settings.append(f"  ~ {key}: {format_value(before)} → {format_value(after)}")
+    section("⚙️  빌드 설정", settings)
+
+    section("🧩 그 외 객체", [
+        f"{mark} {label}" + (f" ({', '.join(keys)})" if keys else "")
+        for mark, label, keys in changes["objects"]
+    ])
+
+    summary = (f"파일 +{len(changes['files_added'])} -{len(changes['files_removed'])}, "
+               f"그룹 +{len(changes['groups_added'])} -{len(changes['groups_removed'])} "
+               f"→{len(changes['moved'])}, 빌드 단계 {len(changes['membership'])}, "
+               f"설정 {len(changes['settings'])}, 기타 {len(changes['objects'])}")
+    if changes["reordered"]:
+        summary += f" (순서만 바뀐 배열 {changes['reordered']}개)"
+    print(f"\n{summary}")
+
+
+def changes_to_json(changes):
+    return {
+        "files": {"added": changes["files_added"], "removed": changes["files_removed"]},
+        "groups": {
+            "added": changes["groups_added"],
+            "removed": changes["groups_removed"],
+            "moved": [{"name": n, "from": b, "to": a} for n, b, a in changes["moved"]],
+            "renamed": [{"from": b, "to": a} for b, a in changes["renamed"]],
+        },
+        "buildPhases": [
+            {"target": t, "phase": p, "added": added, "removed": removed}
+            for t, p, added, removed in changes["membership"]
+        ],
+        "buildSettings": [
+            {"owner": o, "configuration": c, "key": k, "old": b, "new": a}
+            for o, c, k, b, a in changes["settings"]
+        ],
+        "objects": [{"change": m, "object": label, "keys": keys} for m, label, keys in changes["objects"]],
+        "reordered": changes["reordered"],
+    }
+
+
+# MARK: - 실행
+
+def run(args):
+    project_path = args.project
+    old_spec = args.old or "HEAD"
+    new_spec = args.new or os.path.join(PROJECT_ROOT, project_path)
+
+    try:
+        with profiling.phase("load"):
+            old_text, old_name = read_version(old_spec, project_path)
+            new_text, new_name = read_version(new_spec, project_path)
+        with profiling.phase("parse"):
+            old_project = pbxproj.loads(old_text)
+            new_project = pbxproj.loads(new_text)
+    except (OSError, ValueError) as e:
+        print(f"❌ 오류: {e}")
+        return 2
+
+    with profiling.phase("diff"):
+        changes = diff_projects(old_project, new_project)
+
+    with profiling.phase("report"):
+        if args.json:
+            print(json.dumps(changes_to_json(changes), ensure_ascii=False, indent=2))
+        else:
+            print_changes(changes, old_name, new_name if args.new else "작업 트리")
+
+    return 1 if args.exit_code and change_count(changes) else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="project.pbxproj 의미 단위 비교 (파일 또는 git 리비전)")
+    parser.add_argument("old", nargs="?", help="이전 버전: 파일 경로, REV 또는 REV:경로 (기본: HEAD)")
+    parser.add_argument("new", nargs="?", help="새 버전: 파일 경로, REV 또는 REV:경로 (기본: 작업 트리)")
+    parser.add_argument("--project", default=PROJECT_PATH, help=f"리비전에서 읽을 저장소 내 경로 (기본: {PROJECT_PATH})")
+    parser.add_argument("--json", action="store_true", help="변경 목록을 JSON 으로 출력")
+    parser.add_argument("--exit-code", action="store_true", help="변경이 있으면 종료 코드 1 (git diff --exit-code 와 같음)")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "pbxproj-diff", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
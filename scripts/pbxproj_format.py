@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+project.pbxproj 정규 포맷터
+편집 스크립트는 새 항목을 섹션과 children 배열 끝에 실행 순서대로 붙이고, 그룹 정의를
+부모 그룹 바로 뒤에 끼워 넣으므로 실행할 때마다 파일 순서가 흔들립니다. 이 포맷터는
+프로젝트를 정해진 순서로 다시 써서 diff 와 병합 충돌을 줄입니다.
+
+- 섹션은 isa 순, 섹션 안의 객체는 ID 순
+- 객체 키는 isa 다음 알파벳 순
+- 그룹의 children 은 그룹 → 파일 순, 같은 종류 안에서는 이름 순 (대소문자 무시)
+- 들여쓰기, 한 줄 객체, ID 뒤 /* 주석 */ 등은 Xcode 가 저장하는 형식 그대로
+
+파싱과 작성은 파일 크기에 선형이고 정렬만 n log n 이라, 저장할 때마다 실행해도
+수십 밀리초면 끝납니다.
+
+사용 예:
+    python3 scripts/pbxproj_format.py                 # 기본 프로젝트를 제자리에서 정리
+    python3 scripts/pbxproj_format.py --check         # 정리가 필요하면 종료 코드 1
+    python3 scripts/pbxproj_format.py - < in > out    # 표준 입출력 (에디터 연동)
+"""
+
+import argparse
+import os
+import sys
+
+import profiling
+import pbxproj
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_PATH = os.path.join(PROJECT_ROOT, "HoguMeter.xcodeproj/project.pbxproj")
+
+# children 을 정렬할 객체
+GROUP_ISAS = {"PBXGroup", "PBXVariantGroup", "XCVersionGroup"}
+# 정렬 시 파일보다 앞에 오는 항목
+CONTAINER_ISAS = GROUP_ISAS | {"PBXFileSystemSynchronizedRootGroup"}
+
+
+def child_sort_key(objects, child_id):
+    """
+    (그룹이면 0 아니면 1, 이름 casefold, 이름, ID) - 이름이 같아도 순서가 정해지도록 ID 로 마무리
+    """
+    obj = objects.get(child_id, {})
+    name = pbxproj.object_name(objects, child_id)
+    return (0 if obj.get("isa") in CONTAINER_ISAS else 1, name.casefold(), name, str(child_id))
+
+
+def sort_children(project):
+    """
+    모든 그룹의 children 을 정렬하고 순서가 바뀐 그룹 수를 반환
+    """
+    objects = project["objects"]
+    changed = 0
+    for obj in objects.values():
+        if obj.get("isa") not in GROUP_ISAS or "children" not in obj:
+            continue
+        children = obj["children"]
+        ordered = sorted(children, key=lambda child: child_sort_key(objects, child))
+        if ordered != children:
+            obj["children"] = ordered
+            changed += 1
+    return changed
+
+
+def format_text(text, children=True):
+    """
+    pbxproj 텍스트를 정규 형식으로 변환
+
+    Returns:
+        (정리된 텍스트, children 순서가 바뀐 그룹 수)
+    """
+    with profiling.phase("parse"):
+        project = pbxproj.loads(text)
+    changed = 0
+    if children:
+        with profiling.phase("sort"):
+            changed = sort_children(project)
+    with profiling.phase("write"):
+        formatted = pbxproj.dumps(project, sort_ids=True)
+    return formatted, changed
+
+
+def run(args):
+    failed = False
+    needs_format = []
+
+    for path in args.paths or [PROJECT_PATH]:
+        try:
+            with profiling.phase("read"):
+                if path == "-":
+                    text = sys.stdin.read()
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        text = f.read()
+                profiling.count_read(len(text.encode('utf-8')))
+            formatted, changed = format_text(text, children=not args.keep_children)
+        except (OSError, pbxproj.ParseError) as e:
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            failed = True
+            continue
+
+        if path == "-":
+            sys.stdout.write(formatted)
+            profiling.count_written(len(formatted.encode('utf-8')))
+            continue
+
+        if formatted == text:
+            if not args.quiet:
+                print(f"✅ {path}: 이미 정리됨")
+            continue
+        needs_format.append(path)
+        if args.check:
+            print(f"⚠️  {path}: 정리가 필요합니다 (children 순서가 바뀌는 그룹 {changed}개)")
+            continue
+
+        with profiling.phase("write-file"), open(path, 'w', encoding='utf-8') as f:
+            f.write(formatted)
+            profiling.count_written(f.tell())
+        if not args.quiet:
+            print(f"✅ {path}: 정리 완료 (children 순서가 바뀐 그룹 {changed}개)")
+
+    if failed:
+        return 2
+    if args.check and needs_format:
+        print(f"❌ {len(needs_format)}개 파일이 정규 형식이 아닙니다. "
+              "python3 scripts/pbxproj_format.py 로 정리하세요.")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="project.pbxproj 정규 포맷터 (최소 diff 를 위한 고정 순서)")
+    parser.add_argument("paths", nargs="*", metavar="PATH",
+                        help="정리할 project.pbxproj (기본: HoguMeter.xcodeproj, - 이면 표준 입출력)")
+    parser.add_argument("--check", action="store_true", help="파일을 고치지 않고, 정리가 필요하면 종료 코드 1")
+    parser.add_argument("--keep-children", action="store_true", help="그룹의 children 순서는 그대로 둠")
+    parser.add_argument("-q", "--quiet", action="store_true", help="문제가 없으면 아무것도 출력하지 않음")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "pbxproj-format", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+project.pbxproj 의미 단위 3-way 병합 드라이버
+두 브랜치가 각각 파일/그룹을 추가하면 pbxproj 의 같은 섹션 끝이나 같은 children 배열이
+바뀌어 텍스트 병합이 충돌합니다. 이 드라이버는 base / ours / theirs 를 객체 맵으로 파싱해
+객체별, 속성별, 배열 원소별로 병합하므로 양쪽이 같은 속성을 서로 다르게 바꾼 경우만
+충돌로 보고합니다.
+
+- 한쪽에서만 추가/삭제/수정한 객체는 그대로 반영
+- children / files / buildPhases 같은 배열은 원소 집합으로 병합 (ours 순서 유지,
+  theirs 에서 추가한 원소는 theirs 에서의 앞 원소 뒤에 삽입)
+- buildSettings 같은 딕셔너리는 키별로 재귀 병합
+- 병합 후 없는 객체를 가리키는 참조, 두 그룹에 동시에 들어간 항목도 충돌로 보고
+
+충돌한 속성은 ours 값(--prefer theirs 면 theirs 값)을 남기므로 결과 파일은 항상
+Xcode 가 열 수 있는 유효한 프로젝트이고, 충돌 목록은 화면에 출력됩니다.
+입력을 파싱할 수 없으면 git merge-file 의 텍스트 병합으로 대체합니다.
+
+설정 (저장소마다 한 번):
+    git config merge.pbxproj.name "Xcode project.pbxproj 의미 병합"
+    git config merge.pbxproj.driver "python3 scripts/pbxproj_merge.py %O %A %B %P"
+    (.gitattributes 에 '*.pbxproj merge=pbxproj' 가 등록되어 있음)
+
+직접 실행:
+    python3 scripts/pbxproj_merge.py BASE OURS THEIRS [경로] [-o 출력]
+
+종료 코드: 0 병합 성공, 1 충돌 있음 (파일은 기록됨), 2 입력 오류
+"""
+
+import argparse
+import subprocess
+import sys
+
+import profiling
+import pbxproj
+
+# 병합 결과에서 값이 없음을 나타내는 표식 (base 에 없던 키 등)
+MISSING = object()
+
+
+class Conflict:
+    """
+    양쪽이 같은 속성을 서로 다르게 바꾼 지점 하나
+    """
+    __slots__ = ("location", "base", "ours", "theirs")
+
+    def __init__(self, location, base, ours, theirs):
+        self.location = location
+        self.base = base
+        self.ours = ours
+        self.theirs = theirs
+
+    def describe(self):
+        if self.base is MISSING and self.ours is MISSING and self.theirs is MISSING:
+            return self.location  # 병합 후 구조 검사에서 발견한 문제
+        return (f"{self.location}\n"
+                f"      base:   {preview(self.base)}\n"
+                f"      ours:   {preview(self.ours)}\n"
+                f"      theirs: {preview(self.theirs)}")
+
+
+def preview(value, limit=70):
+    if value is MISSING:
+        return "(없음)"
+    if isinstance(value, (dict, list)):
+        text = pbxproj.dumps_value(value)
+    else:
+        text = pbxproj.quote(value)
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+# MARK: - 병합
+
+class Merger:
+    def __init__(self, prefer="ours"):
+        self.prefer = prefer
+        self.conflicts = []
+
+    def conflict(self, location, base, ours, theirs):
+        self.conflicts.append(Conflict(location, base, ours, theirs))
+        return theirs if self.prefer == "theirs" else ours
+
+    def merge_value(self, location, base, ours, theirs):
+        """
+        값 하나를 3-way 병합 (MISSING 은 키가 없음을 뜻함)
+        """
+        if ours == theirs:
+            return pick_annotated(base, ours, theirs)
+        if ours == base:
+            return theirs
+        if theirs == base:
+            return ours
+        if isinstance(ours, dict) and isinstance(theirs, dict) and (base is MISSING or isinstance(base, dict)):
+            return self.merge_dict(location, base if base is not MISSING else {}, ours, theirs)
+        if isinstance(ours, list) and isinstance(theirs, list) and (base is MISSING or isinstance(base, list)):
+            merged = merge_list(base if base is not MISSING else [], ours, theirs)
+            if merged is not None:
+                return merged
+        return self.conflict(location, base, ours, theirs)
+
+    def merge_dict(self, location, base, ours, theirs):
+        """
+        키별 3-way 병합. 키 순서는 ours, 그 뒤에 theirs 에만 있는 키
+        """
+        merged = {}
+        originals = annotated_keys(ours, theirs)
+        keys = list(ours)
+        keys += [key for key in theirs if key not in ours]
+        keys += [key for key in base if key not in ours and key not in theirs]
+        for key in keys:
+            value = self.merge_value(
+                f"{location}.{key}",
+                base.get(key, MISSING), ours.get(key, MISSING), theirs.get(key, MISSING),
+            )
+            if value is not MISSING:
+                merged[originals.get(key, key)] = value
+        return merged
+
+    def merge_objects(self, base, ours, theirs):
+        """
+        objects 맵 병합. 객체 순서는 ours, 그 뒤에 theirs 에서 추가한 객체
+        """
+        merged = {}
+        originals = annotated_keys(ours, theirs)
+        ids = list(ours)
+        ids += [object_id for object_id in theirs if object_id not in ours]
+        for object_id in ids:
+            b = base.get(object_id, MISSING)
+            o = ours.get(object_id, MISSING)
+            t = theirs.get(object_id, MISSING)
+            label = object_label(object_id, o if o is not MISSING else t)
+            if o is MISSING or t is MISSING:
+                # 한쪽에서 삭제(또는 한쪽에서만 추가)
+                present = o if t is MISSING else t
+                if b is MISSING:
+                    value = present
+                elif present == b:
+                    value = MISSING
+                else:
+                    value = self.conflict(f"{label} (한쪽에서 삭제, 다른 쪽에서 수정)", b, o, t)
+            else:
+                value = self.merge_dict(label, b if b is not MISSING else {}, o, t)
+            if value is not MISSING:
+                merged[originals[object_id]] = value
+        return merged
+
+    def merge_project(self, base, ours, theirs):
+        merged = {}
+        keys = list(ours) + [key for key in theirs if key not in ours]
+        for key in keys:
+            b = base.get(key, MISSING)
+            o = ours.get(key, MISSING)
+            t = theirs.get(key, MISSING)
+            if key == "objects":
+                value = self.merge_objects(b if b is not MISSING else {}, o, t)
+            else:
+                value = self.merge_value(key, b, o, t)
+            if value is not MISSING:
+                merged[key] = value
+        return merged
+
+    def validate(self, project, known_ids):
+        """
+        병합 결과의 구조 검사: 없는 객체 참조, 여러 그룹에 속한 항목
+        """
+        objects = project["objects"]
+        for object_id, obj in objects.items():
+            label = object_label(object_id, obj)
+            for key, value in obj.items():
+                for ref in iter_strings(value):
+                    if ref in known_ids and ref not in objects:
+                        self.conflicts.append(Conflict(
+                            f"{label}.{key} → 삭제된 객체 {ref} 참조", MISSING, MISSING, MISSING,
+                        ))
+        parents = {}
+        for object_id, obj in objects.items():
+            for child in obj.get("children", ()):
+                parents.setdefault(child, []).append(object_id)
+        for child, owners in parents.items():
+            if len(owners) > 1:
+                names = ", ".join(pbxproj.object_name(objects, owner) for owner in owners)
+                self.conflicts.append(Conflict(
+                    f"{object_label(child, objects.get(child, {}))} 이(가) 여러 그룹에 속함: {names}",
+                    MISSING, MISSING, MISSING,
+                ))
+
+
+def merge_list(base, ours, theirs):
+    """
+    배열을 원소 집합으로 3-way 병합
+
+    양쪽에서 삭제한 원소를 빼고, theirs 에서 추가한 원소는 theirs 에서 바로 앞에 있던
+    원소 뒤에 넣습니다. 중복 원소가 있는 배열(컴파일러 플래그 등)은 집합으로 다룰 수
+    없으므로 None 을 돌려 충돌로 처리하게 합니다.
+    """
+    if any(len(set(values)) != len(values) for values in (base, ours, theirs)):
+        return None
+    if not all(isinstance(v, str) for values in (base, ours, theirs) for v in values):
+        return None
+    base_set = set(base)
+    removed = (base_set - set(ours)) | (base_set - set(theirs))
+    result = [item for item in ours if item not in removed]
+    present = set(result)
+    anchor = None
+    for item in theirs:
+        if item in present:
+            anchor = item
+            continue
+        if item in base_set:
+            continue
+        position = result.index(anchor) + 1 if anchor is not None else 0
+        result.insert(position, item)
+        present.add(item)
+        anchor = item
+    return result
+
+
+# MARK: - 헬퍼
+
+def annotated_keys(ours, theirs):
+    """
+    {키: 원래 키 객체} - 주석이 붙은 키(객체 ID)는 ours 쪽 표기를 우선 (theirs 에만 있으면 theirs)
+    """
+    originals = {key: key for key in theirs}
+    originals.update((key, key) for key in ours)
+    return originals
+
+
+def pick_annotated(base, ours, theirs):
+    """
+    양쪽 값이 같을 때 주석(파일 이름 변경 등)이 바뀐 쪽의 표기를 사용
+    """
+    if isinstance(ours, str) and getattr(ours, "comment", None) == getattr(base, "comment", None):
+        return theirs
+    return ours
+
+
+def iter_strings(value):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield from iter_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from iter_strings(item)
+    else:
+        yield value
+
+
+def object_label(object_id, obj):
+    name = getattr(object_id, "comment", None) or (obj.get("name") or obj.get("path") if isinstance(obj, dict) else None)
+    isa = obj.get("isa", "?") if isinstance(obj, dict) else "?"
+    return f"{isa} {object_id}" + (f" ({name})" if name else "")
+
+
+def read_text(path):
+    with profiling.phase("read"), open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+        profiling.count_read(f.tell())
+    return text
+
+
+def text_merge(base_path, ours_path, theirs_path, output):
+    """
+    파싱할 수 없는 입력은 git 의 텍스트 병합으로 대체 (충돌 마커가 남을 수 있음)
+    """
+    if output != ours_path:
+        with open(ours_path, 'r', encoding='utf-8') as src, open(output, 'w', encoding='utf-8') as dst:
+            dst.write(src.read())
+    result = subprocess.run(
+        ["git", "merge-file", "-L", "ours", "-L", "base", "-L", "theirs", output, base_path, theirs_path],
+    )
+    return 1 if result.returncode != 0 else 0
+
+
+# MARK: - 실행
+
+def run(args):
+    output = args.output or args.ours
+    name = args.path or output
+
+    try:
+        with profiling.phase("parse"):
+            texts = [read_text(path) for path in (args.base, args.ours, args.theirs)]
+            base, ours, theirs = [pbxproj.loads(text) for text in texts]
+    except (OSError, pbxproj.ParseError) as e:
+        print(f"⚠️  {name}: pbxproj 로 읽을 수 없어 텍스트 병합으로 대체합니다 ({e})")
+        try:
+            return text_merge(args.base, args.ours, args.theirs, output)
+        except OSError as e:
+            print(f"❌ 오류: {e}")
+            return 2
+
+    merger = Merger(args.prefer)
+    with profiling.phase("merge"):
+        merged = merger.merge_project(base, ours, theirs)
+    with profiling.phase("validate"):
+        known_ids = set(base["objects"]) | set(ours["objects"]) | set(theirs["objects"])
+        merger.validate(merged, known_ids)
+
+    with profiling.phase("write"):
+        size = pbxproj.save(merged, output)
+        profiling.count_written(size)
+
+    added = len(set(merged["objects"]) - set(ours["objects"]))
+    removed = len(set(ours["objects"]) - set(merged["objects"]))
+    if not merger.conflicts:
+        if not args.quiet:
+            print(f"✅ {name}: 의미 병합 완료 (theirs 에서 객체 {added}개 추가, {removed}개 삭제)")
+        return 0
+
+    print(f"❌ {name}: 충돌 {len(merger.conflicts)}건 "
+          f"({args.prefer} 값을 남겨 유효한 프로젝트로 기록했습니다)")
+    for conflict in merger.conflicts:
+        print(f"  - {conflict.describe()}")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="project.pbxproj 의미 단위 3-way 병합 (git merge 드라이버)",
+    )
+    parser.add_argument("base", help="공통 조상 (%%O)")
+    parser.add_argument("ours", help="현재 브랜치 (%%A, 결과가 여기에 기록됨)")
+    parser.add_argument("theirs", help="병합할 브랜치 (%%B)")
+    parser.add_argument("path", nargs="?", help="저장소 내 경로 (%%P, 메시지 표시용)")
+    parser.add_argument("-o", "--output", help="결과 경로 (기본: ours 를 덮어씀)")
+    parser.add_argument("--prefer", choices=["ours", "theirs"], default="ours",
+                        help="충돌한 속성에 남길 값 (기본: ours)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="충돌이 없으면 아무것도 출력하지 않음")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "pbxproj-merge", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
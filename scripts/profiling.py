@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+단계별 프로파일링 모듈
+스크립트 곳곳에 phase() 블록을 두면 --profile(-trace) 실행 시 중첩된 단계별 시간,
+읽기/쓰기 바이트, 최대 메모리를 기록하고, 요약 표와 Chrome trace JSON
+(chrome://tracing, https://ui.perfetto.dev 에서 열기) 으로 내보냅니다.
+
+    import profiling
+
+    with profiling.phase("scan"):
+        match = re.search(pattern, content)
+    profiling.count_written(len(data))
+
+프로파일링이 꺼져 있으면 phase() 는 아무 일도 하지 않는 컨텍스트를 돌려주므로
+평소 실행 비용은 거의 없습니다. 메모리는 기본적으로 단계가 끝난 시점의 프로세스
+최대 RSS 를 기록하고, --profile-memory 를 주면 tracemalloc 으로 단계별 Python 힙
+최대치를 측정합니다 (할당이 많은 코드는 몇 배 느려지므로 시간 측정과는 따로 실행).
+ProcessPoolExecutor 워커 안의 작업은 부모 프로세스의 단계 하나로 기록됩니다.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class Phase:
+    """
+    기록된 단계 하나 (Chrome trace 의 complete 이벤트)
+    """
+    __slots__ = ("name", "path", "depth", "start", "end", "bytes_read", "bytes_written", "peak_memory", "args")
+
+    def __init__(self, name, path, depth, start, args):
+        self.name = name
+        self.path = path
+        self.depth = depth
+        self.start = start
+        self.end = start
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.peak_memory = 0
+        self.args = args
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+class Profiler:
+    """
+    중첩 단계 기록기
+
+    단계가 끝날 때 바이트 수와 메모리 최대치를 부모 단계에 합산하므로
+    부모의 값은 항상 자식을 포함합니다.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.phases = []
+        self.stack = []
+        self.origin = 0
+        self.started_tracemalloc = False
+
+    def start(self, memory=False):
+        self.enabled = True
+        self.memory = memory
+        self.phases = []
+        self.stack = []
+        self.origin = time.perf_counter_ns()
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracemalloc = True
+            tracemalloc.reset_peak()
+
+    def stop(self):
+        while self.stack:
+            self._close(self.stack[-1])
+        self.enabled = False
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def phase(self, name, **args):
+        parent = self.stack[-1] if self.stack else None
+        if self.memory:
+            if parent is not None:
+                parent.peak_memory = max(parent.peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        path = f"{parent.path}/{name}" if parent else name
+        current = Phase(name, path, len(self.stack), time.perf_counter_ns(), args)
+        self.phases.append(current)
+        self.stack.append(current)
+        try:
+            yield current
+        finally:
+            self._close(current)
+
+    def _close(self, current):
+        current.end = time.perf_counter_ns()
+        if self.memory:
+            current.peak_memory = max(current.peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        else:
+            current.peak_memory = max_rss()
+        self.stack.remove(current)
+        if self.stack:
+            parent = self.stack[-1]
+            parent.bytes_read += current.bytes_read
+            parent.bytes_written += current.bytes_written
+            parent.peak_memory = max(parent.peak_memory, current.peak_memory)
+
+    def count_read(self, size):
+        if self.stack:
+            self.stack[-1].bytes_read += size
+
+    def count_written(self, size):
+        if self.stack:
+            self.stack[-1].bytes_written += size
+
+    # MARK: - 내보내기
+
+    def chrome_trace(self):
+        """
+        Chrome trace-event 형식 딕셔너리 (단위: 마이크로초)
+        """
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "hogumeter"}}]
+        for p in self.phases:
+            args = dict(p.args)
+            args.update(bytes_read=p.bytes_read, bytes_written=p.bytes_written, peak_memory_kb=p.peak_memory // 1024)
+            events.append({
+                "name": p.name,
+                "cat": p.path.split("/", 1)[0],
+                "ph": "X",
+                "ts": (p.start - self.origin) / 1000,
+                "dur": p.duration / 1000,
+                "pid": pid,
+                "tid": 0,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+    def summary_rows(self):
+        """
+        같은 경로의 단계를 합친 요약 (처음 나온 순서, 트리 형태)
+
+        Returns:
+            [{"path", "name", "depth", "count", "total", "self", "bytes_read", "bytes_written", "peak_memory"}]
+            (total/self 는 나노초)
+        """
+        rows = {}
+        for p in self.phases:
+            row = rows.get(p.path)
+            if row is None:
+                row = rows[p.path] = {
+                    "path": p.path, "name": p.name, "depth": p.depth, "count": 0, "total": 0, "self": 0,
+                    "bytes_read": 0, "bytes_written": 0, "peak_memory": 0,
+                }
+            row["count"] += 1
+            row["total"] += p.duration
+            row["self"] += p.duration
+            row["bytes_read"] += p.bytes_read
+            row["bytes_written"] += p.bytes_written
+            row["peak_memory"] = max(row["peak_memory"], p.peak_memory)
+        for p in self.phases:
+            parent_path = p.path.rpartition("/")[0]
+            if parent_path in rows:
+                rows[parent_path]["self"] -= p.duration
+
+        # 부모 바로 아래에 자식이 오도록 정렬
+        ordered = []
+
+        def visit(prefix, depth):
+            for row in rows.values():
+                if row["depth"] == depth and row["path"].rpartition("/")[0] == prefix:
+                    ordered.append(row)
+                    visit(row["path"], depth + 1)
+
+        visit("", 0)
+        return ordered
+
+    def print_summary(self, file=None):
+        file = file or sys.stdout
+        rows = self.summary_rows()
+        total = sum(row["total"] for row in rows if row["depth"] == 0) or 1
+
+        print("\n" + "=" * 100, file=file)
+        print("⏱️  프로파일 요약", file=file)
+        print("=" * 100, file=file)
+        print(f"{'단계':<36} {'횟수':>6} {'합계(ms)':>10} {'자체(ms)':>10} {'비율':>7} "
+              f"{'읽기':>9} {'쓰기':>9} {'최대 메모리':>11}", file=file)
+        print("-" * 100, file=file)
+        for row in rows:
+            label = "  " * row["depth"] + row["name"]
+            if len(label) > 36:
+                label = label[:35] + "…"
+            print(f"{label:<36} {row['count']:>6} {row['total'] / 1e6:>10.2f} {row['self'] / 1e6:>10.2f} "
+                  f"{row['total'] / total:>7.1%} {format_bytes(row['bytes_read']):>9} "
+                  f"{format_bytes(row['bytes_written']):>9} {format_bytes(row['peak_memory']):>11}", file=file)
+        print("-" * 100, file=file)
+        if self.memory:
+            print("최대 메모리: 단계 중 Python 힙 최대치 (tracemalloc)", file=file)
+        else:
+            print("최대 메모리: 단계 종료 시점까지의 프로세스 최대 RSS", file=file)
+
+
+def format_bytes(size):
+    if size == 0:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def max_rss():
+    """
+    프로세스 최대 상주 메모리 (바이트, 알 수 없으면 0)
+    """
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+# MARK: - 모듈 수준 API
+
+PROFILER = Profiler()
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def phase(name, **args):
+    """
+    단계 기록 컨텍스트 (프로파일링이 꺼져 있으면 아무 일도 하지 않음)
+    """
+    if not PROFILER.enabled:
+        return _NULL_PHASE
+    return PROFILER.phase(name, **args)
+
+
+def count_read(size):
+    if PROFILER.enabled:
+        PROFILER.count_read(size)
+
+
+def count_written(size):
+    if PROFILER.enabled:
+        PROFILER.count_written(size)
+
+
+class _ProfileFlag(argparse.Action):
+    """
+    --profile: 값을 받지 않는 플래그 (--profile-trace 로 이미 경로가 정해졌으면 유지)
+
+    nargs="?" 로 경로를 받으면 하위 명령을 쓰는 파서(hogu.py)에서 다음 토큰을
+    경로로 삼켜 버리므로, 경로는 --profile-trace 로 따로 받습니다.
+    """
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        if getattr(namespace, self.dest, None) is None:
+            setattr(namespace, self.dest, "")
+
+
+def add_profile_argument(parser):
+    """
+    argparse 파서에 --profile, --profile-trace TRACE.json, --profile-memory 옵션 추가
+
+    두 옵션 모두 args.profile 에 기록되며 session() 에 그대로 넘기면 됩니다
+    (None: 비활성, "": 요약만, 경로: Chrome trace 도 저장).
+    """
+    parser.add_argument(
+        "--profile", action=_ProfileFlag, default=None,
+        help="단계별 시간/바이트/메모리 요약 출력",
+    )
+    parser.add_argument(
+        "--profile-trace", dest="profile", metavar="TRACE.json",
+        help="--profile 요약과 함께 Chrome trace JSON 저장",
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="--profile 에서 tracemalloc 으로 단계별 Python 힙 최대치 측정 (실행이 느려짐)",
+    )
+
+
+@contextlib.contextmanager
+def session(profile, name=None, memory=False):
+    """
+    --profile / --profile-trace 값(args.profile)에 따라 프로파일링을 켜고, 끝나면 요약 표와 trace 를 출력
+
+    Args:
+        profile: None 이면 비활성, "" 이면 요약만 (--profile), 경로면 Chrome trace JSON 도 저장 (--profile-trace)
+        name: 전체 실행을 감쌀 최상위 단계 이름
+        memory: tracemalloc 으로 단계별 Python 힙 최대치 측정
+
+    이미 바깥 세션이 켜져 있으면 (예: hogu.py --profile batch) 새 세션을 열지 않고
+    바깥 세션의 단계로 기록합니다.
+    """
+    if profile is None or PROFILER.enabled:
+        with phase(name) if name else _NULL_PHASE:
+            yield
+        return
+
+    PROFILER.start(memory)
+    try:
+        with PROFILER.phase(name) if name else _NULL_PHASE:
+            yield
+    finally:
+        PROFILER.stop()
+        PROFILER.print_summary()
+        if profile:
+            PROFILER.write_chrome_trace(profile)
+            print(f"📈 Chrome trace 저장: {profile}")
@@ -0,0 +1,833 @@
+#!/usr/bin/env python3
+"""
+영수증 템플릿 미리보기 일괄 렌더러
+TemplateReceiptGenerator.swift 의 5가지 템플릿(SPEC_RECEIPT_TEMPLATES.md)을 Pillow 로 옮겨
+주행 기록 데이터셋 전체를 템플릿별로 그리고, 한눈에 비교할 수 있는 미리보기 시트를 만듭니다.
+시뮬레이터 없이 요금/경로/기사 한마디 조합 수천 건에서 템플릿 디자인 변경을 검토할 수 있습니다.
+
+- 좌표는 Swift 코드와 같은 포인트 단위로 계산하고 --scale 배율로 픽셀에 그립니다
+- 지도 스냅샷은 오프라인에서 만들 수 없으므로 앱의 폴백(drawRoutePath)으로 경로를 그립니다
+- 폰트 로딩, 텍스트 측정(NSString.size), 이모지 비트맵은 프로세스별 캐시를 사용합니다
+- 시트 한 장(주행 기록 N건 × 템플릿)이 프로세스 풀의 작업 단위입니다
+- 내용이 영수증 높이를 넘거나 글자가 겹치는 경우를 찾아 시트에 빨간 테두리로 표시합니다
+
+입력:
+- 기본: trip_history_gen.py 와 같은 생성기로 만든 합성 주행 기록 --count 건
+- --dataset DIR: trip_history_gen.py 출력 (summaries.json + Routes/*.route.gz)
+
+출력 (기본 build/receipt_previews/):
+- sheet_0001.png ...  행 = 주행 기록, 열 = 템플릿
+- index.json          시트별 주행 기록 ID, 요금, 레이아웃 경고
+- receipts/<템플릿>/<ID>.png (--individual) 영수증 한 장씩
+"""
+
+import argparse
+import functools
+import glob
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from PIL import Image, ImageDraw, ImageFont
+
+import profiling
+import route_traces
+import trip_history_gen
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "build", "receipt_previews")
+
+# 한글 글꼴 후보 (앞에서부터 처음 찾은 글꼴 가족을 사용)
+FONT_CANDIDATES = [
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",                 # macOS
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",      # Linux (fonts-noto-cjk)
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",             # Linux (fonts-nanum)
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",             # 한글 없음 (□ 로 표시)
+]
+
+# 컬러 이모지 글꼴 후보 (비트맵 글꼴이라 고정 크기로만 로드 가능)
+EMOJI_CANDIDATES = [
+    ("/System/Library/Fonts/Apple Color Emoji.ttc", 160),
+    ("/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf", 109),
+]
+
+# UIFont 굵기 → 글꼴 스타일 이름 선호 순서
+WEIGHT_STYLES = {
+    "regular": ("Regular", "Book", "Medium"),
+    "light": ("Light", "UltraLight", "Thin", "Regular", "Book"),
+    "medium": ("Medium", "SemiBold", "Regular", "Book"),
+    "bold": ("Bold", "SemiBold", "ExtraBold", "Heavy"),
+    "italic": ("Italic", "Oblique", "Regular", "Book"),
+}
+
+# SF Pro 의 줄 높이/어센더 비율 (NSString.size 높이와 같게 맞춰 글꼴과 무관하게 레이아웃 고정)
+LINE_HEIGHT = 1.193
+ASCENDER = 0.952
+
+RECEIPT_WIDTH = 320
+PADDING = 20
+
+
+# MARK: - 색상 (ReceiptColorScheme)
+
+def white(w, alpha=1.0):
+    value = round(w * 255)
+    return (value, value, value, round(alpha * 255))
+
+
+def rgb(r, g, b, alpha=1.0):
+    return (round(r * 255), round(g * 255), round(b * 255), round(alpha * 255))
+
+
+def with_alpha(color, alpha):
+    return color[:3] + (round(alpha * 255),)
+
+
+SYSTEM_BLUE = (0, 122, 255, 255)
+SYSTEM_ORANGE = (255, 149, 0, 255)
+SYSTEM_GREEN = (52, 199, 89, 255)
+SYSTEM_RED = (255, 59, 48, 255)
+WHITE = white(1.0)
+BLACK = white(0.0)
+
+ColorScheme = namedtuple("ColorScheme", "background primary secondary accent divider highlight")
+
+SCHEMES = {
+    "classic": ColorScheme(WHITE, BLACK, white(0.5), SYSTEM_BLUE, white(2 / 3), with_alpha(SYSTEM_BLUE, 0.1)),
+    "modern": ColorScheme(white(0.98), white(0.15), white(0.5), white(0.2), white(0.85), white(0.95)),
+    "fun": ColorScheme(
+        rgb(1, 0.98, 0.9), rgb(0.2, 0.1, 0), rgb(0.5, 0.4, 0.2), SYSTEM_ORANGE,
+        rgb(0.9, 0.85, 0.7), with_alpha(SYSTEM_ORANGE, 0.15),
+    ),
+    "minimal": ColorScheme(WHITE, BLACK, white(0.4), BLACK, white(0.9), white(0.95)),
+    "premium": ColorScheme(
+        rgb(0.05, 0.05, 0.08), rgb(0.95, 0.85, 0.55), rgb(0.7, 0.65, 0.5), rgb(1, 0.84, 0),
+        rgb(0.3, 0.28, 0.2), rgb(0.15, 0.14, 0.1),
+    ),
+}
+
+TEMPLATE_NAMES = {"classic": "클래식", "modern": "모던", "fun": "재미", "minimal": "심플", "premium": "프리미엄"}
+
+
+# MARK: - 폰트 / 텍스트 측정 캐시
+
+@functools.lru_cache(maxsize=None)
+def font_faces():
+    """
+    사용할 글꼴 가족의 {스타일 이름: (경로, 인덱스)}
+
+    .ttc 는 모든 face 를, 단일 파일은 같은 디렉토리의 같은 가족 파일(예: NanumGothicBold.ttf)을 봅니다.
+    """
+    for candidate in FONT_CANDIDATES:
+        if not os.path.exists(candidate):
+            continue
+        faces = {}
+        if candidate.endswith(".ttc"):
+            sources = [candidate]
+        else:
+            stem = os.path.splitext(os.path.basename(candidate))[0]
+            sources = sorted(glob.glob(os.path.join(os.path.dirname(candidate), stem + "*")))
+        for path in sources:
+            index = 0
+            while True:
+                try:
+                    face = ImageFont.truetype(path, 12, index=index)
+                except OSError:
+                    break
+                faces.setdefault(face.getname()[1], (path, index))
+                index += 1
+                if not path.endswith(".ttc"):
+                    break
+        if faces:
+            return faces
+    return {}
+
+
+@functools.lru_cache(maxsize=None)
+def font(weight, size_px):
+    """
+    굵기와 픽셀 크기에 맞는 글꼴 (없으면 Pillow 기본 글꼴)
+    """
+    faces = font_faces()
+    for style in WEIGHT_STYLES[weight] + WEIGHT_STYLES["regular"]:
+        if style in faces:
+            path, index = faces[style]
+            return ImageFont.truetype(path, size_px, index=index)
+    if faces:
+        path, index = next(iter(faces.values()))
+        return ImageFont.truetype(path, size_px, index=index)
+    return ImageFont.load_default(size_px)
+
+
+@functools.lru_cache(maxsize=None)
+def emoji_font():
+    """
+    (컬러 이모지 글꼴, 고정 크기) 또는 None
+    """
+    for path, native_size in EMOJI_CANDIDATES:
+        try:
+            return ImageFont.truetype(path, native_size), native_size
+        except OSError:
+            continue
+    return None
+
+
+def is_emoji(ch):
+    code = ord(ch)
+    return (0x1F000 <= code <= 0x1FAFF or 0x2600 <= code <= 0x27BF or 0x2300 <= code <= 0x23FF
+            or code in (0xFE0F, 0x200D))
+
+
+@functools.lru_cache(maxsize=4096)
+def text_runs(text):
+    """
+    글자/이모지 구간으로 나눈 (이모지 여부, 문자열) 튜플
+    """
+    runs = []
+    for ch in text:
+        emoji = is_emoji(ch) and emoji_font() is not None
+        if runs and runs[-1][0] == emoji:
+            runs[-1] = (emoji, runs[-1][1] + ch)
+        else:
+            runs.append((emoji, ch))
+    return tuple(runs)
+
+
+@functools.lru_cache(maxsize=1024)
+def emoji_image(run, size, scale):
+    """
+    이모지 구간을 줄 높이에 맞춰 축소한 RGBA 비트맵
+    """
+    face, native_size = emoji_font()
+    width = max(1, round(face.getlength(run)))
+    height = round(native_size * LINE_HEIGHT)
+    image = Image.new("RGBA", (width, height))
+    ImageDraw.Draw(image).text((0, 0), run, font=face, embedded_color=True)
+    target_height = max(1, round(size * LINE_HEIGHT * scale))
+    target_width = max(1, round(width * target_height / height))
+    return image.resize((target_width, target_height), Image.LANCZOS)
+
+
+@functools.lru_cache(maxsize=65536)
+def measure(text, weight, size, scale):
+    """
+    NSString.size(withAttributes:) 와 같은 텍스트 크기 (포인트)
+    """
+    width_px = 0.0
+    for emoji, run in text_runs(text):
+        if emoji:
+            width_px += emoji_image(run, size, scale).width
+        else:
+            width_px += font(weight, max(1, round(size * scale))).getlength(run)
+    return width_px / scale, size * LINE_HEIGHT
+
+
+def cache_stats():
+    info = measure.cache_info()
+    return info.hits, info.misses
+
+
+# MARK: - 캔버스 (CGContext 대응)
+
+class Canvas:
+    """
+    포인트 좌표로 그리고 scale 배율의 픽셀로 기록하는 그리기 대상
+    """
+
+    def __init__(self, width, height, scale, background):
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.image = Image.new("RGB", (round(width * scale), round(height * scale)), background[:3])
+        self.draw = ImageDraw.Draw(self.image, "RGBA")
+        self.warnings = []
+
+    def px(self, value):
+        return round(value * self.scale)
+
+    def fill_rect(self, x, y, width, height, color):
+        self.draw.rectangle(
+            [self.px(x), self.px(y), self.px(x + width) - 1, self.px(y + height) - 1], fill=color,
+        )
+
+    def stroke_rect(self, x, y, width, height, color, line_width=1):
+        self.draw.rectangle(
+            [self.px(x), self.px(y), self.px(x + width) - 1, self.px(y + height) - 1],
+            outline=color, width=max(1, self.px(line_width)),
+        )
+
+    def line(self, x1, y1, x2, y2, color, line_width, dash=None):
+        width = max(1, self.px(line_width))
+        if not dash:
+            self.draw.line([(self.px(x1), self.px(y1)), (self.px(x2), self.px(y2))], fill=color, width=width)
+            return
+        # 수평 점선 (구분선 전용)
+        on, off = dash
+        x = x1
+        while x < x2:
+            end = min(x + on, x2)
+            self.draw.line([(self.px(x), self.px(y1)), (self.px(end), self.px(y1))], fill=color, width=width)
+            x = end + off
+
+    def polyline(self, points, color, line_width):
+        """
+        둥근 끝/이음 처리를 한 꺾은선
+        """
+        width = max(1, self.px(line_width))
+        pixels = [(self.px(x), self.px(y)) for x, y in points]
+        self.draw.line(pixels, fill=color, width=width, joint="curve")
+        radius = width / 2
+        for x, y in (pixels[0], pixels[-1]):
+            self.draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=color)
+
+    def fill_circle(self, cx, cy, radius, color):
+        self.draw.ellipse(
+            [self.px(cx - radius), self.px(cy - radius), self.px(cx + radius), self.px(cy + radius)], fill=color,
+        )
+
+    def text_size(self, text, style):
+        weight, size = style
+        return measure(text, weight, size, self.scale)
+
+    def text(self, x, y, text, style, color=BLACK):
+        """
+        (x, y) 를 줄 상자의 왼쪽 위로 하여 텍스트를 그림 (NSString.draw(at:))
+        """
+        weight, size = style
+        cursor = x * self.scale
+        baseline = self.px(y + size * ASCENDER)
+        for emoji, run in text_runs(text):
+            if emoji:
+                image = emoji_image(run, size, self.scale)
+                self.image.paste(image, (round(cursor), self.px(y)), image)
+                cursor += image.width
+            else:
+                face = font(weight, max(1, round(size * self.scale)))
+                self.draw.text((cursor, baseline), run, font=face, fill=color, anchor="ls")
+                cursor += face.getlength(run)
+        if cursor / self.scale > self.width + 0.5 or x < -0.5:
+            self.warn("text-clipped", text)
+
+    def text_centered(self, y, text, style, color=BLACK):
+        width, height = self.text_size(text, style)
+        self.text((self.width - width) / 2, y, text, style, color)
+        return width, height
+
+    def warn(self, kind, detail):
+        self.warnings.append((kind, detail))
+
+
+# MARK: - 형식 (Swift 포매터 대응)
+
+def formatted_with_comma(value):
+    return f"{int(value):,}"
+
+
+def format_duration(duration):
+    total = int(duration)
+    hours, minutes, seconds = total // 3600, (total % 3600) // 60, total % 60
+    if hours > 0:
+        return f"{hours}시간 {minutes}분 {seconds}초"
+    if minutes > 0:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+
+def trip_datetime(reference_seconds):
+    """
+    Swift Date(timeIntervalSinceReferenceDate:) → 한국 시간
+    """
+    return (route_traces.REFERENCE_DATE + timedelta(seconds=reference_seconds)).astimezone(trip_history_gen.KST)
+
+
+def medium_date(moment):
+    """
+    DateFormatter.dateStyle = .medium, ko_KR (예: 2026. 1. 5.)
+    """
+    return f"{moment.year}. {moment.month}. {moment.day}."
+
+
+# MARK: - 템플릿 (TemplateReceiptGenerator 포팅)
+
+def draw_header(c, colors, y, emoji, title, subtitle, emoji_size=40, title_size=22, bold=True):
+    if emoji:
+        _, height = c.text_centered(y, emoji, ("regular", emoji_size))
+        y += height + 8
+    _, height = c.text_centered(y, title, ("bold" if bold else "light", title_size), colors.primary)
+    y += height + 4
+    if subtitle:
+        _, height = c.text_centered(y, subtitle, ("regular", 11), colors.secondary)
+        y += height
+    return y + 10
+
+
+def draw_premium_header(c, colors, y):
+    _, height = c.text_centered(y, "👑", ("regular", 36))
+    y += height + 8
+    _, height = c.text_centered(y, "HOGUMETER", ("bold", 22), colors.accent)
+    y += height + 4
+    _, height = c.text_centered(y, "PREMIUM RECEIPT", ("medium", 10), colors.secondary)
+    return y + height + 10
+
+
+def draw_divider(c, colors, y, thickness=0.5, dashed=False):
+    c.line(PADDING, y + 10, c.width - PADDING, y + 10, colors.divider, thickness, dash=(4, 4) if dashed else None)
+    return y + 20
+
+
+def draw_route_map(c, trip, colors, y):
+    """
+    지도 스냅샷이 없을 때의 폴백: 강조 배경 + 경로 + 출발/도착 마커
+    """
+    map_width = c.width - PADDING * 2
+    map_height = 120
+    c.fill_rect(PADDING, y, map_width, map_height, colors.highlight)
+    c.stroke_rect(PADDING, y, map_width, map_height, colors.divider)
+
+    points = trip["routePoints"]
+    if len(points) < 2:
+        text = "경로 정보 없음"
+        width, height = c.text_size(text, ("regular", 12))
+        c.text(PADDING + (map_width - width) / 2, y + (map_height - height) / 2, text, ("regular", 12), colors.secondary)
+        return y + map_height + 10
+
+    draw_route_path(c, points, (PADDING, y, map_width, map_height), colors)
+    c.text(PADDING + 5, y + 5, "주행 경로", ("bold", 10), colors.secondary)
+    return y + map_height + 10
+
+
+def draw_route_path(c, points, rect, colors):
+    min_x, min_y, width, height = rect
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+    lat_range = max(max(lats) - min(lats), 0.001) * 1.2
+    lon_range = max(max(lons) - min(lons), 0.001) * 1.2
+    center_lat = (min(lats) + max(lats)) / 2
+    center_lon = (min(lons) + max(lons)) / 2
+
+    def to_screen(lat, lon):
+        x = min_x + 10 + ((lon - (center_lon - lon_range / 2)) / lon_range) * (width - 20)
+        y = min_y + height - 10 - ((lat - (center_lat - lat_range / 2)) / lat_range) * (height - 20)
+        return x, y
+
+    screen = [to_screen(lat, lon) for lat, lon in points]
+    c.polyline(screen, colors.accent, 3)
+    c.fill_circle(*screen[0], 5, SYSTEM_GREEN)
+    c.fill_circle(*screen[-1], 5, SYSTEM_RED)
+
+
+def draw_row(c, label, value, colors, y):
+    label_width, _ = c.text_size(label, ("regular", 13))
+    value_width, _ = c.text_size(value, ("medium", 13))
+    c.text(PADDING, y, label, ("regular", 13), colors.secondary)
+    c.text(c.width - PADDING - value_width, y, value, ("medium", 13), colors.primary)
+    if PADDING + label_width + 4 > c.width - PADDING - value_width:
+        c.warn("row-overlap", f"{label} / {value}")
+    return y + 20
+
+
+def draw_time_info(c, trip, colors, y, fun=False):
+    start = trip_datetime(trip["startTime"])
+    end = trip_datetime(trip["endTime"])
+    labels = ("🚦 출발", "🏁 도착", "📅 날짜", "⏱️ 소요") if fun else ("출발", "도착", "날짜", "소요")
+    values = (f"{start:%H:%M}", f"{end:%H:%M}", medium_date(start), format_duration(trip["duration"]))
+    for label, value in zip(labels, values):
+        y = draw_row(c, label, value, colors, y)
+    return y
+
+
+def draw_fare_breakdown(c, trip, colors, y, fun=False):
+    c.text(PADDING, y, "💸 요금 내역" if fun else "요금 내역", ("bold", 14), colors.primary)
+    y += 22
+
+    breakdown = trip["fareBreakdown"]
+    icons = ("🚖 ", "📏 ", "⏰ ", "📍 ", "🌙 ") if fun else ("",) * 5
+    y = draw_row(c, f"{icons[0]}기본요금 (2km)", f"{formatted_with_comma(breakdown['baseFare'])}원", colors, y)
+    if breakdown["distanceFare"] > 0:
+        y = draw_row(c, f"{icons[1]}거리요금 ({trip['distance']:.1f}km)",
+                     f"{formatted_with_comma(breakdown['distanceFare'])}원", colors, y)
+    if breakdown["timeFare"] > 0:
+        y = draw_row(c, f"{icons[2]}시간요금", f"{formatted_with_comma(breakdown['timeFare'])}원", colors, y)
+    if breakdown["regionSurcharge"] > 0:
+        if trip.get("surchargeMode") == "realistic":
+            detail = f"{int(trip.get('surchargeRate', 0) * 100)}%"
+        else:
+            detail = f"{trip.get('regionChanges', 0)}회"
+        y = draw_row(c, f"{icons[3]}지역할증 ({detail})",
+                     f"{formatted_with_comma(breakdown['regionSurcharge'])}원", colors, y)
+    if breakdown["nightSurcharge"] > 0:
+        y = draw_row(c, f"{icons[4]}야간할증 (20%)",
+                     f"{formatted_with_comma(breakdown['nightSurcharge'])}원", colors, y)
+    return y
+
+
+def draw_total(c, trip, colors, y, prefix=""):
+    c.fill_rect(PADDING, y, c.width - PADDING * 2, 40, colors.highlight)
+    c.text(PADDING + 12, y + 10, f"{prefix}총 요금", ("bold", 16), colors.primary)
+    value = f"{formatted_with_comma(trip['totalFare'])}원"
+    value_width, _ = c.text_size(value, ("bold", 18))
+    c.text(c.width - PADDING - 12 - value_width, y + 9, value, ("bold", 18), colors.primary)
+    return y + 50
+
+
+def draw_slogan(c, trip, colors, y, main_emoji, slogan, subtitle_only=False):
+    quote = trip.get("driverQuote")
+    if quote:
+        _, height = c.text_centered(y, f'🚕 "{quote}"', ("italic", 11), colors.secondary)
+        y += height + 10
+    if main_emoji:
+        _, height = c.text_centered(y, main_emoji, ("regular", 24))
+        y += height + 6
+    if not subtitle_only:
+        _, height = c.text_centered(y, slogan, ("bold", 14), colors.primary)
+        y += height + 4
+    thanks = slogan if subtitle_only else "Thank you for using HoguMeter"
+    _, height = c.text_centered(y, thanks, ("regular", 10), colors.secondary)
+    return y + height
+
+
+def draw_standard(c, trip, colors, y, template):
+    """
+    클래식 / 모던 / 재미 / 프리미엄 (헤더·구분선·슬로건만 다르고 본문 구성은 같음)
+    """
+    fun = template == "fun"
+    dashed = fun
+    if template == "classic":
+        y = draw_header(c, colors, y, "🏇", "호구미터", "TAXI FARE RECEIPT")
+        y = draw_divider(c, colors, y)
+    elif template == "modern":
+        y = draw_header(c, colors, y, None, "HOGUMETER", None, title_size=24, bold=False)
+        y += 10
+        y = draw_divider(c, colors, y, thickness=2)
+    elif template == "fun":
+        y = draw_header(c, colors, y, "🏇💨", "호구미터", "택시비 폭탄 영수증 💣", emoji_size=50)
+        y = draw_divider(c, colors, y, dashed=True)
+    else:
+        y = draw_premium_header(c, colors, y)
+        y = draw_divider(c, colors, y)
+
+    if trip["routePoints"]:
+        y = draw_route_map(c, trip, colors, y)
+        y = draw_divider(c, colors, y, dashed=dashed)
+
+    y = draw_time_info(c, trip, colors, y, fun=fun)
+    y = draw_divider(c, colors, y, dashed=dashed)
+    y = draw_fare_breakdown(c, trip, colors, y, fun=fun)
+    y = draw_divider(c, colors, y, dashed=dashed)
+    y = draw_total(c, trip, colors, y, prefix="💰 " if fun else "")
+    y = draw_divider(c, colors, y, dashed=dashed)
+
+    if template == "classic":
+        return draw_slogan(c, trip, colors, y, "🚖", "내 차 탔으면 내놔")
+    if template == "modern":
+        return draw_slogan(c, trip, colors, y, None, "Thank you", subtitle_only=True)
+    if template == "fun":
+        return draw_slogan(c, trip, colors, y, "🚕💨", "내 차 탔으면 내놔! 😤")
+    return draw_slogan(c, trip, colors, y, "👑", "Premium Ride")
+
+
+def draw_minimal(c, trip, colors, y):
+    _, height = c.text_centered(y, "HoguMeter", ("light", 18), colors.primary)
+    y += height + 30
+    start = trip_datetime(trip["startTime"])
+    _, height = c.text_centered(y, f"{start:%Y.%m.%d %H:%M}", ("regular", 12), colors.secondary)
+    y += height + 40
+    _, height = c.text_centered(y, f"{formatted_with_comma(trip['totalFare'])}원", ("bold", 48), colors.primary)
+    y += height + 20
+    summary = f"{trip['distance']:.1f}km · {format_duration(trip['duration'])}"
+    _, height = c.text_centered(y, summary, ("regular", 14), colors.secondary)
+    y += height + 10
+    _, height = c.text_centered(y, f"{trip['startRegion']} → {trip['endRegion']}", ("regular", 14), colors.secondary)
+    return y + height + 40
+
+
+def render_receipt(trip, template, scale):
+    """
+    TemplateReceiptGenerator.generate 와 같은 크기/레이아웃의 영수증 이미지
+
+    Returns:
+        (PIL.Image, 경고 [(종류, 내용)])
+    """
+    colors = SCHEMES[template]
+    route_height = 140 if trip["routePoints"] else 0
+    quote_height = 25 if trip.get("driverQuote") else 0
+    height = (380 if template == "minimal" else 520) + route_height + quote_height
+
+    c = Canvas(RECEIPT_WIDTH, height, scale, colors.background)
+    if template == "minimal":
+        bottom = draw_minimal(c, trip, colors, PADDING)
+    else:
+        bottom = draw_standard(c, trip, colors, PADDING, template)
+    if bottom > height:
+        c.warn("overflow", f"내용 {bottom:.0f}pt > 높이 {height}pt")
+    return c.image, c.warnings
+
+
+# MARK: - 데이터셋
+
+def synthetic_trips(count, seed):
+    """
+    trip_history_gen 의 생성기로 만든 주행 기록 (경로는 워커에서 시드로 생성)
+
+    빈 경로(10건마다)와 포인트 1개 경로(25건마다) 같은 엣지 케이스를 섞습니다.
+    """
+    rng = random.Random(seed)
+    fares = trip_history_gen.load_region_fares()
+    quotes = trip_history_gen.load_driver_quotes()
+    end = datetime(2026, 1, 1, tzinfo=trip_history_gen.KST) + timedelta(days=rng.randrange(365))
+    trips = []
+    for index, start in enumerate(trip_history_gen.trip_starts(rng, count, end, 3.0)):
+        summary, code = trip_history_gen.generate_trip(rng, start, fares, quotes)
+        summary["regionCode"] = code
+        summary["routeSeed"] = rng.getrandbits(32)
+        if index % 10 == 9:
+            summary["routeSeed"] = None
+        elif index % 25 == 12:
+            summary["singlePoint"] = True
+        trips.append(summary)
+    return trips
+
+
+def dataset_trips(directory, count):
+    """
+    trip_history_gen.py 출력에서 최신 count 건 (경로 파일은 워커에서 로드)
+    """
+    with open(os.path.join(directory, "summaries.json"), 'r', encoding='utf-8') as f:
+        summaries = json.load(f)[:count]
+        profiling.count_read(f.tell())
+    for summary in summaries:
+        path = os.path.join(directory, "Routes", f"{summary['id']}.route.gz")
+        summary["routePath"] = path if summary.get("hasRouteData") and os.path.exists(path) else None
+    return summaries
+
+
+def resolve_route(trip):
+    """
+    주행 기록의 경로를 [(lat, lon)] 으로 채움
+    """
+    if "routePoints" in trip:
+        points = trip["routePoints"]
+        if points and isinstance(points[0], dict):
+            trip["routePoints"] = [(p["latitude"], p["longitude"]) for p in points]
+        return trip
+    points = []
+    if trip.get("routePath"):
+        trace = route_traces.load_trace(trip["routePath"])
+        points = list(zip(trace["latitude"], trace["longitude"]))
+    elif trip.get("routeSeed") is not None:
+        generated = trip_history_gen.generate_route(trip["routeSeed"], trip, trip["regionCode"])
+        points = [(p["latitude"], p["longitude"]) for p in generated]
+        if trip.get("singlePoint"):
+            points = points[:1]
+    trip["routePoints"] = points
+    return trip
+
+
+# MARK: - 시트 렌더링 (워커)
+
+SHEET_GAP = 16
+CAPTION_SIZE = 11
+SHEET_BACKGROUND = (228, 228, 232)
+WARNING_COLOR = (255, 59, 48)
+
+
+def init_worker():
+    # 글꼴 탐색은 워커마다 한 번
+    font_faces()
+    emoji_font()
+
+
+def render_sheet(job):
+    """
+    주행 기록 N건 × 템플릿 시트 한 장을 그려 저장
+
+    Returns:
+        {"sheet", "path", "trips", "receipts", "warnings", "cache", "elapsed"}
+    """
+    started = time.perf_counter()
+    hits_before, misses_before = cache_stats()
+    scale = job["scale"]
+    templates = job["templates"]
+    cell_width = round(RECEIPT_WIDTH * scale)
+    caption_height = round(CAPTION_SIZE * LINE_HEIGHT * scale) + 6
+
+    rows = []
+    warnings = []
+    for trip in job["trips"]:
+        resolve_route(trip)
+        images = []
+        for template in templates:
+            image, receipt_warnings = render_receipt(trip, template, scale)
+            images.append((image, bool(receipt_warnings)))
+            for kind, detail in receipt_warnings:
+                warnings.append({"trip": trip["id"], "template": template, "kind": kind, "detail": detail})
+            if job["individual"]:
+                directory = os.path.join(job["output"], "receipts", template)
+                os.makedirs(directory, exist_ok=True)
+                image.save(os.path.join(directory, f"{trip['id']}.png"), optimize=False)
+        rows.append((trip, images))
+
+    header_height = round(16 * LINE_HEIGHT * scale) + SHEET_GAP
+    sheet_width = SHEET_GAP + len(templates) * (cell_width + SHEET_GAP)
+    sheet_height = header_height + sum(
+        caption_height + max(image.height for image, _ in images) + SHEET_GAP for _, images in rows
+    ) + SHEET_GAP
+    sheet = Canvas(sheet_width / scale, sheet_height / scale, scale, SHEET_BACKGROUND)
+    for column, template in enumerate(templates):
+        x = (SHEET_GAP + column * (cell_width + SHEET_GAP)) / scale
+        sheet.text(x, SHEET_GAP / scale / 2, f"{TEMPLATE_NAMES[template]} ({template})", ("bold", 16), BLACK)
+
+    y = header_height
+    for trip, images in rows:
+        route = len(trip["routePoints"])
+        caption = (f"{trip['id'][:8]}  {formatted_with_comma(trip['totalFare'])}원  "
+                   f"{trip['distance']:.1f}km  경로 {route}pt" + ("  한마디" if trip.get("driverQuote") else ""))
+        sheet.text(SHEET_GAP / scale, y / scale, caption, ("regular", CAPTION_SIZE), white(0.3))
+        y += caption_height
+        for column, (image, warned) in enumerate(images):
+            x = SHEET_GAP + column * (cell_width + SHEET_GAP)
+            sheet.image.paste(image, (x, y))
+            if warned:
+                sheet.draw.rectangle([x - 3, y - 3, x + image.width + 2, y + image.height + 2],
+                                     outline=WARNING_COLOR, width=3)
+        y += max(image.height for image, _ in images) + SHEET_GAP
+
+    path = os.path.join(job["output"], f"sheet_{job['sheet']:04d}.png")
+    sheet.image.save(path, optimize=False)
+    hits_after, misses_after = cache_stats()
+    return {
+        "sheet": job["sheet"],
+        "path": path,
+        "trips": [{"id": trip["id"], "totalFare": trip["totalFare"], "routePoints": len(trip["routePoints"])}
+                  for trip, _ in rows],
+        "receipts": len(rows) * len(templates),
+        "warnings": warnings,
+        "bytes": os.path.getsize(path),
+        "cache": (hits_after - hits_before, misses_after - misses_before),
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+# MARK: - 실행
+
+def run(args):
+    templates = [name.strip() for name in args.templates.split(",")] if args.templates else list(SCHEMES)
+    unknown = [name for name in templates if name not in SCHEMES]
+    if unknown:
+        print(f"❌ 오류: 알 수 없는 템플릿 {', '.join(unknown)} (사용 가능: {', '.join(SCHEMES)})")
+        return 1
+    if args.count <= 0 or args.rows <= 0:
+        print("❌ 오류: --count 와 --rows 는 1 이상이어야 합니다")
+        return 1
+
+    output = args.output or DEFAULT_OUTPUT
+    os.makedirs(output, exist_ok=True)
+    for stale in glob.glob(os.path.join(output, "sheet_*.png")):
+        os.remove(stale)
+
+    print("=" * 60)
+    print("🧾 영수증 템플릿 미리보기 렌더링")
+    print("=" * 60)
+
+    # 요금표/기사 어록/데이터셋을 읽지 못하면 트레이스백 대신 원인만 출력
+    try:
+        with profiling.phase("load"):
+            if args.dataset:
+                trips = dataset_trips(args.dataset, args.count)
+                source = args.dataset
+            else:
+                trips = synthetic_trips(args.count, args.seed)
+                source = f"합성 (시드 {args.seed})"
+    except (OSError, ValueError) as e:
+        print(f"❌ 오류: 주행 기록을 불러올 수 없습니다: {e}")
+        return 1
+    print(f"주행 기록: {len(trips):,}건 ({source})")
+    print(f"템플릿: {', '.join(templates)} / 배율 @{args.scale:g}x / 시트당 {args.rows}건")
+    if not font_faces():
+        print("⚠️  한글 글꼴을 찾지 못해 Pillow 기본 글꼴로 그립니다")
+    elif not any(os.path.exists(path) for path in FONT_CANDIDATES[:-1]):
+        print("⚠️  한글 글꼴이 없어 한글이 □ 로 표시됩니다 (Apple SD Gothic Neo / Noto Sans CJK / 나눔고딕 필요)")
+    if emoji_font() is None:
+        print("⚠️  컬러 이모지 글꼴이 없어 이모지가 □ 로 표시됩니다")
+
+    jobs = [
+        {
+            "sheet": index + 1,
+            "trips": trips[start:start + args.rows],
+            "templates": templates,
+            "scale": args.scale,
+            "output": output,
+            "individual": args.individual,
+        }
+        for index, start in enumerate(range(0, len(trips), args.rows))
+    ]
+
+    started = time.perf_counter()
+    results = []
+    with profiling.phase("render", sheets=len(jobs)):
+        if args.jobs == 1 or len(jobs) == 1:
+            init_worker()
+            results = [render_sheet(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker) as pool:
+                for result in pool.map(render_sheet, jobs):
+                    results.append(result)
+                    if len(results) % max(1, len(jobs) // 10) == 0:
+                        print(f"   {len(results):>5}/{len(jobs)} 시트")
+        profiling.count_written(sum(result["bytes"] for result in results))
+    elapsed = time.perf_counter() - started
+
+    warnings = [warning for result in results for warning in result["warnings"]]
+    with profiling.phase("index"), open(os.path.join(output, "index.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            "templates": templates,
+            "scale": args.scale,
+            "sheets": [{"path": os.path.basename(r["path"]), "trips": r["trips"]} for r in results],
+            "warnings": warnings,
+        }, f, ensure_ascii=False, indent=2)
+
+    receipts = sum(result["receipts"] for result in results)
+    hits = sum(result["cache"][0] for result in results)
+    misses = sum(result["cache"][1] for result in results)
+    print(f"\n✅ 영수증 {receipts:,}장, 시트 {len(results)}장 ({elapsed:.1f}초, {receipts / elapsed:,.0f}장/초)")
+    if hits + misses:
+        print(f"   텍스트 측정 캐시 적중률: {hits / (hits + misses):.1%} ({hits + misses:,}회 측정)")
+
+    if warnings:
+        counts = Counter((w["template"], w["kind"]) for w in warnings)
+        print(f"\n⚠️  레이아웃 경고 {len(warnings)}건 (시트에 빨간 테두리로 표시)")
+        for (template, kind), count in sorted(counts.items()):
+            example = next(w for w in warnings if w["template"] == template and w["kind"] == kind)
+            print(f"   {template:<8} {kind:<13} {count:>5}건  예: {example['detail']}")
+    else:
+        print("✅ 레이아웃 경고 없음")
+    print(f"📂 출력 위치: {output}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="영수증 템플릿 미리보기 일괄 렌더링 (Pillow)")
+    parser.add_argument("--count", type=trip_history_gen.parse_count, default=100,
+                        help="렌더링할 주행 기록 수 (기본: 100, 예: 1k)")
+    parser.add_argument("--dataset", help="trip_history_gen.py 출력 디렉토리 (없으면 합성 데이터)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--templates", help=f"쉼표로 구분한 템플릿 (기본: 전체, {','.join(SCHEMES)})")
+    parser.add_argument("--scale", type=float, default=1.0, help="픽셀 배율 (앱은 2.0, 기본: 1.0)")
+    parser.add_argument("--rows", type=int, default=6, help="시트당 주행 기록 수 (기본: 6)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--individual", action="store_true", help="영수증을 한 장씩 receipts/<템플릿>/ 에도 저장")
+    parser.add_argument("-o", "--output", help="출력 디렉토리 (기본: build/receipt_previews)")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "receipt-preview", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
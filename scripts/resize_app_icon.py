@@ -8,6 +8,8 @@ from PIL import Image
 import os
 import sys
 
+import profiling
+
 # iOS 앱 아이콘 필수 크기
 ICON_SIZES = [
     ("icon_20x20@2x.png", 40),      # iPhone Notification
@@ -36,7 +38,10 @@ def resize_icon(source_path, output_dir):
 
     # 원본 이미지 열기
     try:
-        img = Image.open(source_path)
+        with profiling.phase("load"):
+            profiling.count_read(os.path.getsize(source_path))
+            img = Image.open(source_path)
+            img.load()
         print(f"✅ 원본 이미지 로드: {source_path}")
         print(f"   크기: {img.size}, 모드: {img.mode}")
 
@@ -66,9 +71,12 @@ def resize_icon(source_path, output_dir):
     # 모든 크기로 리사이징
     for filename, size in ICON_SIZES:
         try:
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
+            with profiling.phase("resize", size=size):
+                resized = img.resize((size, size), Image.Resampling.LANCZOS)
             output_path = os.path.join(output_dir, filename)
-            resized.save(output_path, 'PNG')
+            with profiling.phase("encode", size=size):
+                resized.save(output_path, 'PNG')
+                profiling.count_written(os.path.getsize(output_path))
             print(f"✅ {filename} ({size}x{size})")
         except Exception as e:
             print(f"❌ {filename} 생성 실패: {e}")
@@ -101,8 +109,9 @@ def update_contents_json(output_dir):
     }
 
     import json
-    with open(contents_path, 'w') as f:
+    with profiling.phase("contents"), open(contents_path, 'w') as f:
         json.dump(contents, f, indent=2)
+        profiling.count_written(f.tell())
 
     print(f"\n✅ Contents.json 업데이트 완료")
 
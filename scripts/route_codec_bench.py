@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+경로 데이터 저장 코덱 벤치마크 (오프라인)
+RoutePoint(latitude/longitude/timestamp/speed/accuracy) 경로 묶음을
+여러 코덱으로 인코딩해 포인트당 바이트, 인코딩/디코딩 처리량,
+왕복(round-trip) 오차를 비교합니다.
+
+코덱:
+- json+deflate  현재 앱 형식 (JSONEncoder + COMPRESSION_ZLIB, RouteDataManager)
+- json          압축 없는 JSON
+- raw64         5개 필드 모두 double (메모리 레이아웃 그대로)
+- float32       float32 (timestamp 는 첫 포인트 기준 상대값)
+- varint        고정소수점 양자화 + 델타 + zigzag + LEB128 varint
+- polyline      Google Encoded Polyline 알고리즘 (5개 열 모두 적용)
+- columnar+zlib 양자화 델타를 열 단위 int32 배열로 저장 후 zlib
+                (int32 를 넘는 델타가 있으면 경로 전체를 int64 로 저장)
+- columnar+lzma 같은 배열을 lzma 로 압축
+
+필수 요구사항: pip3 install numpy
+"""
+
+import argparse
+import json
+import lzma
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+
+import profiling
+import route_sampling_lab
+import route_traces
+
+COLUMNS = route_traces.COLUMNS
+
+# 고정소수점 양자화 배율 (위경도 1e-6도 ≈ 0.11m, 시간 1ms, 속도/정확도 0.1)
+SCALES = {
+    "latitude": 1e6,
+    "longitude": 1e6,
+    "timestamp": 1e3,
+    "speed": 1e1,
+    "accuracy": 1e1,
+}
+
+# Google polyline 은 원래 위경도 1e-5 정밀도를 사용
+POLYLINE_SCALES = {
+    "latitude": 1e5,
+    "longitude": 1e5,
+    "timestamp": 1e0,
+    "speed": 1e0,
+    "accuracy": 1e0,
+}
+
+HEADER = struct.Struct("<I")  # 포인트 수
+# columnar: 열별 첫 값(int64) 5개 + 델타 바이트 수 (4, 한 값이라도 int32 를 넘으면 8)
+COLUMNAR_HEADER = struct.Struct("<5qB")
+INT32_LIMIT = 2 ** 31
+
+
+# MARK: - 정수 열 인코딩 도구
+
+def quantize(columns, scales):
+    return {name: np.round(columns[name] * scales[name]).astype(np.int64) for name in COLUMNS}
+
+
+def dequantize(ints, scales):
+    return {name: ints[name] / scales[name] for name in COLUMNS}
+
+
+def zigzag(values):
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def unzigzag(values):
+    values = values.astype(np.uint64)
+    return ((values >> np.uint64(1)).astype(np.int64)) ^ -((values & np.uint64(1)).astype(np.int64))
+
+
+def encode_chunks(values, bits, continuation, offset=0):
+    """
+    부호 없는 정수 배열을 가변 길이 청크로 벡터 인코딩
+
+    LEB128(bits=7, continuation=0x80) 과 Google polyline
+    (bits=5, continuation=0x20, offset=63) 을 같은 방식으로 처리합니다.
+    """
+    values = values.astype(np.uint64)
+    mask = np.uint64((1 << bits) - 1)
+    max_chunks = (64 + bits - 1) // bits
+
+    lengths = np.ones(len(values), dtype=np.int64)
+    remaining = values >> np.uint64(bits)
+    while remaining.any():
+        lengths += remaining > 0
+        remaining >>= np.uint64(bits)
+
+    shifts = np.arange(max_chunks, dtype=np.uint64) * np.uint64(bits)
+    chunks = (values[:, None] >> shifts[None, :]) & mask
+    position = np.arange(max_chunks)[None, :]
+    chunks = chunks + np.where(position < lengths[:, None] - 1, continuation, 0).astype(np.uint64)
+    chunks += np.uint64(offset)
+    return chunks[position < lengths[:, None]].astype(np.uint8).tobytes()
+
+
+def decode_chunks(data, bits, continuation, offset=0):
+    """
+    encode_chunks 의 역변환 (벡터 디코딩)
+    """
+    raw = np.frombuffer(data, dtype=np.uint8).astype(np.uint64) - np.uint64(offset)
+    if len(raw) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    is_last = (raw & np.uint64(continuation)) == 0
+    payload = raw & np.uint64(continuation - 1)
+
+    starts = np.concatenate(([0], np.flatnonzero(is_last)[:-1] + 1))
+    group = np.cumsum(np.concatenate(([0], is_last[:-1].astype(np.int64))))
+    position = (np.arange(len(raw)) - starts[group]).astype(np.uint64)
+    return np.add.reduceat(payload << (position * np.uint64(bits)), starts)
+
+
+def delta(values):
+    return np.diff(values, prepend=np.int64(0))
+
+
+# MARK: - 코덱
+
+def encode_json(columns):
+    points = [
+        {name: float(columns[name][i]) for name in COLUMNS}
+        for i in range(len(columns["timestamp"]))
+    ]
+    return json.dumps(points, separators=(',', ':')).encode('utf-8')
+
+
+def decode_json(data):
+    points = json.loads(data)
+    return {name: np.array([point[name] for point in points], dtype=float) for name in COLUMNS}
+
+
+def encode_json_deflate(columns):
+    # Apple COMPRESSION_ZLIB 과 같은 raw DEFLATE 스트림
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(encode_json(columns)) + compressor.flush()
+
+
+def decode_json_deflate(data):
+    return decode_json(zlib.decompress(data, -zlib.MAX_WBITS))
+
+
+def encode_raw64(columns):
+    rows = np.column_stack([columns[name] for name in COLUMNS]).astype('<f8')
+    return HEADER.pack(len(rows)) + rows.tobytes()
+
+
+def decode_raw64(data):
+    (count,) = HEADER.unpack_from(data)
+    rows = np.frombuffer(data, dtype='<f8', offset=HEADER.size).reshape(count, len(COLUMNS))
+    return {name: rows[:, i].copy() for i, name in enumerate(COLUMNS)}
+
+
+def encode_float32(columns):
+    t0 = float(columns["timestamp"][0]) if len(columns["timestamp"]) else 0.0
+    shifted = dict(columns, timestamp=columns["timestamp"] - t0)
+    rows = np.column_stack([shifted[name] for name in COLUMNS]).astype('<f4')
+    return HEADER.pack(len(rows)) + struct.pack("<d", t0) + rows.tobytes()
+
+
+def decode_float32(data):
+    (count,) = HEADER.unpack_from(data)
+    (t0,) = struct.unpack_from("<d", data, HEADER.size)
+    rows = np.frombuffer(data, dtype='<f4', offset=HEADER.size + 8).reshape(count, len(COLUMNS))
+    columns = {name: rows[:, i].astype(float) for i, name in enumerate(COLUMNS)}
+    columns["timestamp"] += t0
+    return columns
+
+
+def encode_varint(columns):
+    ints = quantize(columns, SCALES)
+    body = b"".join(encode_chunks(zigzag(delta(ints[name])), 7, 0x80) for name in COLUMNS)
+    return HEADER.pack(len(columns["timestamp"])) + body
+
+
+def decode_varint(data):
+    (count,) = HEADER.unpack_from(data)
+    values = unzigzag(decode_chunks(data[HEADER.size:], 7, 0x80))
+    ints = {name: np.cumsum(values[i * count:(i + 1) * count]) for i, name in enumerate(COLUMNS)}
+    return dequantize(ints, SCALES)
+
+
+def encode_polyline(columns):
+    ints = quantize(columns, POLYLINE_SCALES)
+    # polyline 부호 처리: 음수는 비트 반전 (zigzag 와 동일한 결과)
+    text = b"".join(encode_chunks(zigzag(delta(ints[name])), 5, 0x20, offset=63) for name in COLUMNS)
+    return HEADER.pack(len(columns["timestamp"])) + text
+
+
+def decode_polyline(data):
+    (count,) = HEADER.unpack_from(data)
+    values = unzigzag(decode_chunks(data[HEADER.size:], 5, 0x20, offset=63))
+    ints = {name: np.cumsum(values[i * count:(i + 1) * count]) for i, name in enumerate(COLUMNS)}
+    return dequantize(ints, POLYLINE_SCALES)
+
+
+def _encode_columnar(columns):
+    ints = quantize(columns, SCALES)
+    count = len(columns["timestamp"])
+    firsts = [int(ints[name][0]) if count else 0 for name in COLUMNS]
+    deltas = [np.diff(ints[name]) for name in COLUMNS]
+    # 24.8일 넘는 시간 간격(ms)이나 큰 좌표 점프가 int32 에서 조용히 넘치지 않도록
+    fits = all(len(d) == 0 or int(np.abs(d).max()) < INT32_LIMIT for d in deltas)
+    width = 4 if fits else 8
+    header = HEADER.pack(count) + COLUMNAR_HEADER.pack(*firsts, width)
+    body = b"".join(d.astype(f'<i{width}').tobytes() for d in deltas)
+    return header + body
+
+
+def _decode_columnar(data):
+    (count,) = HEADER.unpack_from(data)
+    *firsts, width = COLUMNAR_HEADER.unpack_from(data, HEADER.size)
+    deltas = np.frombuffer(data, dtype=f'<i{width}', offset=HEADER.size + COLUMNAR_HEADER.size).astype(np.int64)
+    step = max(0, count - 1)
+    ints = {}
+    for i, name in enumerate(COLUMNS):
+        ints[name] = np.concatenate(([firsts[i]], firsts[i] + np.cumsum(deltas[i * step:(i + 1) * step])))[:count]
+    return dequantize(ints, SCALES)
+
+
+def encode_columnar_zlib(columns):
+    return zlib.compress(_encode_columnar(columns), 9)
+
+
+def decode_columnar_zlib(data):
+    return _decode_columnar(zlib.decompress(data))
+
+
+def encode_columnar_lzma(columns):
+    return lzma.compress(_encode_columnar(columns), preset=6)
+
+
+def decode_columnar_lzma(data):
+    return _decode_columnar(lzma.decompress(data))
+
+
+CODECS = {
+    "json+deflate": (encode_json_deflate, decode_json_deflate),
+    "json": (encode_json, decode_json),
+    "raw64": (encode_raw64, decode_raw64),
+    "float32": (encode_float32, decode_float32),
+    "varint": (encode_varint, decode_varint),
+    "polyline": (encode_polyline, decode_polyline),
+    "columnar+zlib": (encode_columnar_zlib, decode_columnar_zlib),
+    "columnar+lzma": (encode_columnar_lzma, decode_columnar_lzma),
+}
+BASELINE_CODEC = "json+deflate"
+
+
+# MARK: - 벤치마크
+
+def load_routes(paths, synthetic, seed, stage):
+    """
+    벤치마크용 경로 묶음 로드 (열 단위 numpy 배열 딕셔너리 리스트)
+
+    Args:
+        stage: "raw" 면 그대로, "stored" 면 RouteOptimizer 저장 파이프라인 적용
+    """
+    traces = [route_traces.load_trace(path) for path in route_traces.find_trace_files(paths)]
+    with profiling.phase("synthesize", count=synthetic):
+        traces.extend(route_traces.synthesize_corpus(synthetic, seed=seed))
+
+    routes = []
+    with profiling.phase("prepare", stage=stage):
+        for trace in traces:
+            columns = {name: np.asarray(trace[name], dtype=float) for name in COLUMNS}
+            if len(columns["timestamp"]) < 2:
+                continue
+            if stage == "stored":
+                kept = route_sampling_lab.downsample(columns["timestamp"])
+                kept = route_sampling_lab.douglas_peucker(columns["latitude"], columns["longitude"],
+                                                          route_sampling_lab.DEFAULT_TOLERANCE, kept)
+                columns = {name: values[kept] for name, values in columns.items()}
+            routes.append(columns)
+    return routes
+
+
+def round_trip_error(original, decoded):
+    """
+    왕복 오차: 위치(m) 최대값, 필드별 최대 절대 오차
+    """
+    position = route_sampling_lab.haversine(
+        original["latitude"], original["longitude"], decoded["latitude"], decoded["longitude"]
+    )
+    errors = {"position": float(position.max()) if len(position) else 0.0}
+    for name in ("timestamp", "speed", "accuracy"):
+        errors[name] = float(np.abs(original[name] - decoded[name]).max())
+    return errors
+
+
+def benchmark_codec(name, routes, repeat=3):
+    """
+    코덱 하나를 경로 묶음 전체에 대해 측정 (반복 중 최소 시간 사용)
+    """
+    encode, decode = CODECS[name]
+    points = sum(len(route["timestamp"]) for route in routes)
+
+    encode_time = float("inf")
+    with profiling.phase("encode", repeat=repeat):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            payloads = [encode(route) for route in routes]
+            encode_time = min(encode_time, time.perf_counter() - start)
+
+    decode_time = float("inf")
+    with profiling.phase("decode", repeat=repeat):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            decoded = [decode(payload) for payload in payloads]
+            decode_time = min(decode_time, time.perf_counter() - start)
+
+    errors = {"position": 0.0, "timestamp": 0.0, "speed": 0.0, "accuracy": 0.0}
+    with profiling.phase("verify"):
+        for original, restored in zip(routes, decoded):
+            for key, value in round_trip_error(original, restored).items():
+                errors[key] = max(errors[key], value)
+
+    total_bytes = sum(len(payload) for payload in payloads)
+    return {
+        "codec": name,
+        "bytes": total_bytes,
+        "bytes_per_point": total_bytes / points,
+        "encode_points_per_s": points / encode_time,
+        "decode_points_per_s": points / decode_time,
+        "max_position_error_m": errors["position"],
+        "max_timestamp_error_s": errors["timestamp"],
+        "max_speed_error": errors["speed"],
+        "max_accuracy_error": errors["accuracy"],
+    }
+
+
+def print_results(results):
+    baseline = next((r for r in results if r["codec"] == BASELINE_CODEC), results[0])
+    print(f"{'코덱':<15}{'B/점':>8}{'현재 대비':>10}{'인코딩':>12}{'디코딩':>12}"
+          f"{'위치오차':>11}{'시간오차':>10}{'속도오차':>10}")
+    for r in results:
+        print(f"{r['codec']:<15}"
+              f"{r['bytes_per_point']:>8.2f}"
+              f"{100 * r['bytes'] / baseline['bytes']:>9.1f}%"
+              f"{r['encode_points_per_s'] / 1e6:>9.2f}M/s"
+              f"{r['decode_points_per_s'] / 1e6:>9.2f}M/s"
+              f"{r['max_position_error_m']:>10.3f}m"
+              f"{r['max_timestamp_error_s']:>9.3f}s"
+              f"{r['max_speed_error']:>10.3f}")
+
+
+def run(args):
+    """
+    파싱된 인자로 코덱 벤치마크 실행 (종료 코드 반환)
+    """
+    names = [name for name in args.codecs.split(",") if name]
+    unknown = [name for name in names if name not in CODECS]
+    if unknown:
+        print(f"❌ 오류: 알 수 없는 코덱: {', '.join(unknown)}")
+        print(f"   사용 가능: {', '.join(CODECS)}")
+        return 1
+
+    try:
+        routes = load_routes(args.traces, args.synthetic or (0 if args.traces else 100), args.seed, args.stage)
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일을 찾을 수 없습니다: {e}")
+        return 1
+    if not routes:
+        print("❌ 오류: 측정할 경로가 없습니다")
+        return 1
+
+    points = sum(len(route["timestamp"]) for route in routes)
+    print("=" * 60)
+    print("🗜  경로 저장 코덱 벤치마크")
+    print("=" * 60)
+    print(f"경로: {len(routes)}개, 포인트: {points:,}개 (경로당 평균 {points / len(routes):.0f}개)")
+    print(f"단계: {args.stage}, 반복: {args.repeat}회")
+    print("=" * 60 + "\n")
+
+    results = []
+    for name in names:
+        with profiling.phase(name):
+            results.append(benchmark_codec(name, routes, args.repeat))
+    print_results(results)
+
+    if args.json:
+        with profiling.phase("write"), open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"stage": args.stage, "routes": len(routes), "points": points, "results": results},
+                      f, ensure_ascii=False, indent=2)
+            profiling.count_written(f.tell())
+        print(f"\n✅ 결과 저장: {args.json}")
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="경로 데이터 저장 코덱 벤치마크")
+    parser.add_argument("traces", nargs="*", help="트레이스 파일 또는 디렉토리 (.json/.route.gz/.csv)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 경로 개수 (트레이스 미지정 시 기본 100)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 경로 시드")
+    parser.add_argument("--stage", choices=["raw", "stored"], default="stored",
+                        help="raw: 1초 원본, stored: RouteOptimizer 적용 후 (기본)")
+    parser.add_argument("--codecs", default=",".join(CODECS), help="측정할 코덱 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "codecs", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
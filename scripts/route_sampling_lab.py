@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+"""
+경로 샘플링 실험 스크립트 (오프라인)
+RouteManager / RouteOptimizer 와 같은 알고리즘을 NumPy 로 벡터화해
+여러 트레이스에 대해 샘플링 파라미터를 병렬로 스윕하고,
+포인트 감소율 / 원본 대비 편차(m) / 요금 거리 오차를 리포트합니다.
+
+파이프라인:
+- live     RouteManager: 거리 기반 동적 간격(5~200m) 샘플링,
+           5000개 초과 시 Douglas-Peucker 로 3000개 목표 단순화
+- storage  RouteOptimizer.optimizeForStorage: 5초 다운샘플링 + DP(10m)
+- app      live → storage (실제 앱에서 저장되는 경로)
+
+Douglas-Peucker 는 재귀 대신 스택 기반 반복으로 구현하며,
+구간마다 내부 포인트의 수직 거리를 한 번에 계산합니다.
+
+필수 요구사항: pip3 install numpy
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import compile_fares
+import profiling
+import route_traces
+
+# 요금표 원본 경로는 compile_fares 한 곳에서 관리
+DEFAULT_FARES_PATH = compile_fares.SOURCE_PATHS[0]
+
+# RouteConfig / RouteOptimizer 기본값 (Swift 코드와 동일하게 유지)
+SAVE_INTERVAL = 5.0
+DEFAULT_TOLERANCE = 10.0
+SIMPLIFICATION_THRESHOLD = 5000
+SIMPLIFICATION_TARGET = 3000
+MAX_ESCALATED_TOLERANCE = 100.0
+
+# RouteConfig.pointInterval(for:) 거리 구간 (meters)
+INTERVAL_TIERS = np.array([10_000, 50_000, 100_000, 300_000], dtype=float)
+INTERVAL_VALUES = np.array([5.0, 20.0, 50.0, 100.0, 200.0])
+
+# RouteConfig.simplificationTolerance(for:) 거리 구간 (meters)
+TOLERANCE_TIERS = np.array([100_000, 300_000], dtype=float)
+TOLERANCE_VALUES = np.array([10.0, 20.0, 30.0])
+
+PIPELINES = ["live", "storage", "app"]
+
+
+# MARK: - 거리 계산
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    대원 거리 (미터), 배열 브로드캐스팅 지원
+    """
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = np.radians(np.asarray(lon2) - np.asarray(lon1))
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * route_traces.EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(1.0, a)))
+
+
+def segment_distances(lat, lon, points, starts, ends):
+    """
+    포인트에서 선분까지의 거리 (RouteOptimizer.perpendicularDistance 와 동일)
+
+    위경도 평면에서 선분 위의 가장 가까운 점을 구한 뒤 대원 거리로 측정합니다.
+    길이가 0인 선분은 시작점까지의 거리를 사용합니다.
+
+    Args:
+        lat, lon: 전체 좌표 배열
+        points, starts, ends: 같은 길이의 인덱스 배열
+    """
+    plat, plon = lat[points], lon[points]
+    slat, slon = lat[starts], lon[starts]
+    dx = lon[ends] - slon
+    dy = lat[ends] - slat
+    denom = dx * dx + dy * dy
+    degenerate = denom == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = ((plon - slon) * dx + (plat - slat) * dy) / np.where(degenerate, 1.0, denom)
+    t = np.where(degenerate, 0.0, np.clip(t, 0.0, 1.0))
+    return haversine(plat, plon, slat + t * dy, slon + t * dx)
+
+
+def path_length(lat, lon, indices=None):
+    """
+    인덱스 순서대로 이은 경로의 총 길이 (미터)
+    """
+    if indices is not None:
+        lat, lon = lat[indices], lon[indices]
+    if len(lat) < 2:
+        return 0.0
+    return float(haversine(lat[:-1], lon[:-1], lat[1:], lon[1:]).sum())
+
+
+# MARK: - 샘플링 알고리즘
+
+def downsample(timestamps, interval=SAVE_INTERVAL):
+    """
+    시간 간격 다운샘플링 (RouteOptimizer.downsample)
+
+    마지막으로 유지한 포인트로부터 interval 초 이상 지난 첫 포인트를
+    searchsorted 로 바로 찾아, 유지되는 포인트 수만큼만 반복합니다.
+
+    Returns:
+        유지할 인덱스 배열
+    """
+    n = len(timestamps)
+    if n <= 2:
+        return np.arange(n)
+
+    kept = [0]
+    index = 0
+    while True:
+        index = max(index + 1, int(np.searchsorted(timestamps, timestamps[index] + interval, 'left')))
+        if index >= n:
+            break
+        kept.append(index)
+
+    # 마지막 포인트는 항상 유지
+    if timestamps[kept[-1]] != timestamps[-1]:
+        kept.append(n - 1)
+    return np.asarray(kept)
+
+
+def douglas_peucker(lat, lon, tolerance, indices=None):
+    """
+    스택 기반 반복 Douglas-Peucker (RouteOptimizer.simplify)
+
+    Args:
+        lat, lon: 전체 좌표 배열
+        tolerance: 허용 오차 (미터)
+        indices: 단순화 대상 인덱스 (None 이면 전체)
+
+    Returns:
+        유지할 인덱스 배열 (indices 의 부분집합, 순서 유지)
+    """
+    if indices is None:
+        indices = np.arange(len(lat))
+    n = len(indices)
+    if n <= 2:
+        return indices
+
+    sub_lat = lat[indices]
+    sub_lon = lon[indices]
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start <= 1:
+            continue
+
+        interior = np.arange(start + 1, end)
+        distances = segment_distances(
+            sub_lat, sub_lon, interior,
+            np.full(len(interior), start), np.full(len(interior), end),
+        )
+        offset = int(np.argmax(distances))
+        if distances[offset] > tolerance:
+            split = start + 1 + offset
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return indices[keep]
+
+
+def simplify_to_target(lat, lon, indices, tolerance, target=SIMPLIFICATION_TARGET):
+    """
+    목표 개수 이하가 될 때까지 허용 오차를 1.5배씩 올리며 단순화
+    (RouteManager.simplifyRoute)
+
+    Returns:
+        (유지할 인덱스 배열, 최종 허용 오차)
+    """
+    if len(indices) <= target:
+        return indices, tolerance
+
+    simplified = douglas_peucker(lat, lon, tolerance, indices)
+    while len(simplified) > target and tolerance < MAX_ESCALATED_TOLERANCE:
+        tolerance *= 1.5
+        simplified = douglas_peucker(lat, lon, tolerance, indices)
+    return simplified, tolerance
+
+
+def live_sample(lat, lon, interval_scale=1.0, tolerance=DEFAULT_TOLERANCE,
+                threshold=SIMPLIFICATION_THRESHOLD, target=SIMPLIFICATION_TARGET):
+    """
+    주행 중 거리 기반 샘플링 (RouteManager.addPoint)
+
+    누적 거리에 따른 구간 간격(5~200m × interval_scale) 이상 떨어진
+    첫 포인트를 윈도우 단위 벡터 연산으로 찾고, 포인트가 threshold 를
+    넘으면 거리 구간별 허용 오차(tolerance 기준 10/20/30m 비율)로 단순화합니다.
+
+    Returns:
+        (유지할 인덱스 배열, 단순화 횟수)
+    """
+    n = len(lat)
+    if n == 0:
+        return np.arange(0), 0
+
+    steps = haversine(lat[:-1], lon[:-1], lat[1:], lon[1:])
+    accumulated = np.concatenate(([0.0], np.cumsum(steps)))
+    intervals = INTERVAL_VALUES[np.searchsorted(INTERVAL_TIERS, accumulated, 'right')] * interval_scale
+    tolerances = TOLERANCE_VALUES[np.searchsorted(TOLERANCE_TIERS, accumulated, 'right')] \
+        * (tolerance / DEFAULT_TOLERANCE)
+
+    kept = np.empty(n, dtype=np.int64)
+    kept[0] = 0
+    count = 1
+    simplifications = 0
+    window = 64
+    cursor = 1
+
+    while cursor < n:
+        stop = min(n, cursor + window)
+        last = kept[count - 1]
+        distances = haversine(lat[last], lon[last], lat[cursor:stop], lon[cursor:stop])
+        hits = np.flatnonzero(distances >= intervals[cursor:stop])
+        if len(hits) == 0:
+            cursor = stop
+            window = min(window * 2, 4096)
+            continue
+
+        index = cursor + int(hits[0])
+        kept[count] = index
+        count += 1
+        cursor = index + 1
+        window = 64
+
+        if count > threshold:
+            simplified, _ = simplify_to_target(lat, lon, kept[:count], float(tolerances[index]), target)
+            count = len(simplified)
+            kept[:count] = simplified
+            simplifications += 1
+
+    return kept[:count].copy(), simplifications
+
+
+# MARK: - 평가
+
+def deviation(lat, lon, kept):
+    """
+    원본 각 포인트에서 단순화된 경로까지의 거리 (미터)
+
+    원본 포인트는 자신을 감싸는 유지 포인트 구간의 선분과 비교하며,
+    마지막 유지 포인트 이후의 포인트는 그 포인트까지의 거리를 사용합니다.
+    """
+    n = len(lat)
+    if len(kept) == 0:
+        return np.zeros(n)
+    points = np.arange(n)
+    if len(kept) == 1:
+        anchor = np.full(n, kept[0])
+        return segment_distances(lat, lon, points, anchor, anchor)
+
+    segment = np.clip(np.searchsorted(kept, points, 'right') - 1, 0, len(kept) - 2)
+    starts = kept[segment]
+    ends = kept[segment + 1]
+    tail = points > kept[-1]
+    starts = np.where(tail, kept[-1], starts)
+    ends = np.where(tail, kept[-1], ends)
+    return segment_distances(lat, lon, points, starts, ends)
+
+
+def distance_fare(distance, fare):
+    """
+    거리만으로 계산한 요금 (FareCalculator.calculate 의 병산 유닛 계산, 시간요금 제외)
+    """
+    units = distance / fare["dayDistanceUnit"]
+    base_units = fare["dayBaseDistance"] / fare["dayDistanceUnit"]
+    return fare["dayBaseFare"] + int(max(0.0, units - base_units)) * fare["dayDistanceFare"]
+
+
+def parameter_grid(pipeline, tolerances, intervals, interval_scales):
+    """
+    파이프라인별 스윕 파라미터 조합 생성
+    """
+    if pipeline == "storage":
+        return [{"interval": i, "tolerance": t} for i, t in itertools.product(intervals, tolerances)]
+    if pipeline == "live":
+        return [{"interval_scale": s, "tolerance": t} for s, t in itertools.product(interval_scales, tolerances)]
+    return [
+        {"interval_scale": s, "interval": i, "tolerance": t}
+        for s, i, t in itertools.product(interval_scales, intervals, tolerances)
+    ]
+
+
+def run_pipeline(pipeline, lat, lon, timestamps, params):
+    """
+    파라미터 한 조합으로 파이프라인 실행
+
+    Returns:
+        유지할 인덱스 배열
+    """
+    if pipeline in ("live", "app"):
+        kept, _ = live_sample(lat, lon, params["interval_scale"], params["tolerance"])
+        if pipeline == "live":
+            return kept
+    else:
+        kept = np.arange(len(lat))
+
+    sampled = kept[downsample(timestamps[kept], params["interval"])]
+    return douglas_peucker(lat, lon, params["tolerance"], sampled)
+
+
+def evaluate_trace(task):
+    """
+    트레이스 하나에 대해 모든 파라미터 조합을 평가 (워커 프로세스에서 실행)
+
+    Args:
+        task: (source, pipeline, grid, fare)
+              source 는 파일 경로 또는 ("synthetic", seed, duration)
+
+    Returns:
+        파라미터 조합별 결과 딕셔너리 리스트
+    """
+    source, pipeline, grid, fare = task
+    if isinstance(source, tuple):
+        _, seed, duration = source
+        trace = route_traces.synthesize_trace(seed, duration=duration)
+    else:
+        trace = route_traces.load_trace(source)
+
+    lat = np.asarray(trace["latitude"], dtype=float)
+    lon = np.asarray(trace["longitude"], dtype=float)
+    timestamps = np.asarray(trace["timestamp"], dtype=float)
+    if len(lat) < 2:
+        return []
+
+    raw_distance = path_length(lat, lon)
+    raw_fare = distance_fare(raw_distance, fare)
+
+    rows = []
+    for params in grid:
+        kept = run_pipeline(pipeline, lat, lon, timestamps, params)
+        errors = deviation(lat, lon, kept)
+        sampled_distance = path_length(lat, lon, kept)
+        rows.append({
+            "trace": trace["name"],
+            **params,
+            "points": len(lat),
+            "kept": len(kept),
+            "ratio": len(kept) / len(lat),
+            "max_dev": float(errors.max()),
+            "mean_dev": float(errors.mean()),
+            "distance": raw_distance,
+            "distance_error": sampled_distance - raw_distance,
+            "distance_error_pct": 100 * (sampled_distance - raw_distance) / raw_distance if raw_distance else 0.0,
+            "fare_error": distance_fare(sampled_distance, fare) - raw_fare,
+        })
+    return rows
+
+
+def summarize(rows, param_keys):
+    """
+    파라미터 조합별 집계
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row[key] for key in param_keys), []).append(row)
+
+    summary = []
+    for key, group in sorted(groups.items()):
+        ratio = np.array([row["ratio"] for row in group])
+        max_dev = np.array([row["max_dev"] for row in group])
+        mean_dev = np.array([row["mean_dev"] for row in group])
+        dist_err = np.abs([row["distance_error_pct"] for row in group])
+        fare_err = np.abs([row["fare_error"] for row in group])
+        summary.append({
+            **dict(zip(param_keys, key)),
+            "traces": len(group),
+            "reduction": 1 - float(ratio.mean()),
+            "mean_dev": float(mean_dev.mean()),
+            "p95_max_dev": float(np.percentile(max_dev, 95)),
+            "max_dev": float(max_dev.max()),
+            "mean_dist_err_pct": float(dist_err.mean()),
+            "max_dist_err_pct": float(dist_err.max()),
+            "mean_fare_err": float(fare_err.mean()),
+            "max_fare_err": float(fare_err.max()),
+        })
+    return summary
+
+
+def print_summary(summary, param_keys):
+    headers = param_keys + ["traces", "감소율", "평균편차", "p95최대", "최대편차",
+                            "거리오차%", "최대%", "요금오차", "최대요금"]
+    print(" ".join(f"{h:>9}" for h in headers))
+    for row in summary:
+        values = [f"{row[key]:>9g}" for key in param_keys] + [
+            f"{row['traces']:>9d}",
+            f"{100 * row['reduction']:>8.1f}%",
+            f"{row['mean_dev']:>8.2f}m",
+            f"{row['p95_max_dev']:>8.1f}m",
+            f"{row['max_dev']:>8.1f}m",
+            f"{row['mean_dist_err_pct']:>9.3f}",
+            f"{row['max_dist_err_pct']:>9.3f}",
+            f"{row['mean_fare_err']:>8.0f}원",
+            f"{row['max_fare_err']:>8.0f}원",
+        ]
+        print(" ".join(values))
+
+
+def load_region_fare(code):
+    """
+    DefaultFares.json 에서 지역 요금 로드
+    """
+    with open(DEFAULT_FARES_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for region in data["regions"]:
+        if region["code"] == code:
+            return region
+    raise KeyError(code)
+
+
+def parse_floats(text):
+    return [float(value) for value in text.split(",") if value]
+
+
+def run(args):
+    """
+    파싱된 인자로 샘플링 실험 실행 (종료 코드 반환)
+    """
+    try:
+        sources = route_traces.find_trace_files(args.traces)
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일을 찾을 수 없습니다: {e}")
+        return 1
+
+    synthetic = args.synthetic or (0 if sources else 200)
+    rng = np.random.default_rng(args.seed)
+    for index in range(synthetic):
+        sources.append(("synthetic", args.seed * 1_000_003 + index, int(rng.integers(300, 5400))))
+
+    fare = load_region_fare(args.region)
+    grid = parameter_grid(args.pipeline, args.tolerances, args.intervals, args.interval_scales)
+    param_keys = list(grid[0].keys())
+
+    print("=" * 60)
+    print("🧪 경로 샘플링 실험")
+    print("=" * 60)
+    print(f"파이프라인: {args.pipeline}")
+    print(f"트레이스: {len(sources)}개 (합성 {synthetic}개)")
+    print(f"파라미터 조합: {len(grid)}개, 워커: {args.jobs}개")
+    print("=" * 60 + "\n")
+
+    start = time.perf_counter()
+    tasks = [(source, args.pipeline, grid, fare) for source in sources]
+    rows = []
+    with profiling.phase("evaluate", traces=len(tasks), jobs=args.jobs), \
+            ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        chunksize = max(1, len(tasks) // (args.jobs * 8))
+        for result in executor.map(evaluate_trace, tasks, chunksize=chunksize):
+            rows.extend(result)
+    elapsed = time.perf_counter() - start
+
+    with profiling.phase("summarize"):
+        summary = summarize(rows, param_keys)
+    print_summary(summary, param_keys)
+
+    total_points = sum(row["points"] for row in rows) // max(1, len(grid))
+    print(f"\n⏱  {elapsed:.2f}초 ({len(sources) / elapsed:.0f} 트레이스/초, "
+          f"{total_points * len(grid) / elapsed / 1e6:.2f}M 포인트·조합/초)")
+
+    if args.json:
+        with profiling.phase("write"), open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"pipeline": args.pipeline, "region": args.region, "summary": summary},
+                      f, ensure_ascii=False, indent=2)
+            profiling.count_written(f.tell())
+        print(f"✅ 집계 저장: {args.json}")
+
+    if args.csv and rows:
+        with profiling.phase("write"), open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+            profiling.count_written(f.tell())
+        print(f"✅ 트레이스별 결과 저장: {args.csv}")
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="경로 샘플링 파라미터 스윕")
+    parser.add_argument("traces", nargs="*", help="트레이스 파일 또는 디렉토리 (.json/.route.gz/.csv)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 트레이스 개수 (트레이스 미지정 시 기본 200)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 트레이스 시드")
+    parser.add_argument("--pipeline", choices=PIPELINES, default="storage")
+    parser.add_argument("--tolerances", type=parse_floats, default=[5.0, 10.0, 20.0],
+                        help="DP 허용 오차 목록 (m, 기본: 5,10,20)")
+    parser.add_argument("--intervals", type=parse_floats, default=[1.0, 5.0, 10.0],
+                        help="저장 다운샘플링 간격 목록 (초, 기본: 1,5,10)")
+    parser.add_argument("--interval-scales", type=parse_floats, default=[0.5, 1.0, 2.0],
+                        help="주행 중 거리 간격 배율 목록 (기본: 0.5,1,2)")
+    parser.add_argument("--region", default="seoul", help="요금 오차 계산에 쓸 지역 코드")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    parser.add_argument("--json", help="집계 결과를 JSON 으로 저장")
+    parser.add_argument("--csv", help="트레이스별 결과를 CSV 로 저장")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "sampling", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+경로 썸네일 래스터라이저 (오프라인)
+영수증의 지도 캡처와 주행 기록 목록에 들어가는 경로를 썸네일 크기에서 대량으로 확인하기 위해,
+위경도 배열을 NumPy 로 한 번에 Web Mercator 투영하고 뷰포트에 맞춘 뒤
+안티에일리어싱된 경로선과 출발/도착 마커를 그립니다. 지도 타일은 사용하지 않습니다.
+
+- 투영: MapKit 과 같은 Web Mercator 라 가로/세로 비율이 지도와 같습니다
+  (위경도를 축마다 따로 늘리는 영수증 폴백 그리기와 달리 경로가 찌그러지지 않음)
+- 경로선: 슈퍼샘플링 격자에 원형 브러시를 찍은 뒤 축소해 커버리지를 구함
+- 마커: 픽셀 중심까지의 거리로 가장자리 커버리지를 계산
+- --overlay 로 저장 파이프라인(route_sampling_lab)이 남기는 경로를 겹쳐 그려
+  샘플링 전후 차이를 눈으로 비교할 수 있습니다
+- 시트 한 장(기본 10 × 10)이 프로세스 풀의 작업 단위입니다
+
+출력 (기본 build/route_thumbnails/):
+- sheet_0001.png ...  썸네일 격자
+- index.json          시트/칸별 트레이스 이름, 포인트 수, 축척(출력 픽셀당 지면 m), 샘플링 편차
+- thumbs/<이름>.png   (--individual) 썸네일 한 장씩
+
+필수 요구사항: pip3 install numpy Pillow
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+import profiling
+import route_sampling_lab
+import route_traces
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "build", "route_thumbnails")
+
+# Web Mercator 가 정의되는 위도 한계
+MAX_LATITUDE = 85.05112878
+
+# 경로가 너무 짧아도 이 범위(m)보다 확대하지 않음 (정차만 한 경로 등)
+MIN_SPAN = 200.0
+
+# 축척 검증 허용 오차 (중앙 위도 기준 축척이 경로 안에서 위도에 따라 변하는 정도보다 넉넉하게)
+SCALE_TOLERANCE = 0.02
+
+# 슈퍼샘플링 배율 (커버리지 단계 = SUPERSAMPLE²)
+SUPERSAMPLE = 4
+
+# 격자 간격 후보 (m), 썸네일에서 MIN_GRID_PIXELS 이상 벌어지는 첫 값 사용
+GRID_STEPS = (50, 100, 200, 500, 1000, 2000, 5000, 10_000, 20_000, 50_000, 100_000)
+MIN_GRID_PIXELS = 24
+
+BACKGROUND = np.array([242, 239, 233], dtype=np.float32)
+GRID_COLOR = np.array([226, 222, 214], dtype=np.float32)
+CASING_COLOR = np.array([255, 255, 255], dtype=np.float32)
+ROUTE_COLOR = np.array([0, 122, 255], dtype=np.float32)        # systemBlue
+OVERLAY_COLOR = np.array([255, 149, 0], dtype=np.float32)      # systemOrange
+START_COLOR = np.array([52, 199, 89], dtype=np.float32)        # systemGreen
+END_COLOR = np.array([255, 59, 48], dtype=np.float32)          # systemRed
+SHEET_BACKGROUND = (200, 200, 205)
+SHEET_GAP = 4
+
+
+# MARK: - 투영
+
+def mercator(lat, lon):
+    """
+    위경도 배열 → Web Mercator 좌표 (미터, y 는 북쪽이 양수)
+    """
+    lat = np.radians(np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE))
+    x = route_traces.EARTH_RADIUS * np.radians(lon)
+    y = route_traces.EARTH_RADIUS * np.log(np.tan(np.pi / 4 + lat / 2))
+    return x, y
+
+
+def fit_viewport(x, y, width, height, padding, min_span=MIN_SPAN):
+    """
+    Mercator 좌표를 가로세로 비율을 유지한 채 뷰포트 중앙에 맞춤
+
+    Args:
+        min_span: 지면 기준 최소 표시 범위 (m), Mercator 에서는 위도에 따라 늘어남
+
+    Returns:
+        (픽셀 x, 픽셀 y, 지면 기준 m/픽셀)
+    """
+    x0, x1 = x.min(), x.max()
+    y0, y1 = y.min(), y.max()
+    center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+    # Mercator 축척 계수 1/cos(위도) (중앙 위도 기준): Mercator m = 지면 m × stretch
+    stretch = np.cosh(center_y / route_traces.EARTH_RADIUS)
+    span = min_span * stretch
+    scale = min((width - 2 * padding) / max(x1 - x0, span), (height - 2 * padding) / max(y1 - y0, span))
+    px = (x - center_x) * scale + width / 2
+    py = height / 2 - (y - center_y) * scale
+    # scale 은 Mercator m 당 픽셀이므로 지면 m 당 픽셀은 scale × stretch
+    return px, py, 1 / (scale * stretch)
+
+
+def scale_error(lat, lon, px, py, meters_per_pixel):
+    """
+    fit_viewport 축척 검증: 출발점에서 (픽셀상) 가장 먼 점까지의 픽셀 거리 × m/픽셀 과
+    대원 거리의 상대 오차 (그 거리가 MIN_GRID_PIXELS 미만이면 0)
+    """
+    pixels = np.hypot(px - px[0], py - py[0])
+    far = int(np.argmax(pixels))
+    if pixels[far] < MIN_GRID_PIXELS:
+        return 0.0
+    ground = float(route_sampling_lab.haversine(lat[0], lon[0], lat[far], lon[far]))
+    return abs(float(pixels[far]) * meters_per_pixel / ground - 1)
+
+
+# MARK: - 래스터화
+
+def densify(px, py, step):
+    """
+    꺾은선을 step 픽셀 이하 간격의 점열로 바꿈 (끝점 포함)
+    """
+    dx, dy = np.diff(px), np.diff(py)
+    counts = np.maximum(1, np.ceil(np.hypot(dx, dy) / step)).astype(np.int64)
+    segment = np.repeat(np.arange(len(dx)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    t = (np.arange(counts.sum()) - first) / np.repeat(counts, counts)
+    xs = np.append(px[segment] + dx[segment] * t, px[-1])
+    ys = np.append(py[segment] + dy[segment] * t, py[-1])
+    return xs, ys
+
+
+def brush_rows(radius):
+    """
+    반지름 radius 픽셀 원의 행 오프셋과 행마다의 반폭
+    """
+    extent = int(np.ceil(radius))
+    dy = np.arange(-extent, extent + 1)
+    inside = np.abs(dy) <= radius
+    dy = dy[inside]
+    return dy, np.floor(np.sqrt(radius * radius - dy * dy)).astype(np.int64)
+
+
+def line_coverage(px, py, width, height, line_width):
+    """
+    두께 line_width 인 둥근 끝 꺾은선의 픽셀 커버리지 (0~1, 안티에일리어싱)
+
+    SUPERSAMPLE 배 격자에서 점열 위치마다 원형 브러시를 찍고 블록 평균으로 축소합니다.
+    브러시는 행마다 [시작, 끝) 구간의 +1/-1 만 bincount 로 쌓은 뒤 누적합으로 채우므로
+    점 하나당 연산이 브러시 면적이 아니라 지름에 비례합니다.
+    같은 격자 칸에 떨어지는 점은 먼저 합치고, 경로가 닿는 영역 밖은 계산하지 않습니다.
+    """
+    s = SUPERSAMPLE
+    grid_w, grid_h = width * s, height * s
+    xs, ys = densify(px * s, py * s, step=max(1.0, line_width * s / 4))
+    cells = np.unique(np.round(ys).astype(np.int64) * grid_w + np.round(xs).astype(np.int64))
+    cy, cx = np.divmod(cells, grid_w)
+    dy, half = brush_rows(line_width * s / 2)
+
+    # 경로가 닿는 영역만 계산 (블록 평균이 맞도록 s 배수로 정렬)
+    reach = int(dy[-1]) + 1
+    top = max(0, (int(cy.min()) - reach) // s * s)
+    bottom = min(grid_h, -(-(int(cy.max()) + reach + 1) // s) * s)
+    left = max(0, (int(cx.min()) - reach) // s * s)
+    right = min(grid_w, -(-(int(cx.max()) + reach + 1) // s) * s)
+    coverage = np.zeros((height, width), dtype=np.float32)
+    if top >= bottom or left >= right:
+        return coverage
+    local_w, local_h = right - left, bottom - top
+    stride = local_w + 1
+
+    iy = (cy - top)[:, None] + dy[None, :]
+    x0 = np.clip((cx - left)[:, None] - half[None, :], 0, local_w)
+    x1 = np.clip((cx - left)[:, None] + half[None, :] + 1, 0, local_w)
+    valid = (iy >= 0) & (iy < local_h) & (x0 < x1)
+    rows = iy[valid] * stride
+    size = local_h * stride
+    edges = np.bincount(rows + x0[valid], minlength=size) - np.bincount(rows + x1[valid], minlength=size)
+    mask = np.cumsum(edges.reshape(local_h, stride), axis=1)[:, :local_w] > 0
+    blocks = mask.view(np.uint8).reshape(local_h, local_w // s, s).sum(axis=2, dtype=np.uint8)
+    blocks = blocks.reshape(local_h // s, s, local_w // s).sum(axis=1, dtype=np.uint8)
+    coverage[top // s:bottom // s, left // s:right // s] = blocks * np.float32(1 / (s * s))
+    return coverage
+
+
+def disk_coverage(width, height, cx, cy, radius):
+    """
+    원의 픽셀 커버리지 (가장자리 1픽셀 안티에일리어싱)
+    """
+    yy = np.arange(height, dtype=np.float32)[:, None] + 0.5
+    xx = np.arange(width, dtype=np.float32)[None, :] + 0.5
+    return np.clip(radius + 0.5 - np.hypot(xx - cx, yy - cy), 0.0, 1.0)
+
+
+def composite(image, coverage, color, alpha=1.0):
+    """
+    image 위에 color 를 커버리지만큼 덮어씀 (제자리 수정)
+    """
+    image += (color - image) * (coverage * alpha)[..., None]
+
+
+def draw_grid(image, meters_per_pixel, px0, py0):
+    """
+    지면 기준 일정 간격의 격자선 (축척 감을 주기 위한 배경)
+
+    Args:
+        px0, py0: 경로 첫 점의 픽셀 좌표 (격자 기준점)
+    """
+    height, width, _ = image.shape
+    step_m = next((step for step in GRID_STEPS if step / meters_per_pixel >= MIN_GRID_PIXELS), GRID_STEPS[-1])
+    step = step_m / meters_per_pixel
+    if step >= max(width, height):
+        return step_m
+    columns = np.round(np.arange(px0 % step, width, step)).astype(int)
+    rows = np.round(np.arange(py0 % step, height, step)).astype(int)
+    image[:, columns[columns < width]] = GRID_COLOR
+    image[rows[rows < height], :] = GRID_COLOR
+    return step_m
+
+
+def render_thumbnail(lat, lon, width, height, scale=1.0, kept=None):
+    """
+    경로 썸네일 한 장
+
+    Args:
+        lat, lon: 좌표 배열
+        width, height: 포인트 크기 (픽셀 크기는 × scale)
+        kept: 겹쳐 그릴 샘플링 경로의 인덱스 배열 (None 이면 생략)
+
+    Returns:
+        (H×W×3 uint8 배열, 지면 기준 m/픽셀 (출력 이미지 픽셀), 격자 간격 m, 축척 상대 오차)
+    """
+    w, h = round(width * scale), round(height * scale)
+    image = np.empty((h, w, 3), dtype=np.float32)
+    image[:] = BACKGROUND
+    if len(lat) == 0:
+        return image.astype(np.uint8), 0.0, 0, 0.0
+
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    x, y = mercator(lat, lon)
+    px, py, meters_per_pixel = fit_viewport(x, y, w, h, padding=12 * scale)
+    grid_step = draw_grid(image, meters_per_pixel, px[0], py[0])
+
+    if len(px) >= 2:
+        composite(image, line_coverage(px, py, w, h, 5.0 * scale), CASING_COLOR)
+        composite(image, line_coverage(px, py, w, h, 3.0 * scale), ROUTE_COLOR)
+        if kept is not None and len(kept) >= 2:
+            composite(image, line_coverage(px[kept], py[kept], w, h, 1.25 * scale), OVERLAY_COLOR)
+    for (cx, cy), color in (((px[0], py[0]), START_COLOR), ((px[-1], py[-1]), END_COLOR)):
+        composite(image, disk_coverage(w, h, cx, cy, 5.5 * scale), CASING_COLOR)
+        composite(image, disk_coverage(w, h, cx, cy, 4.0 * scale), color)
+
+    return (np.clip(image + 0.5, 0, 255).astype(np.uint8), meters_per_pixel, grid_step,
+            scale_error(lat, lon, px, py, meters_per_pixel))
+
+
+# MARK: - 시트 렌더링 (워커)
+
+def load_source(source):
+    if isinstance(source, tuple):
+        _, seed, duration = source
+        return route_traces.synthesize_trace(seed, duration=duration, name=f"synthetic-{seed}")
+    return route_traces.load_trace(source)
+
+
+def thumbnail_name(name):
+    for extension in route_traces.TRACE_EXTENSIONS:
+        if name.endswith(extension):
+            return name[:-len(extension)]
+    return name
+
+
+def render_sheet(job):
+    """
+    트레이스 묶음을 썸네일로 그려 한 장의 시트로 저장
+
+    Returns:
+        {"sheet", "path", "thumbnails", "bytes", "elapsed"}
+    """
+    started = time.perf_counter()
+    width, height, scale = job["width"], job["height"], job["scale"]
+    columns = job["columns"]
+    cell_w, cell_h = round(width * scale), round(height * scale)
+    rows = -(-len(job["sources"]) // columns)
+    sheet = np.empty((SHEET_GAP + rows * (cell_h + SHEET_GAP), SHEET_GAP + columns * (cell_w + SHEET_GAP), 3),
+                     dtype=np.uint8)
+    sheet[:] = SHEET_BACKGROUND
+
+    thumbnails = []
+    written = 0
+    for index, source in enumerate(job["sources"]):
+        trace = load_source(source)
+        lat = np.asarray(trace["latitude"], dtype=float)
+        lon = np.asarray(trace["longitude"], dtype=float)
+        kept = None
+        if job["overlay"] and len(lat) >= 2:
+            timestamps = np.asarray(trace["timestamp"], dtype=float)
+            kept = route_sampling_lab.run_pipeline(job["overlay"], lat, lon, timestamps, job["overlay_params"])
+
+        image, meters_per_pixel, grid_step, error = render_thumbnail(lat, lon, width, height, scale, kept)
+        row, column = divmod(index, columns)
+        top, left = SHEET_GAP + row * (cell_h + SHEET_GAP), SHEET_GAP + column * (cell_w + SHEET_GAP)
+        sheet[top:top + cell_h, left:left + cell_w] = image
+
+        name = thumbnail_name(trace["name"])
+        entry = {
+            "name": name,
+            "cell": [row, column],
+            "points": len(lat),
+            "metersPerPixel": round(meters_per_pixel, 3),
+            "gridStep": grid_step,
+            "scaleError": round(error, 4),
+        }
+        if kept is not None:
+            errors = route_sampling_lab.deviation(lat, lon, kept)
+            entry["kept"] = len(kept)
+            entry["maxDeviation"] = round(float(errors.max()), 2)
+            entry["maxDeviationPixels"] = round(float(errors.max()) / meters_per_pixel, 2)
+        thumbnails.append(entry)
+
+        if job["individual"]:
+            path = os.path.join(job["output"], "thumbs", f"{name}.png")
+            Image.fromarray(image).save(path, compress_level=1)
+            written += os.path.getsize(path)
+
+    path = os.path.join(job["output"], f"sheet_{job['sheet']:04d}.png")
+    Image.fromarray(sheet).save(path, compress_level=1)
+    return {
+        "sheet": job["sheet"],
+        "path": path,
+        "thumbnails": thumbnails,
+        "bytes": written + os.path.getsize(path),
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+# MARK: - 실행
+
+def parse_size(text):
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"WxH 형식이어야 합니다: {text}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"크기는 1 이상이어야 합니다: {text}")
+    return width, height
+
+
+def run(args):
+    """
+    파싱된 인자로 썸네일 렌더링 실행 (종료 코드 반환)
+    """
+    try:
+        sources = route_traces.find_trace_files(args.traces)
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일을 찾을 수 없습니다: {e}")
+        return 1
+
+    synthetic = args.synthetic or (0 if sources else 500)
+    rng = np.random.default_rng(args.seed)
+    for index in range(synthetic):
+        sources.append(("synthetic", args.seed * 1_000_003 + index, int(rng.integers(300, 5400))))
+    if not sources:
+        print("❌ 오류: 렌더링할 트레이스가 없습니다")
+        return 1
+
+    output = args.output or DEFAULT_OUTPUT
+    os.makedirs(output, exist_ok=True)
+    for stale in glob.glob(os.path.join(output, "sheet_*.png")):
+        os.remove(stale)
+    if args.individual:
+        os.makedirs(os.path.join(output, "thumbs"), exist_ok=True)
+
+    width, height = args.size
+    per_sheet = args.columns * args.rows
+    overlay_params = {
+        "interval_scale": 1.0,
+        "interval": route_sampling_lab.SAVE_INTERVAL,
+        "tolerance": args.tolerance,
+    }
+    jobs = [
+        {
+            "sheet": index + 1,
+            "sources": sources[start:start + per_sheet],
+            "width": width,
+            "height": height,
+            "scale": args.scale,
+            "columns": args.columns,
+            "overlay": args.overlay,
+            "overlay_params": overlay_params,
+            "individual": args.individual,
+            "output": output,
+        }
+        for index, start in enumerate(range(0, len(sources), per_sheet))
+    ]
+
+    print("=" * 60)
+    print("🗺  경로 썸네일 렌더링")
+    print("=" * 60)
+    print(f"트레이스: {len(sources):,}개 (합성 {synthetic:,}개)")
+    print(f"썸네일: {width}x{height}pt @{args.scale:g}x, 시트당 {args.columns}x{args.rows}, 워커: {args.jobs}개")
+    if args.overlay:
+        print(f"겹쳐 그리기: {args.overlay} 파이프라인 (허용 오차 {args.tolerance:g}m)")
+    print("=" * 60 + "\n")
+
+    started = time.perf_counter()
+    results = []
+    with profiling.phase("render", sheets=len(jobs), jobs=args.jobs):
+        if args.jobs == 1 or len(jobs) == 1:
+            results = [render_sheet(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                results = list(executor.map(render_sheet, jobs))
+        profiling.count_written(sum(result["bytes"] for result in results))
+    elapsed = time.perf_counter() - started
+
+    with profiling.phase("index"), open(os.path.join(output, "index.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            "size": [width, height],
+            "scale": args.scale,
+            "overlay": args.overlay,
+            "sheets": [{"path": os.path.basename(r["path"]), "thumbnails": r["thumbnails"]} for r in results],
+        }, f, ensure_ascii=False, indent=2)
+        profiling.count_written(f.tell())
+
+    thumbnails = [entry for result in results for entry in result["thumbnails"]]
+    print(f"✅ 썸네일 {len(thumbnails):,}개, 시트 {len(results)}장 "
+          f"({elapsed:.1f}초, 분당 {len(thumbnails) / elapsed * 60:,.0f}개)")
+    degenerate = [entry["name"] for entry in thumbnails if entry["points"] < 2]
+    if degenerate:
+        print(f"⚠️  포인트가 2개 미만인 경로 {len(degenerate)}개: {', '.join(degenerate[:5])}")
+    if args.overlay:
+        worst = sorted((e for e in thumbnails if "maxDeviation" in e), key=lambda e: -e["maxDeviationPixels"])
+        if worst:
+            print("\n썸네일에서 샘플링 차이가 가장 큰 경로 (최대 편차):")
+            for entry in worst[:5]:
+                sheet = next(r["sheet"] for r in results if entry in r["thumbnails"])
+                print(f"   {entry['name']:<28} {entry['maxDeviation']:>7.1f}m "
+                      f"({entry['maxDeviationPixels']:.1f}px)  시트 {sheet} {entry['cell']}")
+    print(f"📂 출력 위치: {output}")
+
+    # 표시 축척(격자, m/픽셀, 편차 픽셀)이 실제 대원 거리와 맞는지 확인
+    skewed = [entry for entry in thumbnails if entry["scaleError"] > SCALE_TOLERANCE]
+    if skewed:
+        entry = max(skewed, key=lambda e: e["scaleError"])
+        print(f"❌ 축척 검증 실패: {len(skewed)}개 썸네일의 m/픽셀이 대원 거리와 "
+              f"{SCALE_TOLERANCE:.0%} 넘게 어긋남 (최대 {entry['scaleError']:.1%}, {entry['name']})")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="경로 썸네일 일괄 렌더링 (NumPy Web Mercator 래스터라이저)")
+    parser.add_argument("traces", nargs="*", help="트레이스 파일 또는 디렉토리 (.json/.route.gz/.csv)")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 트레이스 개수 (트레이스 미지정 시 기본 500)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 트레이스 시드")
+    parser.add_argument("--size", type=parse_size, default=(160, 120), help="썸네일 크기 WxH 포인트 (기본: 160x120)")
+    parser.add_argument("--scale", type=float, default=1.0, help="픽셀 배율 (기본: 1.0)")
+    parser.add_argument("--columns", type=int, default=10, help="시트 열 수 (기본: 10)")
+    parser.add_argument("--rows", type=int, default=10, help="시트 행 수 (기본: 10)")
+    parser.add_argument("--overlay", choices=route_sampling_lab.PIPELINES,
+                        help="이 파이프라인으로 샘플링한 경로를 겹쳐 그림")
+    parser.add_argument("--tolerance", type=float, default=route_sampling_lab.DEFAULT_TOLERANCE,
+                        help="겹쳐 그릴 경로의 DP 허용 오차 (m, 기본: 10)")
+    parser.add_argument("--individual", action="store_true", help="썸네일을 한 장씩 thumbs/ 에도 저장")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="워커 프로세스 수")
+    parser.add_argument("-o", "--output", help="출력 디렉토리 (기본: build/route_thumbnails)")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    if args.columns <= 0 or args.rows <= 0 or args.scale <= 0:
+        parser.error("--columns, --rows, --scale 은 0보다 커야 합니다")
+
+    with profiling.session(args.profile, "route-thumbnails", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+경로(RoutePoint) 트레이스 로드/생성 공통 모듈
+오프라인 분석 스크립트들이 같은 형식으로 주행 기록을 읽도록
+트레이스 코퍼스 로드와 재현 가능한 합성 트레이스 생성을 제공합니다.
+
+지원 형식:
+- *.json       RoutePoint 배열 (앱의 JSONEncoder 출력 그대로)
+- *.route.gz   RouteDataManager 가 저장한 경로 파일 (raw DEFLATE + JSON)
+- *.csv        latitude,longitude,timestamp,speed,accuracy 헤더를 가진 CSV
+
+트레이스는 열(column) 단위 딕셔너리로 표현합니다:
+    {"name": str, "latitude": [...], "longitude": [...],
+     "timestamp": [...], "speed": [...], "accuracy": [...]}
+timestamp 는 초 단위 실수이며 (Swift 기본 Date 인코딩과 동일하게
+2001-01-01 기준), speed 는 km/h, accuracy 는 미터입니다.
+"""
+
+import csv
+import json
+import math
+import os
+import random
+import zlib
+from datetime import datetime, timezone
+
+import profiling
+
+COLUMNS = ["latitude", "longitude", "timestamp", "speed", "accuracy"]
+TRACE_EXTENSIONS = (".json", ".route.gz", ".csv")
+
+# Swift Date 의 기준 시각 (timeIntervalSinceReferenceDate)
+REFERENCE_DATE = datetime(2001, 1, 1, tzinfo=timezone.utc)
+
+EARTH_RADIUS = 6_371_000.0  # meters
+
+# 합성 트레이스 시작 위치 (서울시청)
+DEFAULT_ORIGIN = (37.5665, 126.9780)
+
+
+def _parse_timestamp(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    # ISO 8601 문자열 (dateEncodingStrategy = .iso8601)
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - REFERENCE_DATE).total_seconds()
+
+
+def _columns_from_points(name, points):
+    trace = {"name": name}
+    for column in COLUMNS:
+        trace[column] = []
+    for point in points:
+        trace["latitude"].append(float(point["latitude"]))
+        trace["longitude"].append(float(point["longitude"]))
+        trace["timestamp"].append(_parse_timestamp(point["timestamp"]))
+        trace["speed"].append(float(point.get("speed", 0.0)))
+        trace["accuracy"].append(float(point.get("accuracy", 5.0)))
+    return trace
+
+
+def load_trace(path):
+    """
+    트레이스 파일 하나를 열 단위 딕셔너리로 로드
+
+    Args:
+        path: .json / .route.gz / .csv 파일 경로
+
+    Returns:
+        트레이스 딕셔너리
+    """
+    name = os.path.basename(path)
+    with profiling.phase("load", path=name):
+        profiling.count_read(os.path.getsize(path))
+        return _load_trace_file(path, name)
+
+
+def _load_trace_file(path, name):
+    if path.endswith(".route.gz"):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # Apple Compression 의 COMPRESSION_ZLIB 는 헤더 없는 raw DEFLATE
+        try:
+            data = zlib.decompress(raw, -zlib.MAX_WBITS)
+        except zlib.error:
+            data = zlib.decompress(raw)
+        return _columns_from_points(name, json.loads(data))
+
+    if path.endswith(".csv"):
+        with open(path, newline='', encoding='utf-8') as f:
+            return _columns_from_points(name, list(csv.DictReader(f)))
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    # {"routePoints": [...]} 형태의 Trip JSON 도 허용
+    if isinstance(data, dict):
+        data = data.get("routePoints", [])
+    return _columns_from_points(name, data)
+
+
+def find_trace_files(paths):
+    """
+    파일/디렉토리 경로 목록에서 트레이스 파일을 재귀적으로 수집 (정렬된 순서)
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for filename in files:
+                    if filename.endswith(TRACE_EXTENSIONS):
+                        found.append(os.path.join(root, filename))
+        elif os.path.exists(path):
+            found.append(path)
+        else:
+            raise FileNotFoundError(path)
+    return sorted(found)
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    두 좌표 사이의 대원 거리 (미터)
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(min(1.0, a)))
+
+
+def synthesize_trace(seed, duration=1800, origin=DEFAULT_ORIGIN, start_time=None, name=None):
+    """
+    재현 가능한 합성 주행 트레이스 생성 (1초 간격)
+
+    시내 주행을 흉내 내어 가속/감속, 신호 대기 정차, 교차로 회전,
+    GPS 노이즈와 간헐적인 정확도 저하를 포함합니다.
+
+    Args:
+        seed: 난수 시드 (같은 시드 → 같은 트레이스)
+        duration: 주행 시간 (초)
+        origin: 시작 좌표 (lat, lon)
+        start_time: 시작 시각 (2001-01-01 기준 초, None 이면 시드로 결정)
+        name: 트레이스 이름
+
+    Returns:
+        트레이스 딕셔너리
+    """
+    rng = random.Random(seed)
+
+    lat, lon = origin
+    lat += rng.uniform(-0.05, 0.05)
+    lon += rng.uniform(-0.05, 0.05)
+    heading = rng.uniform(0, 2 * math.pi)
+    speed = 0.0                      # m/s
+    cruise = rng.uniform(8, 17)      # 목표 순항 속도 (m/s)
+    stop_remaining = 0
+    if start_time is None:
+        start_time = 788_918_400.0 + rng.randrange(0, 365 * 86400)  # 2026년 중 임의 시각
+
+    trace = {"name": name or f"synthetic-{seed}"}
+    for column in COLUMNS:
+        trace[column] = []
+
+    for second in range(int(duration)):
+        if stop_remaining > 0:
+            stop_remaining -= 1
+            speed = max(0.0, speed - 3.0)
+        else:
+            if rng.random() < 0.006:
+                # 신호 대기 / 정체
+                stop_remaining = rng.randint(15, 120)
+            elif rng.random() < 0.01:
+                cruise = rng.uniform(6, 22)
+            speed += max(-3.0, min(2.0, (cruise - speed) * 0.2 + rng.gauss(0, 0.3)))
+            speed = max(0.0, speed)
+
+        if speed > 1.0:
+            if rng.random() < 0.004:
+                heading += rng.choice([-1, 1]) * math.pi / 2  # 교차로 회전
+            heading += rng.gauss(0, 0.02)                     # 완만한 곡선
+
+        north = speed * math.cos(heading)
+        east = speed * math.sin(heading)
+        lat += math.degrees(north / EARTH_RADIUS)
+        lon += math.degrees(east / (EARTH_RADIUS * math.cos(math.radians(lat))))
+
+        accuracy = rng.uniform(3, 10)
+        if rng.random() < 0.01:
+            accuracy = rng.uniform(30, 80)  # 고가도로/터널 등 정확도 저하
+        noise = rng.gauss(0, accuracy / 3)
+        noise_angle = rng.uniform(0, 2 * math.pi)
+        noisy_lat = lat + math.degrees(noise * math.cos(noise_angle) / EARTH_RADIUS)
+        noisy_lon = lon + math.degrees(
+            noise * math.sin(noise_angle) / (EARTH_RADIUS * math.cos(math.radians(lat)))
+        )
+
+        trace["latitude"].append(noisy_lat)
+        trace["longitude"].append(noisy_lon)
+        trace["timestamp"].append(start_time + second)
+        trace["speed"].append(speed * 3.6)
+        trace["accuracy"].append(accuracy)
+
+    return trace
+
+
+def synthesize_corpus(count, seed=0, min_duration=300, max_duration=5400):
+    """
+    합성 트레이스 count 개를 순차적으로 생성하는 제너레이터
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        duration = rng.randint(min_duration, max_duration)
+        yield synthesize_trace(seed * 1_000_003 + index, duration=duration)
+
+
+def trace_to_points(trace):
+    """
+    열 단위 트레이스를 RoutePoint 딕셔너리 리스트로 변환 (앱 JSON 형식)
+    """
+    return [
+        {column: trace[column][i] for column in COLUMNS}
+        for i in range(len(trace["timestamp"]))
+    ]
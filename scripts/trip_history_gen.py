@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+합성 주행 기록 데이터셋 생성 스크립트
+페이지네이션 / 자동 정리 / 저장 공간 통계 부하 테스트용으로
+앱이 저장하는 형식 그대로의 주행 기록을 10k~1M 건 규모로 생성합니다.
+
+출력 (출력 디렉토리 기준):
+- summaries.json         TripSummary 배열 (UserDefaults "saved_trips_v2" 값, 최신순)
+- Routes/{UUID}.route.gz 최근 N건의 경로 파일 (RouteDataManager 형식)
+- trips.json             (--legacy) 경로를 포함한 Trip 배열 ("saved_trips" 마이그레이션용)
+- com.hogumeter.app.plist (--plist) 위 데이터를 담은 UserDefaults plist
+- manifest.json          시드/건수/바이트 수 (StorageStats 검증용)
+
+모든 출력은 한 건씩 스트리밍으로 기록하므로 건수와 무관하게 메모리 사용량이
+일정하며, 같은 시드는 항상 같은 데이터셋을 만듭니다.
+"""
+
+import argparse
+import base64
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta, timezone
+
+import compile_fares
+import profiling
+import route_traces
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 요금표 원본 경로는 compile_fares 한 곳에서 관리
+DEFAULT_FARES_PATH = compile_fares.SOURCE_PATHS[0]
+DRIVER_QUOTES_PATH = os.path.join(PROJECT_ROOT, "HoguMeter/Core/Constants/DriverQuotes.swift")
+
+SUMMARIES_KEY = "saved_trips_v2"   # TripRepository.summariesKey
+LEGACY_TRIPS_KEY = "saved_trips"   # TripRepository.legacyTripsKey
+PLIST_NAME = "com.hogumeter.app.plist"
+
+KST = timezone(timedelta(hours=9))
+
+# 시간대별 상대 수요 (0시 ~ 23시)
+HOURLY_DEMAND = [
+    5, 4, 3, 2, 1, 1, 2, 5, 9, 7, 5, 5,
+    6, 5, 5, 5, 6, 8, 9, 8, 7, 7, 8, 7,
+]
+
+# 지역별 중심 좌표와 대표 동네 (LocationFormatter 출력과 비슷한 표기)
+REGION_AREAS = {
+    "seoul": ((37.5665, 126.9780), ["강남구 역삼동", "마포구 서교동", "종로구 사직동", "송파구 잠실동", "영등포구 여의도동"]),
+    "busan": ((35.1796, 129.0756), ["해운대구 우동", "부산진구 부전동", "중구 남포동", "수영구 광안동"]),
+    "daegu": ((35.8714, 128.6014), ["중구 동인동", "수성구 범어동", "북구 침산동"]),
+    "incheon": ((37.4563, 126.7052), ["남동구 구월동", "연수구 송도동", "부평구 부평동"]),
+    "gwangju": ((35.1595, 126.8526), ["동구 충장동", "서구 치평동", "북구 용봉동"]),
+    "daejeon": ((36.3504, 127.3845), ["서구 둔산동", "유성구 봉명동", "중구 은행동"]),
+    "gyeonggi": ((37.2636, 127.0286), ["수원시 팔달구", "성남시 분당구", "고양시 일산동구", "용인시 수지구"]),
+}
+
+# 지역 코드별 할증 사업구역 이름 (CitySurchargeRate.rates)
+SURCHARGE_CITIES = {
+    "seoul": ("서울특별시", 0.20),
+    "busan": ("부산광역시", 0.30),
+    "daegu": ("대구광역시", 0.20),
+    "incheon": ("인천광역시", 0.30),
+    "gwangju": ("광주광역시", 0.20),
+    "daejeon": ("대전광역시", 0.30),
+    "gyeonggi": ("경기도", 0.20),
+}
+
+REGION_WEIGHTS = {"seoul": 45, "gyeonggi": 20, "busan": 10, "incheon": 8, "daegu": 7, "daejeon": 5, "gwangju": 5}
+SURCHARGE_MODE_WEIGHTS = {"realistic": 60, "fun": 30, "off": 10}
+FUN_SURCHARGE_AMOUNT = 2000  # SettingsRepository.regionSurchargeAmount 기본값
+
+REFERENCE_DATE = route_traces.REFERENCE_DATE
+
+
+# MARK: - 보조 함수
+
+def parse_count(text):
+    """
+    "10k", "100k", "1M" 같은 건수 표기를 정수로 변환
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([kKmM]?)", text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"잘못된 건수: {text}")
+    multiplier = {"": 1, "k": 1_000, "m": 1_000_000}[match.group(2).lower()]
+    return int(float(match.group(1)) * multiplier)
+
+
+def load_region_fares():
+    with open(DEFAULT_FARES_PATH, 'r', encoding='utf-8') as f:
+        return {region["code"]: region for region in json.load(f)["regions"]}
+
+
+def load_driver_quotes():
+    """
+    DriverQuotes.quotes 배열의 문자열을 Swift 소스에서 추출
+    """
+    try:
+        with open(DRIVER_QUOTES_PATH, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except FileNotFoundError:
+        return ["안녕하세요~"]
+    block = source.split("static let quotes", 1)[-1].split("\n    ]", 1)[0]
+    return re.findall(r'^\s*"(.+)",?\s*$', block, re.MULTILINE) or ["안녕하세요~"]
+
+
+def fare_time_zone(hour):
+    """
+    FareTimeZone.current(from:) 와 같은 시간대 구분
+    """
+    if 4 <= hour < 22:
+        return "day"
+    if hour == 22 or 2 <= hour < 4:
+        return "night1"
+    return "night2"
+
+
+def weighted_choice(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def to_reference_seconds(moment):
+    return (moment - REFERENCE_DATE).total_seconds()
+
+
+# MARK: - 주행 기록 생성
+
+def fare_breakdown(fare, zone, high_speed_distance, low_speed_duration):
+    """
+    FareCalculator.breakdown 의 병산제 계산 (지역 할증 제외)
+
+    Returns:
+        (baseFare, distanceFare, timeFare)
+    """
+    distance_units = high_speed_distance / fare[f"{zone}DistanceUnit"]
+    time_units = low_speed_duration / fare[f"{zone}TimeUnit"]
+    total_units = distance_units + time_units
+    base_units = fare[f"{zone}BaseDistance"] / fare[f"{zone}DistanceUnit"]
+    extra_units = max(0.0, total_units - base_units)
+
+    distance_fare = time_fare = 0
+    if total_units > 0 and extra_units > 0:
+        extra_fare = int(extra_units) * fare[f"{zone}DistanceFare"]
+        distance_fare = int(extra_fare * (distance_units / total_units))
+        time_fare = extra_fare - distance_fare
+    return fare[f"{zone}BaseFare"], distance_fare, time_fare
+
+
+def generate_trip(rng, start, fares, quotes):
+    """
+    주행 기록 한 건 생성
+
+    Args:
+        rng: random.Random
+        start: 출발 시각 (KST datetime)
+
+    Returns:
+        (TripSummary 딕셔너리, 지역 코드)
+    """
+    code = weighted_choice(rng, REGION_WEIGHTS)
+    fare = fares[code]
+    zone = fare_time_zone(start.hour)
+
+    distance_km = min(80.0, max(0.3, rng.lognormvariate(math.log(6.0), 0.8)))
+    average_speed = rng.uniform(15, 30) if zone == "day" else rng.uniform(25, 45)  # km/h
+    duration = distance_km / average_speed * 3600
+    low_speed_duration = duration * rng.uniform(0.05, 0.35)
+    high_speed_distance = distance_km * 1000 * rng.uniform(0.85, 0.98)
+
+    base, distance_fare, time_fare = fare_breakdown(fare, zone, high_speed_distance, low_speed_duration)
+
+    areas = REGION_AREAS[code][1]
+    start_region = rng.choice(areas)
+    end_region = rng.choice(areas) if distance_km < 15 else rng.choice(REGION_AREAS[weighted_choice(rng, REGION_WEIGHTS)][1])
+
+    mode = weighted_choice(rng, SURCHARGE_MODE_WEIGHTS)
+    region_changes = 0
+    surcharge_rate = 0.0
+    region_surcharge = 0
+    if mode == "realistic":
+        if rng.random() < min(0.6, distance_km / 60):
+            region_changes = 1
+            surcharge_rate = SURCHARGE_CITIES[code][1]
+            # 사업구역 밖에서 발생한 요금에만 할증 적용
+            region_surcharge = int((distance_fare + time_fare) * rng.uniform(0.1, 0.6) * surcharge_rate)
+    elif mode == "fun":
+        region_changes = int(distance_km / rng.uniform(1.5, 4.0))
+        region_surcharge = FUN_SURCHARGE_AMOUNT * region_changes
+
+    breakdown = {
+        "baseFare": base,
+        "distanceFare": distance_fare,
+        "timeFare": time_fare,
+        "regionSurcharge": region_surcharge,
+        "nightSurcharge": 0,  # 심야 할증은 시간대별 요금에 이미 반영됨
+    }
+    end = start + timedelta(seconds=duration)
+
+    summary = {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper(),
+        "startTime": to_reference_seconds(start),
+        "endTime": to_reference_seconds(end),
+        "totalFare": sum(breakdown.values()),
+        "distance": round(distance_km, 3),
+        "duration": round(duration, 3),
+        "startRegion": start_region,
+        "endRegion": end_region,
+        "regionChanges": region_changes,
+        "isNightTrip": zone != "day",
+        "fareBreakdown": breakdown,
+        "driverQuote": rng.choice(quotes) if rng.random() < 0.8 else None,
+        "surchargeMode": mode,
+        "surchargeRate": surcharge_rate,
+        "hasRouteData": False,
+    }
+    if summary["driverQuote"] is None:
+        del summary["driverQuote"]  # JSONEncoder 는 nil 옵셔널 키를 생략
+    return summary, code
+
+
+def generate_route(seed, summary, code):
+    """
+    주행 기록에 맞는 경로 생성 (RouteOptimizer.downsample 과 같은 5초 간격)
+    """
+    duration = max(60, min(int(summary["duration"]), 4 * 3600))
+    trace = route_traces.synthesize_trace(
+        seed, duration=duration, origin=REGION_AREAS[code][0], start_time=summary["startTime"],
+    )
+    points = route_traces.trace_to_points(trace)
+    sampled = [point for index, point in enumerate(points) if index % 5 == 0]
+    if sampled[-1] is not points[-1]:
+        sampled.append(points[-1])
+    return sampled
+
+
+def trip_starts(rng, count, end, trips_per_day):
+    """
+    최신순 출발 시각 제너레이터 (시간대별 수요를 반영한 비균질 포아송 과정)
+    """
+    peak = max(HOURLY_DEMAND)
+    mean_demand = sum(HOURLY_DEMAND) / len(HOURLY_DEMAND)
+    rate = trips_per_day / 86400 * peak / mean_demand  # 초당 최대 발생률
+    cursor = end
+    produced = 0
+    while produced < count:
+        cursor -= timedelta(seconds=rng.expovariate(rate))
+        if rng.random() * peak < HOURLY_DEMAND[cursor.hour]:
+            produced += 1
+            yield cursor
+
+
+# MARK: - 스트리밍 출력
+
+class JSONArrayWriter:
+    """
+    JSON 배열을 원소 단위로 기록 (여러 싱크에 동시에 기록 가능)
+    """
+
+    def __init__(self, *sinks):
+        self.sinks = sinks
+        self.count = 0
+        self.bytes = 0
+        self._write(b"[")
+
+    def _write(self, data):
+        self.bytes += len(data)
+        for sink in self.sinks:
+            sink.write(data)
+            if not isinstance(sink, PlistDataWriter):
+                profiling.count_written(len(data))
+
+    def append(self, item):
+        data = json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._write(data if self.count == 0 else b"," + data)
+        self.count += 1
+
+    def close(self):
+        self._write(b"]")
+
+
+class PlistDataWriter:
+    """
+    UserDefaults plist 의 <data> 값을 base64 로 스트리밍 기록
+    """
+
+    LINE_BYTES = 57  # base64 한 줄 76자
+
+    def __init__(self, f, key):
+        self.f = f
+        self.pending = b""
+        self._emit(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+            '"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
+            '<plist version="1.0">\n<dict>\n'
+        )
+        self.begin(key)
+
+    def _emit(self, text):
+        self.f.write(text)
+        profiling.count_written(len(text))
+
+    def begin(self, key):
+        self._emit(f"\t<key>{key}</key>\n\t<data>\n")
+
+    def write(self, data):
+        self.pending += data
+        usable = len(self.pending) - len(self.pending) % self.LINE_BYTES
+        for offset in range(0, usable, self.LINE_BYTES):
+            chunk = self.pending[offset:offset + self.LINE_BYTES]
+            self._emit("\t" + base64.b64encode(chunk).decode('ascii') + "\n")
+        self.pending = self.pending[usable:]
+
+    def end(self):
+        if self.pending:
+            self._emit("\t" + base64.b64encode(self.pending).decode('ascii') + "\n")
+            self.pending = b""
+        self._emit("\t</data>\n")
+
+    def close(self):
+        self._emit("</dict>\n</plist>\n")
+
+
+def deflate(data):
+    # RouteDataManager.compress 와 같은 raw DEFLATE (COMPRESSION_ZLIB)
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def generate_dataset(output_dir, count, seed=0, routes=100, trips_per_day=3.0,
+                     end=None, legacy=False, plist=False, progress=True):
+    """
+    주행 기록 데이터셋을 출력 디렉토리에 생성
+
+    Args:
+        output_dir: 출력 디렉토리
+        count: 주행 기록 수
+        seed: 난수 시드
+        routes: 경로 파일을 만들 최근 주행 기록 수
+        trips_per_day: 하루 평균 주행 횟수
+        end: 가장 최근 주행의 기준 시각 (None 이면 시드 기반 고정 시각)
+        legacy: 경로를 포함한 legacy trips.json 도 생성
+        plist: UserDefaults plist 도 생성
+
+    Returns:
+        manifest 딕셔너리
+    """
+    rng = random.Random(seed)
+    with profiling.phase("load"):
+        fares = load_region_fares()
+        quotes = load_driver_quotes()
+    if end is None:
+        end = datetime(2026, 1, 1, tzinfo=KST) + timedelta(days=rng.randrange(365))
+
+    routes_dir = os.path.join(output_dir, "Routes")
+    os.makedirs(routes_dir, exist_ok=True)
+
+    summaries_file = open(os.path.join(output_dir, "summaries.json"), 'wb')
+    plist_file = open(os.path.join(output_dir, PLIST_NAME), 'w', encoding='ascii') if plist else None
+    plist_writer = PlistDataWriter(plist_file, SUMMARIES_KEY) if plist else None
+    summaries = JSONArrayWriter(*[sink for sink in (summaries_file, plist_writer) if sink])
+    legacy_file = open(os.path.join(output_dir, "trips.json"), 'wb') if legacy else None
+    trips = JSONArrayWriter(legacy_file) if legacy else None
+
+    route_bytes = 0
+    route_points = 0
+    fare_total = 0
+    started = time.perf_counter()
+    step = max(1, count // 10)
+
+    try:
+        with profiling.phase("generate", count=count):
+            for index, start in enumerate(trip_starts(rng, count, end, trips_per_day)):
+                summary, code = generate_trip(rng, start, fares, quotes)
+                points = []
+                if index < routes:
+                    with profiling.phase("route"):
+                        points = generate_route(rng.getrandbits(32), summary, code)
+                        data = deflate(json.dumps(points, separators=(',', ':')).encode('utf-8'))
+                        with open(os.path.join(routes_dir, f"{summary['id']}.route.gz"), 'wb') as f:
+                            f.write(data)
+                        profiling.count_written(len(data))
+                    summary["hasRouteData"] = True
+                    route_bytes += len(data)
+                    route_points += len(points)
+
+                summaries.append(summary)
+                if trips:
+                    trip = {key: value for key, value in summary.items() if key != "hasRouteData"}
+                    trip["routePoints"] = points
+                    trips.append(trip)
+                fare_total += summary["totalFare"]
+
+                if progress and (index + 1) % step == 0:
+                    elapsed = time.perf_counter() - started
+                    print(f"   {index + 1:>10,}건 ({100 * (index + 1) / count:.0f}%, {(index + 1) / elapsed:,.0f}건/초)")
+
+        summaries.close()
+        if plist_writer:
+            plist_writer.end()
+        if trips:
+            trips.close()
+            if plist_writer:
+                # 레거시 키도 함께 넣어 마이그레이션 경로를 테스트할 수 있게 함
+                plist_writer.begin(LEGACY_TRIPS_KEY)
+                legacy_file.flush()
+                with profiling.phase("plist-legacy"), open(legacy_file.name, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        profiling.count_read(len(chunk))
+                        plist_writer.write(chunk)
+                plist_writer.end()
+        if plist_writer:
+            plist_writer.close()
+    finally:
+        summaries_file.close()
+        if plist_file:
+            plist_file.close()
+        if legacy_file:
+            legacy_file.close()
+
+    manifest = {
+        "seed": seed,
+        "count": count,
+        "routes": min(routes, count),
+        "tripsPerDay": trips_per_day,
+        "newestStart": end.isoformat(),
+        "metadataSizeBytes": summaries.bytes,
+        "routeDataSizeBytes": route_bytes,
+        "totalSizeBytes": summaries.bytes + route_bytes,
+        "routePoints": route_points,
+        "totalFare": fare_total,
+        "elapsedSeconds": round(time.perf_counter() - started, 3),
+    }
+    with profiling.phase("manifest"), open(os.path.join(output_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        profiling.count_written(f.tell())
+    return manifest
+
+
+def run(args):
+    """
+    파싱된 인자로 데이터셋 생성 (종료 코드 반환)
+    """
+    output_dir = args.output or os.path.join(PROJECT_ROOT, "build", f"trip_history_{args.count}")
+
+    print("=" * 60)
+    print("🚕 합성 주행 기록 생성")
+    print("=" * 60)
+    print(f"건수: {args.count:,}건 (경로 파일 {min(args.routes, args.count):,}건), 시드: {args.seed}")
+    print(f"출력: {output_dir}")
+    print("=" * 60 + "\n")
+
+    if args.count <= 0:
+        print("❌ 오류: 건수는 1 이상이어야 합니다")
+        return 1
+
+    manifest = generate_dataset(
+        output_dir, args.count, seed=args.seed, routes=args.routes,
+        trips_per_day=args.trips_per_day, legacy=args.legacy, plist=args.plist,
+    )
+
+    print(f"\n✅ 생성 완료 ({manifest['elapsedSeconds']:.1f}초)")
+    print(f"   메타데이터: {manifest['metadataSizeBytes'] / 1_048_576:.2f} MB")
+    print(f"   경로 데이터: {manifest['routeDataSizeBytes'] / 1_048_576:.2f} MB ({manifest['routePoints']:,} 포인트)")
+    print(f"📂 출력 위치: {output_dir}")
+    return 0
+
+
+def main(argv=None):
+    """
+    명령행 진입점 (종료 코드 반환)
+    """
+    parser = argparse.ArgumentParser(description="합성 주행 기록 데이터셋 생성")
+    parser.add_argument("count", type=parse_count, help="주행 기록 수 (예: 10k, 100k, 1M)")
+    parser.add_argument("-o", "--output", help="출력 디렉토리 (기본: build/trip_history_<count>)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--routes", type=parse_count, default=100,
+                        help="경로 파일을 만들 최근 주행 기록 수 (기본: 100, TripRepository.maxTripsCount)")
+    parser.add_argument("--trips-per-day", type=float, default=3.0, help="하루 평균 주행 횟수")
+    parser.add_argument("--legacy", action="store_true", help="경로 포함 legacy trips.json 도 생성")
+    parser.add_argument("--plist", action="store_true", help="UserDefaults plist 도 생성")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "history", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Asset Catalog 사전 검증 스크립트
+모든 *.xcassets 의 Contents.json 과 디스크의 파일을 대조하고, PNG 는 IHDR 헤더만 읽어
+(디코딩 없이) 픽셀 크기와 알파 채널을 확인합니다. 빌드 전에 매번 돌려도 수 밀리초면 끝납니다.
+
+검사 항목:
+- Contents.json 파싱·구조 오류 (객체가 아닌 최상위 값/images 항목, 잘못된 size/scale)
+- 참조된 파일 누락, 참조되지 않은 파일 (Xcode 의 unassigned child)
+- 같은 슬롯(idiom/size/scale/appearance) 중복
+- 앱 아이콘 PNG 크기 = size × scale, 앱 아이콘은 PNG 만 허용
+- 마케팅 아이콘(ios-marketing, 단일 크기 1024 아이콘)의 알파 채널 (App Store 거부 사유)
+- 이미지 세트의 배율별 크기 일관성 (@2x 가 @1x 의 두 배인지)
+- 프로젝트가 iPad 를 지원하면 앱 아이콘에 iPad 필수 슬롯이 있는지
+  (resize_app_icon.py 의 update_contents_json 은 iPhone 항목만 쓰므로 iPad 파일이 고아가 됨)
+
+세트(.appiconset/.imageset 등) 하나가 스레드 풀의 작업 단위이며, 파일 I/O 는 세트당
+Contents.json 한 번과 이미지당 헤더 수십 바이트뿐입니다.
+
+사용 예:
+    python3 scripts/validate_assets.py            # HoguMeter/ 아래 모든 카탈로그
+    python3 scripts/validate_assets.py --xcode    # Xcode 빌드 단계용 출력 (이슈 내비게이터에 표시)
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import profiling
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROOT = os.path.join(PROJECT_ROOT, "HoguMeter")
+PROJECT_PATH = os.path.join(PROJECT_ROOT, "HoguMeter.xcodeproj/project.pbxproj")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# IHDR 색 형식 중 알파 채널이 있는 것 (그레이+알파, RGBA)
+ALPHA_COLOR_TYPES = {4, 6}
+
+# 이미지 파일을 가진 세트
+IMAGE_SET_EXTENSIONS = (".appiconset", ".imageset", ".launchimage")
+
+# TARGETED_DEVICE_FAMILY 값별 앱 아이콘 필수 슬롯 (idiom, size, scale)
+REQUIRED_ICON_SLOTS = {
+    "1": [("iphone", "60x60", "2x"), ("iphone", "60x60", "3x")],
+    "2": [("ipad", "76x76", "2x"), ("ipad", "83.5x83.5", "2x")],
+}
+MARKETING_SLOT = ("ios-marketing", "1024x1024", "1x")
+
+Issue = namedtuple("Issue", "level path message")
+
+
+# MARK: - PNG 헤더
+
+def read_png_header(path):
+    """
+    PNG 의 IHDR 와 IDAT 이전 청크 헤더만 읽어 크기/알파 여부를 반환 (디코딩 없음)
+
+    팔레트/RGB 이미지의 tRNS 청크도 알파로 봅니다.
+
+    Returns:
+        ({"width", "height", "bit_depth", "color_type", "alpha"}, 읽은 바이트 수)
+
+    Raises:
+        ValueError: PNG 가 아니거나 IHDR 가 손상된 경우
+    """
+    with open(path, 'rb') as f:
+        head = f.read(33)
+        if head[:8] != PNG_SIGNATURE:
+            raise ValueError("PNG 시그니처가 아닙니다")
+        if len(head) < 33:
+            raise ValueError("IHDR 가 잘려 있습니다")
+        length, kind = struct.unpack(">I4s", head[8:16])
+        if kind != b"IHDR" or length != 13:
+            raise ValueError("첫 청크가 IHDR 가 아닙니다")
+        width, height, bit_depth, color_type = struct.unpack(">IIBB", head[16:26])
+
+        alpha = color_type in ALPHA_COLOR_TYPES
+        if not alpha:
+            # 픽셀 데이터(IDAT) 전까지 청크 헤더만 건너뛰며 tRNS 확인
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    break
+                length, kind = struct.unpack(">I4s", chunk)
+                if kind == b"tRNS":
+                    alpha = True
+                    break
+                if kind in (b"IDAT", b"IEND"):
+                    break
+                f.seek(length + 4, os.SEEK_CUR)
+        header = {
+            "width": width,
+            "height": height,
+            "bit_depth": bit_depth,
+            "color_type": color_type,
+            "alpha": alpha,
+        }
+        return header, f.tell()
+
+
+# MARK: - 슬롯
+
+def parse_size(text):
+    """
+    "83.5x83.5" → (83.5, 83.5)
+
+    Raises:
+        ValueError: 형식이 맞지 않을 때
+    """
+    try:
+        width, height = text.lower().split("x")
+        return float(width), float(height)
+    except ValueError:
+        raise ValueError(f"size 형식이 잘못되었습니다: {text!r}") from None
+
+
+def parse_scale(text):
+    """
+    "2x" → 2.0 (없으면 1.0)
+
+    Raises:
+        ValueError: 형식이 맞지 않거나 0 이하일 때
+    """
+    if not text:
+        return 1.0
+    try:
+        scale = float(text.rstrip("x"))
+    except ValueError:
+        raise ValueError(f"scale 형식이 잘못되었습니다: {text!r}") from None
+    if scale <= 0:
+        raise ValueError(f"scale 은 0보다 커야 합니다: {text!r}")
+    return scale
+
+
+def entry_problem(image):
+    """
+    images 항목의 구조 오류 (없으면 None). 이후 검사는 모두 이 구조를 가정합니다.
+    """
+    if not isinstance(image, dict):
+        return "항목이 객체가 아닙니다"
+    for field in ("filename", "idiom", "platform", "size", "scale", "role", "subtype"):
+        if not isinstance(image.get(field, ""), str):
+            return f"{field} 값이 문자열이 아닙니다"
+    appearances = image.get("appearances", [])
+    if not isinstance(appearances, list) or not all(isinstance(item, dict) for item in appearances):
+        return "appearances 가 객체 배열이 아닙니다"
+    return None
+
+
+def slot_key(image):
+    """
+    Xcode 가 한 칸으로 취급하는 슬롯 식별자
+    """
+    return (
+        image.get("idiom"),
+        image.get("platform"),
+        image.get("size"),
+        image.get("scale"),
+        image.get("role"),
+        image.get("subtype"),
+        json.dumps(image.get("appearances", []), sort_keys=True),
+    )
+
+
+def slot_label(image):
+    parts = [image.get("idiom", "?")]
+    if image.get("size"):
+        parts.append(image["size"])
+    if image.get("scale"):
+        parts.append(f"@{image['scale']}")
+    for appearance in image.get("appearances", []):
+        parts.append(f"{appearance.get('appearance')}={appearance.get('value')}")
+    return " ".join(parts)
+
+
+def is_marketing(image):
+    """
+    알파가 허용되지 않는 마케팅 아이콘 (다크/틴트 appearance 변형은 제외)
+    """
+    if image.get("appearances"):
+        return False
+    if image.get("idiom") == "ios-marketing":
+        return True
+    # Xcode 14+ 단일 크기 아이콘: 모든 크기의 원본이자 App Store 아이콘
+    return image.get("idiom") == "universal" and image.get("platform") == "ios" and image.get("size") == "1024x1024"
+
+
+# MARK: - 세트 검사 (스레드 풀 작업)
+
+def check_set(set_dir, required_slots):
+    """
+    세트 디렉토리 하나를 검사
+
+    Args:
+        required_slots: 반드시 채워져 있어야 할 (idiom, size, scale) 목록 (앱 아이콘만)
+
+    Returns:
+        (Issue 목록, 검사한 이미지 수, 읽은 바이트 수)
+    """
+    issues = []
+    contents_path = os.path.join(set_dir, "Contents.json")
+    try:
+        with open(contents_path, 'rb') as f:
+            raw = f.read()
+        contents = json.loads(raw)
+    except FileNotFoundError:
+        return [Issue("error", set_dir, "Contents.json 이 없습니다")], 0, 0
+    except ValueError as e:
+        return [Issue("error", contents_path, f"Contents.json 을 파싱할 수 없습니다: {e}")], 0, 0
+    bytes_read = len(raw)
+    if not isinstance(contents, dict):
+        return [Issue("error", contents_path, "Contents.json 최상위 값이 객체가 아닙니다")], 0, bytes_read
+
+    if not set_dir.endswith(IMAGE_SET_EXTENSIONS):
+        return issues, 0, bytes_read
+
+    is_app_icon = set_dir.endswith(".appiconset")
+    images = contents.get("images", [])
+    if not isinstance(images, list):
+        issues.append(Issue("error", contents_path, "images 가 배열이 아닙니다"))
+        images = []
+    valid_images = []
+    for index, image in enumerate(images):
+        problem = entry_problem(image)
+        if problem:
+            issues.append(Issue("error", contents_path, f"images[{index}]: {problem}"))
+        else:
+            valid_images.append(image)
+    images = valid_images
+    on_disk = {name for name in os.listdir(set_dir) if name != "Contents.json" and not name.startswith(".")}
+
+    referenced = Counter(image["filename"] for image in images if image.get("filename"))
+    for filename, count in sorted(referenced.items()):
+        if count > 1:
+            issues.append(Issue("warning", contents_path, f"{filename} 을 {count}개 슬롯이 참조합니다"))
+    for filename in sorted(on_disk - set(referenced)):
+        issues.append(Issue("warning", os.path.join(set_dir, filename),
+                            "Contents.json 이 참조하지 않는 파일입니다 (unassigned)"))
+
+    slots = Counter(slot_key(image) for image in images)
+    for image in images:
+        if slots[slot_key(image)] > 1:
+            issues.append(Issue("error", contents_path, f"슬롯이 중복되었습니다: {slot_label(image)}"))
+            slots[slot_key(image)] = 0
+
+    checked = 0
+    points_by_variant = {}
+    for image in images:
+        filename = image.get("filename")
+        if not filename:
+            continue
+        path = os.path.join(set_dir, filename)
+        if filename not in on_disk:
+            issues.append(Issue("error", contents_path, f"{slot_label(image)}: 파일이 없습니다 ({filename})"))
+            continue
+        if not filename.lower().endswith(".png"):
+            if is_app_icon:
+                issues.append(Issue("error", path, "앱 아이콘은 PNG 여야 합니다"))
+            continue
+        try:
+            scale = parse_scale(image.get("scale"))
+            points = parse_size(image["size"]) if is_app_icon and image.get("size") else None
+        except ValueError as e:
+            issues.append(Issue("error", contents_path, f"{slot_label(image)}: {e}"))
+            continue
+
+        try:
+            header, size = read_png_header(path)
+        except (OSError, ValueError) as e:
+            issues.append(Issue("error", path, str(e)))
+            continue
+        checked += 1
+        bytes_read += size
+        width, height = header["width"], header["height"]
+
+        if points:
+            point_width, point_height = points
+            expected = (round(point_width * scale), round(point_height * scale))
+            if (width, height) != expected:
+                issues.append(Issue("error", path, f"{slot_label(image)}: {width}x{height}px, "
+                                                   f"{expected[0]}x{expected[1]}px 이어야 합니다"))
+        if is_marketing(image) and header["alpha"]:
+            issues.append(Issue("error", path, f"{slot_label(image)}: 마케팅 아이콘에 알파 채널이 있습니다 "
+                                               "(App Store 업로드 거부)"))
+
+        # 같은 변형(idiom/appearance)의 배율별 포인트 크기 비교용
+        variant = (image.get("idiom"), image.get("size"), json.dumps(image.get("appearances", []), sort_keys=True))
+        points_by_variant.setdefault(variant, []).append((width / scale, height / scale, image, path))
+
+    if not is_app_icon:
+        for variants in points_by_variant.values():
+            base_width, base_height, base_image, _ = variants[0]
+            for point_width, point_height, image, path in variants[1:]:
+                if abs(point_width - base_width) > 1 or abs(point_height - base_height) > 1:
+                    issues.append(Issue(
+                        "warning", path,
+                        f"@{image.get('scale')} 크기가 @{base_image.get('scale')} 와 맞지 않습니다 "
+                        f"({point_width:g}x{point_height:g}pt ≠ {base_width:g}x{base_height:g}pt)",
+                    ))
+
+    if is_app_icon and required_slots and not any(is_marketing(image) and image.get("idiom") == "universal"
+                                                  for image in images):
+        filled = {(image.get("idiom"), image.get("size"), image.get("scale"))
+                  for image in images if image.get("filename") and not image.get("appearances")}
+        for slot in required_slots:
+            if slot not in filled:
+                idiom, size, scale = slot
+                issues.append(Issue("error", contents_path, f"필수 아이콘 슬롯이 비어 있습니다: {idiom} {size} @{scale}"))
+
+    return issues, checked, bytes_read
+
+
+# MARK: - 카탈로그 / 프로젝트
+
+def find_catalogs(paths):
+    """
+    경로 목록에서 *.xcassets 디렉토리를 재귀적으로 수집 (정렬된 순서)
+    """
+    catalogs = []
+    for path in paths:
+        if path.endswith(".xcassets"):
+            catalogs.append(path)
+            continue
+        for root, dirs, _ in os.walk(path):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            catalogs.extend(os.path.join(root, name) for name in dirs if name.endswith(".xcassets"))
+            dirs[:] = [name for name in dirs if not name.endswith(".xcassets")]
+    return sorted(catalogs)
+
+
+def find_sets(catalog):
+    """
+    카탈로그 안의 Contents.json 을 가진 모든 디렉토리 (카탈로그 자신과 폴더 포함)
+    """
+    found = []
+    for root, dirs, files in os.walk(catalog):
+        dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+        if "Contents.json" in files or os.path.splitext(root)[1]:
+            found.append(root)
+    return found
+
+
+def app_icon_requirements(project_path):
+    """
+    project.pbxproj 에서 앱 아이콘 이름별로 지원 기기에 필요한 슬롯을 구함
+
+    빌드 설정 블록만 정규식으로 훑으므로 전체 파싱 없이 끝납니다.
+
+    Returns:
+        {아이콘 세트 이름: [(idiom, size, scale)]}
+    """
+    try:
+        with open(project_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except OSError:
+        return {}
+    requirements = {}
+    for block in re.findall(r"buildSettings = \{(.*?)\n\t*\};", text, re.DOTALL):
+        icon = re.search(r"ASSETCATALOG_COMPILER_APPICON_NAME = \"?([^\";]+)\"?;", block)
+        families = re.search(r"TARGETED_DEVICE_FAMILY = \"?([\d,]+)\"?;", block)
+        if not icon:
+            continue
+        slots = requirements.setdefault(icon.group(1), [MARKETING_SLOT])
+        for family in (families.group(1) if families else "1").split(","):
+            for slot in REQUIRED_ICON_SLOTS.get(family, []):
+                if slot not in slots:
+                    slots.append(slot)
+    return requirements
+
+
+# MARK: - 실행
+
+def display_path(path):
+    """
+    프로젝트 안이면 상대 경로, 밖이면 절대 경로
+    """
+    path = os.path.abspath(path)
+    if path.startswith(PROJECT_ROOT + os.sep):
+        return os.path.relpath(path, PROJECT_ROOT)
+    return path
+
+
+def run(args):
+    started = time.perf_counter()
+    with profiling.phase("scan"):
+        missing = [path for path in args.paths if not os.path.exists(path)]
+        if missing:
+            print(f"❌ 오류: 경로를 찾을 수 없습니다: {', '.join(missing)}")
+            return 2
+        catalogs = find_catalogs(args.paths or [DEFAULT_ROOT])
+        sets = [set_dir for catalog in catalogs for set_dir in find_sets(catalog)]
+        requirements = app_icon_requirements(args.project) if args.project else {}
+
+    with profiling.phase("check", sets=len(sets), jobs=args.jobs), ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(pool.map(
+            lambda set_dir: check_set(set_dir, requirements.get(
+                os.path.splitext(os.path.basename(set_dir))[0]) if set_dir.endswith(".appiconset") else None),
+            sets,
+        ))
+        profiling.count_read(sum(result[2] for result in results))
+    elapsed = time.perf_counter() - started
+
+    issues = [issue for result in results for issue in result[0]]
+    images = sum(result[1] for result in results)
+    errors = [issue for issue in issues if issue.level == "error"]
+    warnings = [issue for issue in issues if issue.level == "warning"]
+
+    for issue in issues:
+        if args.xcode:
+            # Xcode 빌드 단계 출력 형식 (이슈 내비게이터에 표시됨)
+            print(f"{os.path.abspath(issue.path)}: {issue.level}: {issue.message}")
+        else:
+            prefix = "❌" if issue.level == "error" else "⚠️ "
+            print(f"{prefix} {display_path(issue.path)}: {issue.message}")
+
+    if not args.quiet and not args.xcode:
+        status = "✅" if not errors else "❌"
+        print(f"{status} 카탈로그 {len(catalogs)}개, 세트 {len(sets)}개, PNG {images}개 검사 "
+              f"(오류 {len(errors)}, 경고 {len(warnings)}, {elapsed * 1000:.1f}ms)")
+
+    if errors or (args.strict and warnings):
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asset Catalog 사전 검증 (Contents.json ↔ 파일, PNG 헤더 크기/알파)")
+    parser.add_argument("paths", nargs="*", metavar="PATH",
+                        help="*.xcassets 또는 이를 포함하는 디렉토리 (기본: HoguMeter/)")
+    parser.add_argument("--project", default=PROJECT_PATH,
+                        help="지원 기기를 읽을 project.pbxproj (기본: HoguMeter.xcodeproj, 빈 값이면 필수 슬롯 검사 생략)")
+    parser.add_argument("--strict", action="store_true", help="경고도 실패로 처리 (종료 코드 1)")
+    parser.add_argument("--xcode", action="store_true", help="Xcode 빌드 단계용 '경로: error: 메시지' 형식으로 출력")
+    parser.add_argument("-j", "--jobs", type=int, default=min(32, (os.cpu_count() or 1) + 4),
+                        help="스레드 수 (기본: CPU 수 + 4)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="문제가 없으면 아무것도 출력하지 않음")
+    profiling.add_profile_argument(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args.profile, "validate-assets", args.profile_memory):
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,26 @@
 #!/usr/bin/env python3
 import os
 import glob
+import sys
 
-# Find all task markdown files (excluding EPIC.md)
-task_files = []
-for pattern in ['tasks/epic-*/task-*.md']:
-    task_files.extend(glob.glob(pattern))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts"))
+import profiling  # noqa: E402
 
-task_files.sort()
+TASK_PATTERNS = ['tasks/epic-*/task-*.md']
 
-print(f"Found {len(task_files)} task files to update:\n")
 
-development_guide_reference = """
+def main(patterns=TASK_PATTERNS):
+    # Find all task markdown files (excluding EPIC.md)
+    task_files = []
+    with profiling.phase("scan"):
+        for pattern in patterns:
+            task_files.extend(glob.glob(pattern))
+
+    task_files.sort()
+
+    print(f"Found {len(task_files)} task files to update:\n")
+
+    development_guide_reference = """
 ---
 
 ## 📘 개발 가이드
@@ -29,46 +38,52 @@ development_guide_reference = """
 - 배포 전 체크리스트
 """
 
-updated_count = 0
-skipped_count = 0
-
-for file_path in task_files:
-    print(f"Processing: {file_path}")
-
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Check if already has the reference
-        if 'DEVELOPMENT_GUIDE-FOR-AI.md' in content:
-            print(f"  ⏭️  Already updated, skipping...")
-            skipped_count += 1
-            continue
-
-        # Check if has "참고 자료" section
-        if '## 📎 참고 자료' in content:
-            # Insert before the existing 참고 자료 section
-            parts = content.split('## 📎 참고 자료')
-            updated_content = parts[0] + development_guide_reference + '\n## 📎 참고 자료' + parts[1]
-        else:
-            # Append at the end
-            # Remove trailing whitespace first
-            content = content.rstrip()
-            updated_content = content + '\n' + development_guide_reference + '\n'
-
-        # Write updated content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-
-        print(f"  ✅ Updated successfully")
-        updated_count += 1
-
-    except Exception as e:
-        print(f"  ❌ Error: {e}")
-
-print(f"\n" + "="*50)
-print(f"Summary:")
-print(f"  Updated: {updated_count}")
-print(f"  Skipped: {skipped_count}")
-print(f"  Total:   {len(task_files)}")
-print("="*50)
+    updated_count = 0
+    skipped_count = 0
+
+    for file_path in task_files:
+        print(f"Processing: {file_path}")
+
+        try:
+            with profiling.phase("read"), open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                profiling.count_read(f.tell())
+
+            # Check if already has the reference
+            if 'DEVELOPMENT_GUIDE-FOR-AI.md' in content:
+                print(f"  ⏭️  Already updated, skipping...")
+                skipped_count += 1
+                continue
+
+            # Check if has "참고 자료" section
+            if '## 📎 참고 자료' in content:
+                # Insert before the existing 참고 자료 section
+                parts = content.split('## 📎 참고 자료')
+                updated_content = parts[0] + development_guide_reference + '\n## 📎 참고 자료' + parts[1]
+            else:
+                # Append at the end
+                # Remove trailing whitespace first
+                content = content.rstrip()
+                updated_content = content + '\n' + development_guide_reference + '\n'
+
+            # Write updated content
+            with profiling.phase("write"), open(file_path, 'w', encoding='utf-8') as f:
+                f.write(updated_content)
+                profiling.count_written(f.tell())
+
+            print(f"  ✅ Updated successfully")
+            updated_count += 1
+
+        except Exception as e:
+            print(f"  ❌ Error: {e}")
+
+    print(f"\n" + "="*50)
+    print(f"Summary:")
+    print(f"  Updated: {updated_count}")
+    print(f"  Skipped: {skipped_count}")
+    print(f"  Total:   {len(task_files)}")
+    print("="*50)
+
+
+if __name__ == "__main__":
+    main()